@@ -1,18 +1,22 @@
 from __future__ import annotations
 
 import gzip
+import heapq
+import itertools
 import json
 import logging
 import os
 import select
 import sys
+import threading
 import time
 import uuid
+from bisect import bisect_left
 from collections import deque
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Deque, Dict, Iterable, Iterator, Optional, Tuple
+from typing import IO, Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
 try:
     import fcntl
@@ -42,6 +46,25 @@ class EventBus:
         self.reports_dir.mkdir(parents=True, exist_ok=True)
         self._events_lock = root / ".events.lock"
         self._audit_lock = root / ".audit.lock"
+        # Byte offset of each complete line in events.jsonl, so readers can
+        # seek straight to a cursor.  Keyed on the file's (dev, inode): a
+        # compaction rewrite swaps the inode and drops the index.
+        self._event_offsets: List[int] = []
+        self._event_index_key: Optional[Tuple[int, int]] = None
+        self._event_index_end = 0
+        self._event_index_lock = threading.Lock()
+        # Audience index over the same lines: broadcast events (no audience or
+        # "*"), per-agent targeted lines, and any non-list audiences that need
+        # the literal membership check.
+        self._broadcast_lines: List[int] = []
+        self._targeted_lines: Dict[str, List[int]] = {}
+        self._irregular_lines: List[Tuple[int, Any]] = []
+        self._last_event_line = -1
+        # Per-thread emit buffer for deferred_emits(): .depth and .lines.
+        self._emit_buffer = threading.local()
+        # Notified after every append, so in-process long-pollers on the
+        # sleep fallback wake as soon as another thread emits.
+        self._events_appended = threading.Condition()
         if fcntl is None:
             print(
                 "WARNING: fcntl unavailable; file locking disabled. Multi-process safety is degraded.",
@@ -138,7 +161,10 @@ class EventBus:
                     ino.close()
 
         # 3. Fallback: sleep for min(remaining, _POLL_FALLBACK_SLEEP) and assume possible change.
-        time.sleep(min(timeout_sec, self._POLL_FALLBACK_SLEEP))
+        # Appends from this process cut the sleep short; other writers are
+        # still only seen on the next poll.
+        with self._events_appended:
+            self._events_appended.wait(min(timeout_sec, self._POLL_FALLBACK_SLEEP))
         return True
 
     def emit(self, event_type: str, payload: Dict[str, Any], source: str) -> Dict[str, Any]:
@@ -149,15 +175,45 @@ class EventBus:
             "source": source,
             "payload": payload,
         }
+        line = json.dumps(event) + "\n"
+        if getattr(self._emit_buffer, "depth", 0):
+            self._emit_buffer.lines.append(line)
+        else:
+            self._append_event_lines([line])
+        return event
+
+    @contextmanager
+    def deferred_emits(self) -> Iterator[None]:
+        """Buffer this thread's emit() calls and append them in one write on exit.
+
+        Nested blocks join the outermost one.  Buffered events are written
+        even if the block raises, as the individual emits would have been.
+        """
+        buf = self._emit_buffer
+        depth = getattr(buf, "depth", 0)
+        if depth == 0:
+            buf.lines = []
+        buf.depth = depth + 1
+        try:
+            yield
+        finally:
+            buf.depth = depth
+            if depth == 0:
+                lines, buf.lines = buf.lines, []
+                if lines:
+                    self._append_event_lines(lines)
+
+    def _append_event_lines(self, lines: List[str]) -> None:
         with self._file_lock(self._events_lock):
             with self.events_path.open("a", encoding="utf-8") as fh:
-                fh.write(json.dumps(event) + "\n")
+                fh.write("".join(lines))
                 fh.flush()
                 try:
                     os.fsync(fh.fileno())
                 except OSError as e:
                     logger.warning("event fsync failed: %s", e)
-        return event
+        with self._events_appended:
+            self._events_appended.notify_all()
 
     def iter_events(self) -> Iterable[Dict[str, Any]]:
         if not self.events_path.exists():
@@ -192,22 +248,119 @@ class EventBus:
                 return events
             self._wait_for_file_change(self.events_path, remaining)
 
-    def _count_lines(self, path: Path, lock_path: Path) -> int:
-        if not path.exists():
+    def _sync_event_index(self, fh: IO[bytes]) -> int:
+        """Index lines appended since the last call; return the file size.
+
+        Caller holds the events lock (shared is enough) and _event_index_lock.
+        """
+        st = os.fstat(fh.fileno())
+        key = (st.st_dev, st.st_ino)
+        if key != self._event_index_key or st.st_size < self._event_index_end:
+            self._event_index_key = key
+            self._event_offsets = []
+            self._event_index_end = 0
+            self._broadcast_lines = []
+            self._targeted_lines = {}
+            self._irregular_lines = []
+            self._last_event_line = -1
+        if st.st_size > self._event_index_end:
+            pos = self._event_index_end
+            fh.seek(pos)
+            for raw in fh:
+                if not raw.endswith(b"\n"):
+                    break
+                self._index_event_line(len(self._event_offsets), raw)
+                self._event_offsets.append(pos)
+                pos += len(raw)
+            self._event_index_end = pos
+        return st.st_size
+
+    def _index_event_line(self, line_no: int, raw: bytes) -> None:
+        line = raw.strip()
+        if not line:
+            return
+        try:
+            event = json.loads(line)
+        except Exception:
+            return
+        self._last_event_line = line_no
+        payload = event.get("payload") if isinstance(event, dict) else None
+        audience = payload.get("audience") if isinstance(payload, dict) else None
+        if not audience:
+            self._broadcast_lines.append(line_no)
+        elif not isinstance(audience, list):
+            self._irregular_lines.append((line_no, audience))
+        elif "*" in audience:
+            self._broadcast_lines.append(line_no)
+        else:
+            for agent in set(audience):
+                if isinstance(agent, str):
+                    self._targeted_lines.setdefault(agent, []).append(line_no)
+
+    def events_for_agent(
+        self, agent: str, start: int = 0, limit: int = 50
+    ) -> Tuple[List[Tuple[int, Dict[str, Any]]], int]:
+        """Return up to *limit* events at or after *start* visible to *agent*.
+
+        Uses the audience index, so only delivered events are read and parsed.
+        The second item is the cursor to resume from: just past the last
+        delivered event when *limit* is reached, otherwise just past the last
+        event in the log.
+        """
+        start = max(0, int(start))
+        limit = max(1, int(limit))
+        if not self.events_path.exists():
+            return [], start
+        with self._file_lock(self._events_lock, exclusive=False):
+            with self.events_path.open("rb") as fh:
+                with self._event_index_lock:
+                    self._sync_event_index(fh)
+                    broadcast = self._broadcast_lines
+                    targeted = self._targeted_lines.get(agent, [])
+                    sources = [
+                        itertools.islice(broadcast, bisect_left(broadcast, start), None),
+                        itertools.islice(targeted, bisect_left(targeted, start), None),
+                        (
+                            line_no
+                            for line_no, audience in self._irregular_lines
+                            if line_no >= start and (agent in audience or "*" in audience)
+                        ),
+                    ]
+                    lines = list(itertools.islice(heapq.merge(*sources), limit))
+                    offsets = [self._event_offsets[line_no] for line_no in lines]
+                    last_event_line = self._last_event_line
+                events: List[Tuple[int, Dict[str, Any]]] = []
+                for line_no, offset in zip(lines, offsets):
+                    fh.seek(offset)
+                    events.append((line_no, json.loads(fh.readline())))
+        if len(events) >= limit:
+            return events, events[-1][0] + 1
+        return events, max(start, last_event_line + 1)
+
+    def events_generation(self) -> Optional[Tuple[int, int]]:
+        """Identity of the current events.jsonl; changes when compaction rewrites it."""
+        try:
+            st = self.events_path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_dev, st.st_ino)
+
+    def event_count(self) -> int:
+        """Number of lines in events.jsonl, counting only newly appended bytes."""
+        if not self.events_path.exists():
             return 0
-        count = 0
-        with self._file_lock(lock_path, exclusive=False):
-            with path.open("r", encoding="utf-8") as fh:
-                for _ in fh:
-                    count += 1
-        return count
+        with self._file_lock(self._events_lock, exclusive=False):
+            with self.events_path.open("rb") as fh, self._event_index_lock:
+                size = self._sync_event_index(fh)
+                partial = 1 if size > self._event_index_end else 0
+                return len(self._event_offsets) + partial
 
     def wait_for_event_index(self, start: int, timeout_ms: int = 0) -> None:
         if timeout_ms <= 0:
             return
         deadline = time.time() + (timeout_ms / 1000.0)
         while True:
-            if self._count_lines(self.events_path, self._events_lock) > max(0, int(start)):
+            if self.event_count() > max(0, int(start)):
                 return
             remaining = deadline - time.time()
             if remaining <= 0:
@@ -218,14 +371,20 @@ class EventBus:
         if not self.events_path.exists():
             return iter(())
 
+        start = max(0, int(start))
+
         def _gen() -> Iterator[Tuple[int, Dict[str, Any]]]:
-            idx = 0
+            idx = start
             with self._file_lock(self._events_lock, exclusive=False):
-                with self.events_path.open("r", encoding="utf-8") as fh:
+                with self.events_path.open("rb") as fh:
+                    with self._event_index_lock:
+                        self._sync_event_index(fh)
+                        offsets = self._event_offsets
+                        if start > len(offsets):
+                            return
+                        # Seek past the already-consumed prefix instead of re-reading it.
+                        fh.seek(offsets[start] if start < len(offsets) else self._event_index_end)
                     for raw in fh:
-                        if idx < start:
-                            idx += 1
-                            continue
                         line = raw.strip()
                         if not line:
                             idx += 1
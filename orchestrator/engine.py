@@ -6,13 +6,15 @@ import logging
 import os
 import re
 import sys
+import threading
 import time
 import uuid
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 
 logger = logging.getLogger("orchestrator.engine")
 
@@ -61,6 +63,80 @@ class _LazyCopyList(list):
             yield list.__getitem__(self, i)
 
 
+class _LazyCopyDict(dict):
+    """Dict counterpart of :class:`_LazyCopyList`.
+
+    Values are deep-copied the first time they are read, so a mutating
+    caller that only touches a few entries (e.g. one agent in agents.json)
+    does not pay for copying the rest.  Values assigned by the caller are
+    already private and are never copied.
+    """
+
+    __slots__ = ("_copied",)
+
+    def __init__(self, original: dict) -> None:  # noqa: D401
+        super().__init__(original)
+        self._copied: set = set()
+
+    def _ensure_copy(self, key: Any) -> None:
+        if key not in self._copied and dict.__contains__(self, key):
+            self._copied.add(key)
+            dict.__setitem__(self, key, copy.deepcopy(dict.__getitem__(self, key)))
+
+    def __getitem__(self, key):  # type: ignore[override]
+        self._ensure_copy(key)
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key, value) -> None:  # type: ignore[override]
+        self._copied.add(key)
+        dict.__setitem__(self, key, value)
+
+    def __iter__(self):  # type: ignore[override]
+        # Overriding __iter__ keeps dict(x) / {**x} off CPython's raw-value
+        # fast path, so they go through __getitem__ and get copies.
+        return dict.__iter__(self)
+
+    def get(self, key, default=None):  # type: ignore[override]
+        return self[key] if dict.__contains__(self, key) else default
+
+    def values(self):  # type: ignore[override]
+        return [self[k] for k in dict.keys(self)]
+
+    def items(self):  # type: ignore[override]
+        return [(k, self[k]) for k in dict.keys(self)]
+
+    def pop(self, key, *default):  # type: ignore[override]
+        self._ensure_copy(key)
+        return dict.pop(self, key, *default)
+
+    def setdefault(self, key, default=None):  # type: ignore[override]
+        if dict.__contains__(self, key):
+            return self[key]
+        self[key] = default
+        return default
+
+    def update(self, *args, **kwargs) -> None:  # type: ignore[override]
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def copy(self) -> dict:  # type: ignore[override]
+        return {k: self[k] for k in dict.keys(self)}
+
+
+@dataclass(slots=True)
+class _TaskIndex:
+    """Owner/status indexes over one cached tasks.json list.
+
+    Positions are ascending indexes into ``source``, so they also address a
+    lazy copy taken from the same read.
+    """
+
+    source: Any
+    by_owner: Dict[Any, List[Dict[str, Any]]]
+    owner_positions: Dict[Any, List[int]]
+    status_positions: Dict[Any, List[int]]
+
+
 from orchestrator import pr_stack as _pr_stack  # noqa: E402
 from orchestrator.bus import EventBus  # noqa: E402
 from orchestrator.github_ci import (  # noqa: E402
@@ -80,6 +156,11 @@ try:
 except Exception:  # pragma: no cover
     fcntl = None
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
 _META_BLOCKER_PATTERNS = (
     "watchdog",
@@ -94,6 +175,49 @@ _META_BLOCKER_PATTERNS = (
 
 TASK_TYPES = {"standard", "comprehend_project"}
 
+# Task statuses that still represent outstanding work for their owner.
+_OPEN_TASK_STATUSES = frozenset({"assigned", "in_progress", "reported", "bug_open", "blocked"})
+
+# Statuses reported per agent in list_agents' task_counts, in output order.
+_AGENT_TASK_COUNT_STATUSES = ("assigned", "in_progress", "blocked", "done", "superseded", "archived")
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+# Constant part of the agent.stale_reconnect_required payload.
+_STALE_NOTICE_TEMPLATE: Mapping[str, str] = MappingProxyType(
+    {
+        "action": "rerun handshake",
+        "team_member_action": "run 'connect to leader'",
+        "manager_action": "run orchestrator_connect_team_members",
+    }
+)
+
+# State-log compaction thresholds: fold an append-only log (presence, event
+# cursors) into its JSON snapshot once the log exceeds this size, or once the
+# snapshot itself is older than this many seconds. Readers that open
+# agents.json or event_cursors.json directly (headless_status.sh,
+# dashboard_tui.py) can therefore see last_seen and cursor values up to
+# _STATE_LOG_MAX_AGE_SECONDS old unless they also fold in the log.
+_STATE_LOG_MAX_BYTES = 256 * 1024
+_STATE_LOG_MAX_AGE_SECONDS = 60
+
+# Low-cardinality string fields interned on load so the many status/owner
+# comparisons and index lookups hit shared str objects.
+_INTERNED_TASK_FIELDS = ("status", "owner", "workstream")
+_INTERNED_AGENT_FIELDS = ("status",)
+
+# Metadata fields an agent must report before its identity counts as complete.
+_IDENTITY_REQUIRED_FIELDS = (
+    "client",
+    "model",
+    "cwd",
+    "permissions_mode",
+    "sandbox_mode",
+    "session_id",
+    "connection_id",
+    "server_version",
+    "verification_source",
+)
+
 
 @dataclass
 class Orchestrator:
@@ -106,9 +230,37 @@ class Orchestrator:
         # In-memory per-agent cooldown tracker for empty claim_next_task calls.
         # Maps agent name -> (monotonic_ts, tasks_file_mtime) at last empty claim.
         self._claim_cooldowns: Dict[str, tuple] = {}
+        # last_seen values written by this process.
+        # Maps agent name -> (last_seen_iso, epoch_seconds).
+        self._last_seen_ts: Dict[str, tuple] = {}
         # In-memory mtime-based JSON file cache.
         # Maps str(path) -> (mtime_ns: int, parsed_data: Any).
         self._json_cache: Dict[str, tuple] = {}
+        # Indexes over cached list files, keyed on the cached list object:
+        # str(path) -> (list, {id: position}); tasks owner/status indexes.
+        self._id_index: Dict[str, tuple] = {}
+        self._task_index_cache: Optional[_TaskIndex] = None
+        # Encoded tasks.json items: id(task) -> (task, bytes). Only holds
+        # objects owned by the read cache, never ones handed to callers.
+        self._task_fragments: Dict[int, Tuple[Any, bytes]] = {}
+        # (tmp path, detached task list, fragments) staged for publish, and
+        # (mtime_ns, size, task list) last published, which _read_json adopts
+        # instead of reparsing tasks.json when the file is still ours.
+        self._staged_tasks: Optional[tuple] = None
+        self._written_tasks: Optional[tuple] = None
+        # agent -> (number of event_acks.json ids folded in, set(event_ids)).
+        self._ack_sets: Dict[str, Tuple[int, Set[str]]] = {}
+        self._state_lock_held: bool = False
+        # In-process guard around the flock; lets batch() re-enter
+        # _state_lock from the thread that already holds it.
+        self._state_thread_lock = threading.Lock()
+        self._state_lock_owner: Optional[int] = None
+        # Writes deferred by batch(): str(path) -> (path, value). Only the
+        # thread that opened the batch sees or flushes them.
+        self._batch_writes: Dict[str, tuple] = {}
+        self._batch_depth = 0
+        # One _now() timestamp shared by every mutation in the open batch.
+        self._batch_now: Optional[str] = None
         self._tasks_dirty: bool = False
         self._current_tasks: Optional[list] = None
         self.state_dir = self.root / "state"
@@ -129,6 +281,23 @@ class Orchestrator:
         self.cursors_path = self.state_dir / "event_cursors.json"
         self.acks_path = self.state_dir / "event_acks.json"
         self.agents_path = self.state_dir / "agents.json"
+        # Append-only last_seen records folded into agents.json on compaction.
+        self.agent_presence_log_path = self.state_dir / "agents.presence.jsonl"
+        # (agents.json dict, presence dict, merged view) from the last _read_agents.
+        self._agents_overlay_cache: Optional[tuple] = None
+        # (file stamps, read-only merged agents) published by the last agents
+        # write; see _agents_snapshot.
+        self._agents_published: Optional[Tuple[tuple, Mapping[str, Any]]] = None
+        # Append-only cursor advances folded into event_cursors.json on compaction.
+        self.event_cursor_log_path = self.state_dir / "event_cursors.log.jsonl"
+        self._cursors_overlay_cache: Optional[tuple] = None
+        # (events.jsonl generation, next offset, names) for discover_agents.
+        self._event_names_cache: Optional[Tuple[Any, int, Set[str]]] = None
+        # Snapshot file -> the append-only log that a full rewrite supersedes.
+        self._state_logs: Dict[Path, Path] = {
+            self.agents_path: self.agent_presence_log_path,
+            self.cursors_path: self.event_cursor_log_path,
+        }
         self.agent_instances_path = self.state_dir / "agent_instances.json"
         self.stale_notices_path = self.state_dir / "stale_notices.json"
         self.claim_overrides_path = self.state_dir / "claim_overrides.json"
@@ -157,16 +326,70 @@ class Orchestrator:
 
     @contextmanager
     def _state_lock(self) -> Any:
+        if self._state_lock_owner == threading.get_ident():
+            # Already held by this thread (inside batch()).
+            yield
+            return
         self.state_dir.mkdir(parents=True, exist_ok=True)
-        with self.state_lock_path.open("a+", encoding="utf-8") as fh:
+        with self._state_thread_lock, self.state_lock_path.open("a+", encoding="utf-8") as fh:
             if fcntl is not None:
                 fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            self._state_lock_held = True
+            self._state_lock_owner = threading.get_ident()
             try:
                 yield
             finally:
+                self._state_lock_owner = None
+                self._state_lock_held = False
                 if fcntl is not None:
                     fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
 
+    @contextmanager
+    def batch(self) -> Any:
+        """Group several mutations into one locked section with one write per file.
+
+        Inside the block, ``_write_json`` only records the latest value per
+        path (reads in the same thread see it), and each dirty file is
+        written once when the outermost batch exits.  Mutations in the block
+        share one ``_now()`` timestamp, and events they emit are appended to
+        the bus in one write after the state files land.  Pending writes are
+        flushed even if the block raises, matching what the individual calls
+        would already have persisted.
+        """
+        with self.bus.deferred_emits(), self._state_lock():
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._batch_now = None
+                    self._flush_batch_writes()
+
+    def _in_batch(self) -> bool:
+        return self._batch_depth > 0 and self._state_lock_owner == threading.get_ident()
+
+    def _flush_batch_writes(self) -> None:
+        for snapshot_path in self._state_logs:
+            if str(snapshot_path) in self._batch_writes:
+                # Fold in log records appended after the last snapshot write.
+                self._batch_writes[str(snapshot_path)] = (snapshot_path, self._read_state_snapshot(snapshot_path))
+        pending = list(self._batch_writes.values())
+        self._batch_writes.clear()
+        # Stage every file first, then publish the renames back to back so
+        # readers see the batch land together.
+        staged = [(path, self._stage_json(path, value)) for path, value in pending]
+        for path, tmp in staged:
+            self._publish_json(path, tmp)
+
+    def write_tasks_batch(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create several tasks with a single tasks.json rewrite.
+
+        Each item holds ``create_task`` keyword arguments.
+        """
+        with self.batch():
+            return [self.create_task(**spec) for spec in tasks]
+
     def bootstrap(self) -> None:
         if not self.tasks_path.exists():
             self.tasks_path.write_text("[]\n", encoding="utf-8")
@@ -264,28 +487,22 @@ class Orchestrator:
 
         connected: List[str] = []
         while time.time() < deadline:
-            agents = self.list_agents(active_only=False, stale_after_seconds=stale_after)
-            active = {
-                item.get("agent")
-                for item in agents
-                if (
-                    item.get("agent") in requested
-                    and item.get("status") == "active"
-                    and bool(item.get("verified"))
-                    and (bool(item.get("same_project")) or self._allow_cross_project_agents())
-                )
-            }
-            connected = sorted(active)
+            # Take the event count before checking, so an event that lands
+            # between the check and the wait ends the wait at once.
+            seen_events = self.bus.event_count()
+            connected = self._connected_team_members(requested, stale_after_seconds=stale_after)
             if len(connected) == len(requested):
                 break
-            time.sleep(max(1, int(poll_interval_seconds)))
+            # register_agent/heartbeat emit bus events, so wake on the next
+            # event; the poll interval still caps the wait for silent
+            # presence refreshes.
+            remaining = deadline - time.time()
+            wait_seconds = min(remaining, max(1, int(poll_interval_seconds)))
+            self.bus.wait_for_event_index(start=seen_events, timeout_ms=int(wait_seconds * 1000))
 
         missing = [team_member for team_member in requested if team_member not in set(connected)]
         status = "connected" if not missing else "timeout"
-        diagnostics = {
-            team_member: self._team_member_connect_diagnostic(team_member=team_member, stale_after_seconds=stale_after)
-            for team_member in requested
-        }
+        diagnostics = self._diagnose_all(stale_after_seconds=stale_after, team_members=requested)
 
         self.publish_event(
             event_type="manager.connect_team_members.result",
@@ -340,7 +557,7 @@ class Orchestrator:
         with self._state_lock():
             tasks = self._read_json(self.tasks_path, make_copy=True)
             if normalized_parent:
-                parent = next((t for t in tasks if t["id"] == normalized_parent), None)
+                parent = self._find_by_id(self.tasks_path, tasks, normalized_parent)
                 if parent is None:
                     raise ValueError(f"Parent task not found: {normalized_parent}")
             task_id = f"TASK-{uuid.uuid4().hex[:8]}"
@@ -358,6 +575,7 @@ class Orchestrator:
                 echoed["dedupe_reason"] = "matching open task already exists"
                 return echoed
 
+            created_at = self._now()
             task = {
                 "id": task_id,
                 "title": title,
@@ -373,9 +591,9 @@ class Orchestrator:
                 "status": "assigned",
                 "acceptance_criteria": acceptance_criteria,
                 "delivery_profile": delivery_profile,
-                "created_at": self._now(),
-                "updated_at": self._now(),
-                "assigned_at": self._now(),
+                "created_at": created_at,
+                "updated_at": created_at,
+                "assigned_at": created_at,
             }
             tasks.append(task)
             self._write_tasks_json(tasks)
@@ -442,7 +660,7 @@ class Orchestrator:
         """
         with self._state_lock():
             bugs = self._read_json_list(self.bugs_path)
-            bug = next((b for b in bugs if b["id"] == bug_id), None)
+            bug = self._find_by_id(self.bugs_path, bugs, bug_id)
             if bug is None:
                 raise ValueError(f"Bug not found: {bug_id}")
 
@@ -451,11 +669,10 @@ class Orchestrator:
     def dedupe_open_tasks(self, source: str) -> Dict[str, Any]:
         with self._state_lock():
             tasks = self._read_json(self.tasks_path, make_copy=True)
-            open_statuses = {"assigned", "in_progress", "reported", "bug_open", "blocked"}
             groups: Dict[str, List[Dict[str, Any]]] = {}
 
             for task in tasks:
-                if task.get("status") not in open_statuses:
+                if task.get("status") not in _OPEN_TASK_STATUSES:
                     continue
                 key = self._task_fingerprint(
                     title=str(task.get("title", "")),
@@ -496,9 +713,15 @@ class Orchestrator:
         team_id: Optional[str] = None,
         lane: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        tasks = self._read_json(self.tasks_path)
-        if not isinstance(tasks, list):
-            return []
+        """Tasks matching every given filter, as a new list.
+
+        The task dicts are the read cache's own and must be treated as
+        read-only (see _tasks_view).
+        """
+        tasks = self._tasks_view()
+        if not (status or owner or project_name or project_root or tags or team_id or lane == "wingman"):
+            # Unfiltered: a fresh list over the cached tasks, no per-task checks.
+            return [task for task in tasks if isinstance(task, dict)]
 
         normalized_tags = self._normalize_task_tags(tags=tags) if tags else []
         normalized_project_name = str(project_name or "").strip()
@@ -536,8 +759,21 @@ class Orchestrator:
             filtered.append(task)
         return filtered
 
+    def _tasks_view(self) -> List[Dict[str, Any]]:
+        """The cached tasks list itself, for read-only internal scans.
+
+        Nothing is copied, so callers must not mutate it or its task dicts;
+        list_tasks() is the public entry point and returns a fresh list of
+        the same dicts. Writes reuse each cached task's last-written bytes
+        (see _encode_tasks), so an in-place edit would never reach disk.
+        Take a make_copy=True read to change tasks.
+        """
+        tasks = self._read_json(self.tasks_path)
+        return tasks if isinstance(tasks, list) else []
+
     def list_tasks_for_owner(self, owner: str, status: Optional[str] = None) -> List[Dict[str, Any]]:
-        tasks = [task for task in self.list_tasks() if task.get("owner") == owner]
+        """An owner's tasks as a new list of read-only cached dicts (see _tasks_view)."""
+        tasks = list(self._tasks_by_owner().get(owner, ()))
         if status:
             tasks = [task for task in tasks if task.get("status") == status]
         return tasks
@@ -620,7 +856,9 @@ class Orchestrator:
                 if isinstance(corr_raw, str) and corr_raw.strip():
                     override_correlation_id = corr_raw.strip()
             if override_task_id:
-                forced = next((t for t in tasks if t.get("id") == override_task_id and t.get("owner") == owner), None)
+                forced = self._find_by_id(self.tasks_path, tasks, override_task_id)
+                if forced is not None and forced.get("owner") != owner:
+                    forced = None
                 if forced and forced.get("status") in {"assigned", "bug_open"}:
                     if normalized_team_id and str(forced.get("team_id", "")).strip().lower() != normalized_team_id:
                         forced = None
@@ -667,7 +905,10 @@ class Orchestrator:
                 del overrides[owner]
                 self._write_json(self.claim_overrides_path, overrides)
 
-            for task in tasks:
+            # Walk only this owner's tasks, in file order; indexing the lazy
+            # copy by position copies just the tasks we look at.
+            for pos in self._task_indexes().owner_positions.get(owner, ()):
+                task = tasks[pos]
                 if task.get("owner") != owner:
                     continue
                 if task.get("status") not in {"assigned", "bug_open"}:
@@ -715,7 +956,7 @@ class Orchestrator:
             raise ValueError(f"leader_mismatch: source={source}, current_leader={manager}")
         with self._state_lock():
             tasks = self._read_json(self.tasks_path)
-            task = next((t for t in tasks if t.get("id") == task_id), None)
+            task = self._find_by_id(self.tasks_path, tasks, task_id)
             if task is None:
                 raise ValueError(f"Task not found: {task_id}")
             if task.get("owner") != agent:
@@ -787,13 +1028,13 @@ class Orchestrator:
                 if age < threshold:
                     continue
                 # Suppress noop if override was already consumed or task advanced.
-                task = next((t for t in tasks if t.get("id") == task_id), None)
+                task = self._find_by_id(self.tasks_path, tasks, task_id)
                 if task and task.get("status") not in {"assigned", "bug_open"}:
-                    entry["noop_suppressed_at"] = self._now()
+                    entry["noop_suppressed_at"] = now_dt.isoformat()
                     entry["noop_suppressed_reason"] = f"task_status={task.get('status')}"
                     changed = True
                     continue
-                entry["noop_emitted_at"] = self._now()
+                entry["noop_emitted_at"] = now_dt.isoformat()
                 entry["noop_reason"] = "claim_override_timeout"
                 changed = True
                 emitted.append(
@@ -836,7 +1077,7 @@ class Orchestrator:
             raise ValueError("superseded/archived transitions require manager authority")
         with self._state_lock():
             tasks = self._read_json(self.tasks_path, make_copy=True)
-            task = next((t for t in tasks if t["id"] == task_id), None)
+            task = self._find_by_id(self.tasks_path, tasks, task_id)
             if task is None:
                 raise ValueError(f"Task not found: {task_id}")
             owner = str(task.get("owner", ""))
@@ -881,7 +1122,7 @@ class Orchestrator:
         with self._state_lock():
             self._refresh_agent_presence_unlocked(str(report["agent"]))
             tasks = self._read_json(self.tasks_path, make_copy=True)
-            task = next((item for item in tasks if item["id"] == task_id), None)
+            task = self._find_by_id(self.tasks_path, tasks, task_id)
             if task is None:
                 raise ValueError(f"Task not found: {task_id}")
             agent_scope = self._agent_project_scope_unlocked(str(report["agent"]))
@@ -917,19 +1158,20 @@ class Orchestrator:
             # --- End Report Deduplication ---
 
             # Pass the current mocked time as mtime for consistent testing of cleanup logic
-            report_mtime = datetime.fromisoformat(self._now()).timestamp()
+            now = self._now()
+            report_mtime = datetime.fromisoformat(now).timestamp()
             self.bus.write_report(task_id=task_id, report=report, mtime=report_mtime)
 
             review_gate = report.get("review_gate")
             if isinstance(review_gate, dict):
                 task["review_gate"] = self._normalize_review_gate(review_gate)
-                task["review_gate_updated_at"] = self._now()
+                task["review_gate_updated_at"] = now
             elif not isinstance(task.get("review_gate"), dict):
                 # Auto-set review gate from policy if not explicitly provided
                 policy_default = str(self.policy.triggers.get("review_gate_default", "")).strip().lower()
                 if policy_default == "required":
                     task["review_gate"] = {"required": True, "status": "pending", "reviewer_agent": "ccm"}
-                    task["review_gate_updated_at"] = self._now()
+                    task["review_gate_updated_at"] = now
                     logger.info("review_gate.auto_set task=%s policy=required reviewer=ccm", task_id)
 
             self_review = report.get("self_review")
@@ -956,10 +1198,10 @@ class Orchestrator:
                                 )
                                 s_round["bug_id"] = bug.get("id")
                 task["self_review"] = self_review
-                task["self_review_updated_at"] = self._now()
+                task["self_review_updated_at"] = now
 
             task["status"] = "reported"
-            task["updated_at"] = self._now()
+            task["updated_at"] = now
             task["reported_at"] = task["updated_at"]
             task["lease"] = None
             self._write_tasks_json(tasks)
@@ -979,7 +1221,7 @@ class Orchestrator:
         with self._state_lock():
             self._refresh_agent_presence_unlocked(agent)
             tasks = self._read_json(self.tasks_path, make_copy=True)
-            task = next((item for item in tasks if item.get("id") == task_id), None)
+            task = self._find_by_id(self.tasks_path, tasks, task_id)
             if task is None:
                 raise ValueError(f"Task not found: {task_id}")
             agent_scope = self._agent_project_scope_unlocked(agent)
@@ -1118,7 +1360,7 @@ class Orchestrator:
                             continue
                         entry["status"] = "submitted"
                         entry["updated_at"] = self._now()
-                        entry["submitted_at"] = self._now()
+                        entry["submitted_at"] = entry["updated_at"]
                         entry["last_error"] = ""
                         break
                     self._write_json(self.report_retry_queue_path, queue)
@@ -1191,29 +1433,33 @@ class Orchestrator:
         report_retention_days = self.policy.triggers.get("report_retention_days", 30)
         self._cleanup_old_reports(max_age_seconds=report_retention_days * 24 * 60 * 60)
 
-        with self._state_lock():
+        with self.batch():
             tasks = self._read_json(self.tasks_path, make_copy=True)
-            agents = self._read_json(self.agents_path)
+            agents = self._read_agents()
             if not isinstance(agents, dict):
                 agents = {}
             now = datetime.now(timezone.utc)
             requeued: List[Dict[str, Any]] = []
             changed = False
 
-            for task in tasks:
-                if task.get("status") != "in_progress":
+            # Owner age per distinct owner, not per task; None = not stale.
+            stale_ages: Dict[Any, Optional[int]] = {}
+            for pos in self._task_indexes().status_positions.get("in_progress", ()):
+                # Check on the raw entry so only requeued tasks get copied.
+                raw_task = list.__getitem__(tasks, pos)
+                if raw_task.get("status") != "in_progress":
                     continue
 
-                owner = task.get("owner")
-                agent = agents.get(owner, {}) if isinstance(owner, str) else {}
-                last_seen_raw = agent.get("last_seen")
-                if not last_seen_raw:
-                    continue
-
-                age = self._age_seconds(last_seen_raw, now=now)
-                if age is None or age <= stale_after_seconds:
+                owner = raw_task.get("owner")
+                if owner not in stale_ages:
+                    agent = agents.get(owner, {}) if isinstance(owner, str) else {}
+                    age = self._last_seen_age_seconds(agent, now=now) if agent.get("last_seen") else None
+                    stale_ages[owner] = age if age is not None and age > stale_after_seconds else None
+                age = stale_ages[owner]
+                if age is None:
                     continue
 
+                task = tasks[pos]
                 task["status"] = "assigned"
                 task["updated_at"] = self._now()
                 changed = True
@@ -1244,7 +1490,7 @@ class Orchestrator:
             # Exclude agents whose heartbeat metadata signals budget_exhausted or
             # capacity_degraded so they are not considered for reassignment.
             _DEGRADED_STATUSES = {"budget_exhausted", "capacity_degraded"}
-            agents_data = self._read_json(self.agents_path)
+            agents_data = self._read_agents()
             if not isinstance(agents_data, dict):
                 agents_data = {}
             exhausted_agents: List[str] = []
@@ -1277,6 +1523,11 @@ class Orchestrator:
             reassigned: List[Dict[str, Any]] = []
             changed = False
             now = datetime.now(timezone.utc)
+            now_iso = now.isoformat()
+            owner_diagnostics = self._diagnose_all(
+                stale_after_seconds=threshold,
+                team_members={str(t.get("owner", "")) for t in tasks if t.get("status") in task_statuses} - {""},
+            )
 
             for task in tasks:
                 if task.get("status") not in task_statuses:
@@ -1285,7 +1536,7 @@ class Orchestrator:
                 if not owner:
                     continue
 
-                owner_diag = self._team_member_connect_diagnostic(team_member=owner, stale_after_seconds=threshold)
+                owner_diag = owner_diagnostics[owner]
                 owner_active = bool(owner_diag.get("active"))
                 if owner_active:
                     continue
@@ -1301,7 +1552,7 @@ class Orchestrator:
                     # lease so the task becomes claimable when a worker returns.
                     old_owner = owner
                     task["status"] = "assigned"
-                    task["updated_at"] = self._now()
+                    task["updated_at"] = now_iso
                     task["lease"] = None
                     task["reassigned_from"] = old_owner
                     task["reassigned_reason"] = f"owner stale, no active workers (> {threshold}s)"
@@ -1324,7 +1575,7 @@ class Orchestrator:
                 old_owner = owner
                 task["owner"] = new_owner
                 task["status"] = "assigned"
-                task["updated_at"] = self._now()
+                task["updated_at"] = now_iso
                 task["reassigned_from"] = old_owner
                 task["reassigned_reason"] = f"owner stale (> {threshold}s)"
                 task["degraded_comm"] = True
@@ -1368,6 +1619,7 @@ class Orchestrator:
             recoveries: List[Dict[str, Any]] = []
             changed_tasks = False
             changed_blockers = False
+            now = self._now()
 
             for task in tasks:
                 if task.get("status") != "in_progress":
@@ -1397,14 +1649,14 @@ class Orchestrator:
                 )
 
                 task["lease"] = None
-                task["lease_recovery_at"] = self._now()
+                task["lease_recovery_at"] = now
                 changed_tasks = True
 
                 if new_owner:
                     previous_owner = owner
                     task["owner"] = new_owner
                     task["status"] = "assigned"
-                    task["updated_at"] = self._now()
+                    task["updated_at"] = now
                     if new_owner != previous_owner:
                         task["reassigned_from"] = previous_owner
                         task["reassigned_reason"] = "lease_expired_recovery"
@@ -1417,7 +1669,7 @@ class Orchestrator:
                     continue
 
                 task["status"] = "blocked"
-                task["updated_at"] = self._now()
+                task["updated_at"] = now
                 task["lease_recovery_reason"] = "no_eligible_worker"
                 blocker = {
                     "id": f"BLK-{uuid.uuid4().hex[:8]}",
@@ -1430,7 +1682,7 @@ class Orchestrator:
                     "options": [],
                     "severity": "high",
                     "status": "open",
-                    "created_at": self._now(),
+                    "created_at": now,
                 }
                 blockers.append(blocker)
                 changed_blockers = True
@@ -1575,7 +1827,7 @@ class Orchestrator:
             raise ValueError(f"leader_mismatch: source={source}, current_leader={manager}")
         with self._state_lock():
             tasks = self._read_json(self.tasks_path, make_copy=True)
-            task = next((t for t in tasks if t["id"] == task_id), None)
+            task = self._find_by_id(self.tasks_path, tasks, task_id)
             if task is None:
                 raise ValueError(f"Task not found: {task_id}")
 
@@ -1592,15 +1844,16 @@ class Orchestrator:
                     "notes": "Cannot validate: wingman review required but still pending.",
                 }
 
+            now = self._now()
             if passed:
                 task["status"] = "done"
-                task["validated_at"] = self._now()
+                task["validated_at"] = now
                 self._close_bugs_for_task(task_id=task_id, note=notes)
                 event = "validation.passed"
                 payload = {"task_id": task_id, "owner": task["owner"], "notes": notes}
             else:
                 task["status"] = "bug_open"
-                task["validated_at"] = self._now()
+                task["validated_at"] = now
                 bug = self._open_bug(
                     source_task=task_id,
                     owner=task["owner"],
@@ -1637,7 +1890,7 @@ class Orchestrator:
                 "validator_role": "leader",
                 "decision": "accepted" if passed else "rejected",
                 "decision_reason": notes,
-                "decided_at": self._now(),
+                "decided_at": now,
                 "review_gate": review_gate_snapshot,
                 "quality_gate": quality_gate_snapshot,
             }
@@ -1646,7 +1899,7 @@ class Orchestrator:
             if quality_gate_snapshot is not None:
                 payload["quality_gate"] = quality_gate_snapshot
 
-            task["updated_at"] = self._now()
+            task["updated_at"] = now
             self._write_tasks_json(tasks)
         decision = "ACCEPTED" if passed else "REJECTED"
         logger.info("task.validated id=%s decision=%s owner=%s notes=%s", task_id, decision, task.get("owner"), notes[:80])
@@ -1740,11 +1993,14 @@ class Orchestrator:
 
     def list_bugs(self, status: Optional[str] = None, owner: Optional[str] = None) -> List[Dict[str, Any]]:
         bugs = self._read_json_list(self.bugs_path)
-        if status:
-            bugs = [bug for bug in bugs if bug.get("status") == status]
-        if owner:
-            bugs = [bug for bug in bugs if bug.get("owner") == owner]
-        return bugs
+        if not (status or owner):
+            # Never hand out the cached list object itself.
+            return list(bugs)
+        return [
+            bug
+            for bug in bugs
+            if (not status or bug.get("status") == status) and (not owner or bug.get("owner") == owner)
+        ]
 
     def raise_blocker(
         self,
@@ -1756,7 +2012,7 @@ class Orchestrator:
     ) -> Dict[str, Any]:
         with self._state_lock():
             tasks = self._read_json(self.tasks_path, make_copy=True)
-            task = next((item for item in tasks if item["id"] == task_id), None)
+            task = self._find_by_id(self.tasks_path, tasks, task_id)
             if task is None:
                 raise ValueError(f"Task not found: {task_id}")
             if task.get("owner") != agent:
@@ -1769,8 +2025,9 @@ class Orchestrator:
                 project_name=str(agent_scope.get("project_name", "")),
             )
 
+            now = self._now()
             task["status"] = "blocked"
-            task["updated_at"] = self._now()
+            task["updated_at"] = now
             self._write_tasks_json(tasks)
 
         blocker_id = f"BLK-{uuid.uuid4().hex[:8]}"
@@ -1785,7 +2042,7 @@ class Orchestrator:
             "options": options or [],
             "severity": severity,
             "status": "open",
-            "created_at": self._now(),
+            "created_at": now,
         }
 
         with self._state_lock():
@@ -1807,29 +2064,33 @@ class Orchestrator:
 
     def list_blockers(self, status: Optional[str] = None, agent: Optional[str] = None) -> List[Dict[str, Any]]:
         blockers = self._read_json_list(self.blockers_path)
-        if status:
-            blockers = [blk for blk in blockers if blk.get("status") == status]
-        if agent:
-            blockers = [blk for blk in blockers if blk.get("agent") == agent]
-        return blockers
+        if not (status or agent):
+            # Never hand out the cached list object itself.
+            return list(blockers)
+        return [
+            blk
+            for blk in blockers
+            if (not status or blk.get("status") == status) and (not agent or blk.get("agent") == agent)
+        ]
 
     def resolve_blocker(self, blocker_id: str, resolution: str, source: str) -> Dict[str, Any]:
         with self._state_lock():
             blockers = self._read_json_list(self.blockers_path, make_copy=True)
-            blocker = next((item for item in blockers if item["id"] == blocker_id), None)
+            blocker = self._find_by_id(self.blockers_path, blockers, blocker_id)
             if blocker is None:
                 raise ValueError(f"Blocker not found: {blocker_id}")
             if blocker.get("status") == "resolved":
                 return blocker
 
+            now = self._now()
             blocker["status"] = "resolved"
             blocker["resolution"] = resolution
             blocker["resolved_by"] = source
-            blocker["resolved_at"] = self._now()
+            blocker["resolved_at"] = now
             self._write_json(self.blockers_path, blockers)
 
             tasks = self._read_json(self.tasks_path, make_copy=True)
-            task = next((item for item in tasks if item["id"] == blocker["task_id"]), None)
+            task = self._find_by_id(self.tasks_path, tasks, blocker["task_id"])
             if task is not None and task.get("status") == "blocked":
                 owner = str(task.get("owner", ""))
                 owner_diag = self._team_member_connect_diagnostic(
@@ -1852,7 +2113,7 @@ class Orchestrator:
                         },
                         source="orchestrator",
                     )
-                task["updated_at"] = self._now()
+                task["updated_at"] = now
                 self._write_tasks_json(tasks)
 
         self.bus.emit(
@@ -2031,13 +2292,14 @@ class Orchestrator:
             if consult.get("status") == "closed":
                 raise ValueError(f"Consult already closed: {consult_id}")
 
+            now = self._now()
             response = {
                 "agent": agent,
                 "body": body,
-                "responded_at": self._now(),
+                "responded_at": now,
             }
             consult["responses"].append(response)
-            consult["updated_at"] = self._now()
+            consult["updated_at"] = now
 
             # Auto-close when all targeted agents have responded.
             target_agents = consult.get("target_agents", [])
@@ -2045,7 +2307,7 @@ class Orchestrator:
                 responded_agents = {r["agent"] for r in consult["responses"]}
                 if set(target_agents).issubset(responded_agents):
                     consult["status"] = "closed"
-                    consult["closed_at"] = self._now()
+                    consult["closed_at"] = now
 
             self._write_json(self.consults_path, consults)
 
@@ -3027,7 +3289,7 @@ class Orchestrator:
     def register_agent(self, agent: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         self._validate_agent_name(agent)
         with self._state_lock():
-            agents = self._read_json(self.agents_path, make_copy=True)
+            agents = self._read_agents(make_copy=True)
             if not isinstance(agents, dict):
                 agents = {}
             entry = agents.get(agent, {})
@@ -3036,7 +3298,7 @@ class Orchestrator:
             existing_metadata = entry.get("metadata", {}) if isinstance(entry.get("metadata"), dict) else {}
             incoming_metadata = metadata if isinstance(metadata, dict) else {}
             entry["metadata"] = self._normalize_agent_metadata(agent=agent, metadata=incoming_metadata, existing=existing_metadata)
-            entry["last_seen"] = self._now()
+            self._stamp_last_seen(agent, entry)
             agents[agent] = entry
             self._write_json(self.agents_path, agents)
             self._record_agent_instance_locked(agent=agent, entry=entry)
@@ -3046,7 +3308,7 @@ class Orchestrator:
     def heartbeat(self, agent: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         self._validate_agent_name(agent)
         with self._state_lock():
-            agents = self._read_json(self.agents_path, make_copy=True)
+            agents = self._read_agents(make_copy=True)
             if not isinstance(agents, dict):
                 agents = {}
             entry = agents.get(agent, {"agent": agent, "metadata": {}})
@@ -3060,7 +3322,7 @@ class Orchestrator:
                     agent=agent,
                     metadata=entry.get("metadata", {}) if isinstance(entry.get("metadata"), dict) else {},
                 )
-            entry["last_seen"] = self._now()
+            self._stamp_last_seen(agent, entry)
             agents[agent] = entry
             self._write_json(self.agents_path, agents)
             self._record_agent_instance_locked(agent=agent, entry=entry)
@@ -3273,86 +3535,54 @@ class Orchestrator:
         emit_stale_notices: bool = False,
     ) -> List[Dict[str, Any]]:
         stale_after = stale_after_seconds if stale_after_seconds is not None else self._heartbeat_timeout_seconds()
-        agents = self._read_json(self.agents_path)
+        agents = self._read_agents()
         if not isinstance(agents, dict):
             return []
 
         now = datetime.now(timezone.utc)
         results: List[Dict[str, Any]] = []
-        tasks = self.list_tasks()
+        tasks_by_owner = self._tasks_by_owner()
         stale_notices = self._read_json(self.stale_notices_path, make_copy=True)
         if not isinstance(stale_notices, dict):
             stale_notices = {}
         stale_changed = False
+        known_agents = list(agents.keys())
 
-        for _, entry in agents.items():
-            item = dict(entry)
-            last_seen_raw = item.get("last_seen")
-            if last_seen_raw:
-                try:
-                    last_seen = datetime.fromisoformat(last_seen_raw)
-                    age = int((now - last_seen).total_seconds())
-                except Exception:
-                    age = stale_after + 1
-            else:
+        for entry in agents.values():
+            agent = entry.get("agent")
+            age = self._last_seen_age_seconds(entry, now=now)
+            if age is None:
                 age = stale_after + 1
 
             computed_status = "active" if age <= stale_after else "offline"
-            identity = self._identity_snapshot(entry=item, stale_after_seconds=stale_after)
+            identity = self._identity_snapshot(entry=entry, stale_after_seconds=stale_after)
             if not bool(identity.get("verified")):
                 computed_status = "offline"
-            item["status"] = computed_status
-            item["age_seconds"] = max(0, age)
-            item.update(identity)
             if computed_status == "active":
-                if item.get("agent") in stale_notices:
-                    del stale_notices[item["agent"]]
+                if agent in stale_notices:
+                    del stale_notices[agent]
                     stale_changed = True
             else:
                 if emit_stale_notices and self._emit_stale_notice_if_due(
-                    agent=item.get("agent", ""),
+                    agent=entry.get("agent", ""),
                     age_seconds=max(0, age),
                     stale_after_seconds=stale_after,
                     stale_notices=stale_notices,
                     now=now,
-                    known_agents=list(agents.keys()),
+                    known_agents=known_agents,
                 ):
                     stale_changed = True
-            if active_only and item["status"] != "active":
+            if active_only and computed_status != "active":
                 continue
-            item["task_counts"] = {
-                "assigned": sum(
-                    1
-                    for task in tasks
-                    if task.get("owner") == item.get("agent") and task.get("status") == "assigned"
-                ),
-                "in_progress": sum(
-                    1
-                    for task in tasks
-                    if task.get("owner") == item.get("agent") and task.get("status") == "in_progress"
-                ),
-                "blocked": sum(
-                    1
-                    for task in tasks
-                    if task.get("owner") == item.get("agent") and task.get("status") == "blocked"
-                ),
-                "done": sum(
-                    1
-                    for task in tasks
-                    if task.get("owner") == item.get("agent") and task.get("status") == "done"
-                ),
-                "superseded": sum(
-                    1
-                    for task in tasks
-                    if task.get("owner") == item.get("agent") and task.get("status") == "superseded"
-                ),
-                "archived": sum(
-                    1
-                    for task in tasks
-                    if task.get("owner") == item.get("agent") and task.get("status") == "archived"
-                ),
-            }
-            results.append(item)
+            task_counts = dict.fromkeys(_AGENT_TASK_COUNT_STATUSES, 0)
+            for task in tasks_by_owner.get(agent, ()):
+                status = task.get("status")
+                if status in task_counts:
+                    task_counts[status] += 1
+            # One fresh dict per returned agent; the cached entry is never touched.
+            results.append(
+                {**entry, "status": computed_status, "age_seconds": max(0, age), **identity, "task_counts": task_counts}
+            )
 
         if stale_changed:
             self._write_json(self.stale_notices_path, stale_notices)
@@ -3405,23 +3635,9 @@ class Orchestrator:
         registered = self.list_agents(active_only=active_only, stale_after_seconds=stale_after_seconds)
         registered_names = {entry.get("agent") for entry in registered}
 
-        inferred_names: set[str] = set()
-        events = list(self.bus.iter_events())
-        for event in events:
-            source = event.get("source")
-            if source and source not in {"orchestrator", "governance"}:
-                inferred_names.add(source)
-            payload = event.get("payload") or {}
-            audience = payload.get("audience")
-            if isinstance(audience, list):
-                for item in audience:
-                    if isinstance(item, str):
-                        inferred_names.add(item)
+        inferred_names = set(self._event_inferred_names())
 
-        for task in self.list_tasks():
-            owner = task.get("owner")
-            if isinstance(owner, str):
-                inferred_names.add(owner)
+        inferred_names.update(owner for owner in self._tasks_by_owner() if isinstance(owner, str))
 
         inferred_only = []
         for name in sorted(inferred_names):
@@ -3461,12 +3677,38 @@ class Orchestrator:
             "agents": all_agents,
         }
 
+    def _event_inferred_names(self) -> Set[str]:
+        """Agent names seen as event sources or audiences, scanning only new events."""
+        generation = self.bus.events_generation()
+        cached = self._event_names_cache
+        if cached is None or cached[0] != generation:
+            cached = (generation, 0, set())
+        _, offset, names = cached
+        for idx, event in self.bus.iter_events_from(start=offset):
+            source = event.get("source")
+            if source and source not in {"orchestrator", "governance"}:
+                names.add(source)
+            payload = event.get("payload") or {}
+            audience = payload.get("audience")
+            if isinstance(audience, list):
+                for item in audience:
+                    if isinstance(item, str):
+                        names.add(item)
+            offset = idx + 1
+        self._event_names_cache = (generation, offset, names)
+        return names
+
     def get_agent_cursor(self, agent: str) -> int:
-        cursors = self._read_json(self.cursors_path)
-        if not isinstance(cursors, dict):
-            cursors = {}
-            self._write_json(self.cursors_path, cursors)
-        return int(cursors.get(agent, 0))
+        # Read under the state lock: a snapshot rewrite (e.g. compaction
+        # shifting every cursor) replaces the snapshot and drops the cursor
+        # log in two steps, and a reader between them would fold the old
+        # log onto the new snapshot.
+        with self._state_lock():
+            cursors = self._read_cursors()
+            if not isinstance(cursors, dict):
+                cursors = {}
+                self._write_json(self.cursors_path, cursors)
+            return int(cursors.get(agent, 0))
 
     def poll_events(
         self,
@@ -3481,24 +3723,11 @@ class Orchestrator:
         self._refresh_agent_presence(agent)
         start = self.get_agent_cursor(agent) if cursor is None else max(0, int(cursor))
         self.bus.wait_for_event_index(start=start, timeout_ms=timeout_ms)
+        delivered, next_cursor = self.bus.events_for_agent(agent, start=start, limit=limit)
         filtered: List[Dict[str, Any]] = []
-        current_index = start
-
-        for idx, event in self.bus.iter_events_from(start=start):
-            payload = event.get("payload", {})
-            audience = payload.get("audience")
-            if audience and agent not in audience and "*" not in audience:
-                current_index = idx + 1
-                continue
-
-            enriched = dict(event)
-            enriched["offset"] = idx
-            filtered.append(enriched)
-            current_index = idx + 1
-            if len(filtered) >= limit:
-                break
-
-        next_cursor = current_index
+        for idx, event in delivered:
+            event["offset"] = idx
+            filtered.append(event)
         if auto_advance:
             self._set_agent_cursor(agent, next_cursor)
 
@@ -3512,12 +3741,11 @@ class Orchestrator:
     def ack_event(self, agent: str, event_id: str) -> Dict[str, Any]:
         self._refresh_agent_presence(agent)
         with self._state_lock():
-            acks = self._read_json(self.acks_path, make_copy=True)
-            if not isinstance(acks, dict):
-                acks = {}
-                self._write_json(self.acks_path, acks)
-            acked = acks.get(agent, [])
-            if event_id not in acked:
+            if not isinstance(self._read_json(self.acks_path), dict):
+                self._write_json(self.acks_path, {})
+            if event_id not in self._acked_event_ids(agent):
+                acks = self._read_json(self.acks_path, make_copy=True)
+                acked = acks.get(agent, [])
                 acked.append(event_id)
                 acks[agent] = acked
                 self._write_json(self.acks_path, acks)
@@ -3529,13 +3757,34 @@ class Orchestrator:
         )
         return {"agent": agent, "event_id": event_id, "acked": True}
 
+    def _acked_event_ids(self, agent: str) -> Set[str]:
+        """Set view of an agent's acked event ids.
+
+        Ack lists only grow by appends, so when event_acks.json changes the
+        cached set is extended with the new tail instead of being rebuilt.
+        """
+        raw = self._read_json(self.acks_path)
+        ids = raw.get(agent) if isinstance(raw, dict) else None
+        if not isinstance(ids, list):
+            ids = []
+        count, acked = self._ack_sets.get(agent, (0, None))
+        if acked is None or len(ids) < count:
+            count, acked = 0, set()
+        if len(ids) > count:
+            acked.update(ids[count:])
+        self._ack_sets[agent] = (len(ids), acked)
+        return acked
+
     def _set_agent_cursor(self, agent: str, cursor: int) -> None:
+        value = max(0, int(cursor))
         with self._state_lock():
-            cursors = self._read_json(self.cursors_path, make_copy=True)
+            cursors = self._read_cursors()
             if not isinstance(cursors, dict):
-                cursors = {}
-            cursors[agent] = max(0, int(cursor))
-            self._write_json(self.cursors_path, cursors)
+                self._write_json(self.cursors_path, {agent: value})
+            elif cursors.get(agent) != value:
+                # Hot path: record the advance as one appended line instead of
+                # rewriting every agent's cursor.
+                self._append_state_log_unlocked(self.cursors_path, {"agent": agent, "cursor": value})
 
     def compact_events(self, retention_limit: Optional[int] = None) -> Dict[str, Any]:
         """Compact the event bus: archive old events and adjust agent cursors.
@@ -3554,7 +3803,7 @@ class Orchestrator:
             offset_adj = result.get("offset_adjustment", 0)
 
             if offset_adj > 0:
-                cursors = self._read_json(self.cursors_path, make_copy=True)
+                cursors = self._read_cursors(make_copy=True)
                 if isinstance(cursors, dict):
                     for agent in cursors:
                         cursors[agent] = max(0, int(cursors[agent]) - offset_adj)
@@ -3575,24 +3824,25 @@ class Orchestrator:
         return result
 
     def _close_bugs_for_task(self, task_id: str, note: str) -> None:
-        bugs = self._read_json_list(self.bugs_path, make_copy=True)
-        changed = False
-        for bug in bugs:
-            if bug.get("source_task") != task_id:
-                continue
-            if bug.get("status") == "closed":
-                continue
-            bug["status"] = "closed"
-            bug["closed_at"] = self._now()
-            bug["resolution_note"] = note
-            changed = True
-            self.bus.emit(
-                "bug.closed",
-                {"bug_id": bug.get("id"), "source_task": task_id, "note": note},
-                source=self.manager_agent(),
-            )
-        if changed:
-            self._write_json(self.bugs_path, bugs)
+        with self.batch():
+            bugs = self._read_json_list(self.bugs_path, make_copy=True)
+            changed = False
+            for bug in bugs:
+                if bug.get("source_task") != task_id:
+                    continue
+                if bug.get("status") == "closed":
+                    continue
+                bug["status"] = "closed"
+                bug["closed_at"] = self._now()
+                bug["resolution_note"] = note
+                changed = True
+                self.bus.emit(
+                    "bug.closed",
+                    {"bug_id": bug.get("id"), "source_task": task_id, "note": note},
+                    source=self.manager_agent(),
+                )
+            if changed:
+                self._write_json(self.bugs_path, bugs)
 
     def record_architecture_decision(
         self,
@@ -3749,7 +3999,7 @@ class Orchestrator:
                         "status": "open",
                         "created_at": self._now(),
                     }
-                    b["updated_at"] = self._now()
+                    b["updated_at"] = b["github_issue"]["created_at"]
                     break
             self._write_json(self.bugs_path, bugs)
 
@@ -3766,7 +4016,8 @@ class Orchestrator:
         return result
 
     def _validate_report_payload(self, report: Dict[str, Any]) -> None:
-        if not isinstance(report.get("commit_sha"), str) or not report.get("commit_sha", "").strip():
+        commit_sha = report.get("commit_sha")
+        if not isinstance(commit_sha, str) or not commit_sha.strip():
             raise ValueError("commit_sha must be a non-empty string")
 
         summary = report.get("test_summary")
@@ -3777,12 +4028,12 @@ class Orchestrator:
             if key not in summary:
                 raise ValueError(f"test_summary missing required field: {key}")
 
-        command = summary.get("command")
+        command = summary["command"]
         if not isinstance(command, str) or not command.strip():
             raise ValueError("test_summary.command must be a non-empty string")
 
-        passed = summary.get("passed")
-        failed = summary.get("failed")
+        passed = summary["passed"]
+        failed = summary["failed"]
         if not isinstance(passed, int) or passed < 0:
             raise ValueError("test_summary.passed must be a non-negative integer")
         if not isinstance(failed, int) or failed < 0:
@@ -3887,7 +4138,7 @@ class Orchestrator:
             raise ValueError(f"review_gate status must be one of: {', '.join(sorted(allowed))}")
         with self._state_lock():
             tasks = self._read_json(self.tasks_path, make_copy=True)
-            task = next((t for t in tasks if t["id"] == task_id), None)
+            task = self._find_by_id(self.tasks_path, tasks, task_id)
             if task is None:
                 raise ValueError(f"Task not found: {task_id}")
             if task.get("status") != "reported":
@@ -3898,8 +4149,8 @@ class Orchestrator:
             rg["reviewer_notes"] = notes
             rg["reviewed_at"] = self._now()
             task["review_gate"] = rg
-            task["review_gate_updated_at"] = self._now()
-            task["updated_at"] = self._now()
+            task["review_gate_updated_at"] = rg["reviewed_at"]
+            task["updated_at"] = rg["reviewed_at"]
             self._write_tasks_json(tasks)
         event_type = "review.approved" if status == "approved" else "review.rejected"
         self.bus.emit(event_type, {"task_id": task_id, "reviewer": reviewer_agent, "notes": notes}, source=reviewer_agent)
@@ -3917,10 +4168,9 @@ class Orchestrator:
         workstream: str,
         owner: str,
     ) -> Optional[Dict[str, Any]]:
-        open_statuses = {"assigned", "in_progress", "reported", "bug_open", "blocked"}
         candidate_key = self._task_fingerprint(title=title, workstream=workstream, owner=owner)
         for task in tasks:
-            if task.get("status") not in open_statuses:
+            if task.get("status") not in _OPEN_TASK_STATUSES:
                 continue
             existing_key = self._task_fingerprint(
                 title=str(task.get("title", "")),
@@ -3942,12 +4192,21 @@ class Orchestrator:
         """Update last_seen/status without lock acquisition (caller must hold _state_lock)."""
         if not isinstance(agent, str) or not agent.strip():
             return
-        agents = self._read_json(self.agents_path, make_copy=True)
+        agents = self._read_agents()
+        entry = agents.get(agent) if isinstance(agents, dict) else None
+        if isinstance(entry, dict) and entry.get("status") == "active":
+            # Hot path: record presence as a single appended line instead of
+            # rewriting agents.json; see _read_agents for the overlay.
+            presence = {"agent": agent}
+            self._stamp_last_seen(agent, presence)
+            self._append_state_log_unlocked(self.agents_path, presence)
+            return
+        agents = self._read_agents(make_copy=True)
         if not isinstance(agents, dict):
             agents = {}
         entry = agents.get(agent, {"agent": agent, "metadata": {}})
         entry["status"] = "active"
-        entry["last_seen"] = self._now()
+        self._stamp_last_seen(agent, entry)
         agents[agent] = entry
         self._write_json(self.agents_path, agents)
 
@@ -3960,18 +4219,88 @@ class Orchestrator:
         return max(60, value * 60)
 
     def _team_member_connect_diagnostic(self, team_member: str, stale_after_seconds: int) -> Dict[str, Any]:
-        agents = self._read_json(self.agents_path)
-        if not isinstance(agents, dict):
-            agents = {}
-        entry = agents.get(team_member, {})
+        entry = self._agents_snapshot().get(team_member, {})
+        if not entry:
+            return self._unregistered_connect_diagnostic()
+        owned_open_tasks = [
+            t for t in self._tasks_by_owner().get(team_member, ()) if t.get("status") in _OPEN_TASK_STATUSES
+        ]
+        return self._connect_diagnostic_for_entry(entry, owned_open_tasks, stale_after_seconds)
+
+    def _connected_team_members(self, requested: List[str], stale_after_seconds: int) -> List[str]:
+        """Requested agents that are active, verified and in this project (or cross-project allowed)."""
+        agents = self._agents_snapshot()
+        allow_cross_project = self._allow_cross_project_agents()
+        connected: List[str] = []
+        for name in requested:
+            entry = agents.get(name)
+            if not entry:
+                continue
+            diag = self._connect_diagnostic_for_entry(entry, [], stale_after_seconds)
+            if diag["active"] and (diag["identity"].get("same_project") or allow_cross_project):
+                connected.append(name)
+        return connected
+
+    def _diagnose_all(
+        self,
+        stale_after_seconds: int,
+        team_members: Optional[Any] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Connect diagnostics for many agents from a single agents/tasks read.
+
+        Defaults to every registered agent; pass ``team_members`` to diagnose a
+        specific set (unregistered names get the not_registered payload).
+        """
+        agents = self._agents_snapshot()
+        names = list(agents) if team_members is None else list(team_members)
+        open_tasks_by_owner: Dict[str, List[Dict[str, Any]]] = {}
+        for task in self._tasks_view():
+            if isinstance(task, dict) and task.get("status") in _OPEN_TASK_STATUSES:
+                open_tasks_by_owner.setdefault(str(task.get("owner", "")), []).append(task)
+        diagnostics: Dict[str, Dict[str, Any]] = {}
+        for name in names:
+            entry = agents.get(name, {})
+            if not entry:
+                diagnostics[name] = self._unregistered_connect_diagnostic()
+                continue
+            diagnostics[name] = self._connect_diagnostic_for_entry(
+                entry, open_tasks_by_owner.get(name, []), stale_after_seconds
+            )
+        return diagnostics
+
+    @staticmethod
+    def _unregistered_connect_diagnostic() -> Dict[str, Any]:
+        return {
+            "registered": False,
+            "active": False,
+            "status": "unknown",
+            "last_seen": None,
+            "age_seconds": None,
+            "reason": "not_registered",
+            "owned_open_tasks": 0,
+            "latest_open_task_update_age_seconds": None,
+            "identity": {
+                "agent_id": None,
+                "verified": False,
+                "reason": "not_registered",
+                "same_project": False,
+                "last_seen": None,
+                "age_seconds": None,
+            },
+        }
+
+    def _connect_diagnostic_for_entry(
+        self,
+        entry: Mapping[str, Any],
+        owned_open_tasks: List[Dict[str, Any]],
+        stale_after_seconds: int,
+    ) -> Dict[str, Any]:
         now = datetime.now(timezone.utc)
 
         last_seen = entry.get("last_seen")
-        age = self._age_seconds(str(last_seen), now=now) if last_seen else None
+        age = self._last_seen_age_seconds(entry, now=now)
         active = age is not None and age <= stale_after_seconds
 
-        open_statuses = {"assigned", "in_progress", "reported", "bug_open", "blocked"}
-        owned_open_tasks = [t for t in self.list_tasks() if t.get("owner") == team_member and t.get("status") in open_statuses]
         latest_task_update_age: Optional[int] = None
         for task in owned_open_tasks:
             updated_at = task.get("updated_at")
@@ -3984,15 +4313,12 @@ class Orchestrator:
                 latest_task_update_age = task_age
 
         reason = "active" if active else "no_recent_heartbeat"
-        if not entry:
-            reason = "not_registered"
-
         identity = self._identity_snapshot(entry=entry, stale_after_seconds=stale_after_seconds)
         if not identity.get("verified"):
             active = False
             reason = str(identity.get("reason", reason))
         return {
-            "registered": bool(entry),
+            "registered": True,
             "active": bool(active),
             "status": entry.get("status", "unknown"),
             "last_seen": last_seen,
@@ -4009,19 +4335,11 @@ class Orchestrator:
             metadata = {}
         now = datetime.now(timezone.utc)
         last_seen = entry.get("last_seen")
-        age = self._age_seconds(str(last_seen), now=now) if last_seen else None
+        age = self._last_seen_age_seconds(entry, now=now)
 
         project_root = str(metadata.get("project_root", ""))
         cwd = str(metadata.get("cwd", ""))
-        project_root_resolved = self._safe_resolve(project_root) if project_root else None
-        cwd_resolved = self._safe_resolve(cwd) if cwd else None
-        same_project = False
-        if project_root_resolved is not None and cwd_resolved is not None:
-            same_project = project_root_resolved == self.root and self._path_within_project(cwd_resolved)
-        elif project_root_resolved is not None:
-            same_project = project_root_resolved == self.root
-        elif cwd_resolved is not None:
-            same_project = self._path_within_project(cwd_resolved)
+        same_project = self._metadata_is_same_project(metadata)
 
         verification = self._verification_for_entry(entry=entry, stale_after_seconds=stale_after_seconds)
         verification["same_project"] = same_project
@@ -4052,6 +4370,31 @@ class Orchestrator:
             "age_seconds": age,
         }
 
+    def _metadata_is_same_project(self, metadata: Dict[str, Any]) -> bool:
+        project_root = str(metadata.get("project_root", ""))
+        cwd = str(metadata.get("cwd", ""))
+        project_root_resolved = self._safe_resolve(project_root) if project_root else None
+        cwd_resolved = self._safe_resolve(cwd) if cwd else None
+        if project_root_resolved is not None and cwd_resolved is not None:
+            return project_root_resolved == self.root and self._path_within_project(cwd_resolved)
+        if project_root_resolved is not None:
+            return project_root_resolved == self.root
+        if cwd_resolved is not None:
+            return self._path_within_project(cwd_resolved)
+        return False
+
+    def _check_same_project_and_complete(self, entry: Dict[str, Any]) -> tuple:
+        """Return ``(same_project, identity_complete)`` for *entry*.
+
+        Lean variant of :meth:`_identity_snapshot` for the per-RPC operational
+        guard: skips the snapshot dict and heartbeat-age verification.
+        """
+        metadata = entry.get("metadata", {}) if isinstance(entry, dict) else {}
+        if not isinstance(metadata, dict):
+            metadata = {}
+        identity_complete = all(str(metadata.get(key, "")).strip() for key in _IDENTITY_REQUIRED_FIELDS)
+        return self._metadata_is_same_project(metadata), identity_complete
+
     def _normalize_agent_metadata(
         self,
         agent: str,
@@ -4078,7 +4421,7 @@ class Orchestrator:
         return merged
 
     def _current_agent_instance_id_unlocked(self, agent: str) -> str:
-        agents = self._read_json(self.agents_path)
+        agents = self._read_agents()
         if not isinstance(agents, dict):
             return f"{agent}#default"
         entry = agents.get(agent, {})
@@ -4130,13 +4473,14 @@ class Orchestrator:
         normalized = self._normalize_agent_metadata(agent=agent, metadata=metadata)
         instance_id = str(normalized.get("instance_id", "")).strip() or f"{agent}#default"
         key = self._instance_record_key(agent=agent, instance_id=instance_id)
+        now = self._now()
         instances[key] = {
             "agent": agent,
             "instance_id": instance_id,
             "metadata": normalized,
             "status": entry.get("status", "active"),
-            "last_seen": entry.get("last_seen", self._now()),
-            "updated_at": self._now(),
+            "last_seen": entry.get("last_seen", now),
+            "updated_at": now,
         }
         self._write_json(self.agent_instances_path, instances)
 
@@ -4144,20 +4488,8 @@ class Orchestrator:
         metadata = entry.get("metadata", {}) if isinstance(entry, dict) else {}
         if not isinstance(metadata, dict):
             metadata = {}
-        required = [
-            "client",
-            "model",
-            "cwd",
-            "permissions_mode",
-            "sandbox_mode",
-            "session_id",
-            "connection_id",
-            "server_version",
-            "verification_source",
-        ]
-        missing = [key for key in required if not str(metadata.get(key, "")).strip()]
-        last_seen = entry.get("last_seen")
-        age = self._age_seconds(str(last_seen)) if last_seen else None
+        missing = [key for key in _IDENTITY_REQUIRED_FIELDS if not str(metadata.get(key, "")).strip()]
+        age = self._last_seen_age_seconds(entry)
         if missing:
             return {"verified": False, "reason": f"missing_identity_fields:{','.join(missing)}"}
         if age is None or age > stale_after_seconds:
@@ -4216,7 +4548,7 @@ class Orchestrator:
     def _agent_project_scope_unlocked(self, agent: str) -> Dict[str, Any]:
         root = self.root
         name = self.root.name
-        agents = self._read_json(self.agents_path)
+        agents = self._read_agents()
         if isinstance(agents, dict):
             entry = agents.get(agent, {})
             metadata = entry.get("metadata", {}) if isinstance(entry, dict) else {}
@@ -4294,15 +4626,16 @@ class Orchestrator:
             return False
 
         cooldown_seconds = max(60, stale_after_seconds)
-        last_notice_iso = stale_notices.get(agent)
-        if last_notice_iso:
+        now_ts = int(now.timestamp())
+        last_notice = stale_notices.get(agent)
+        if isinstance(last_notice, str) and last_notice:
+            # Legacy entries stored ISO strings; newer ones store epoch seconds.
             try:
-                last_notice = datetime.fromisoformat(str(last_notice_iso))
-                elapsed = int((now - last_notice).total_seconds())
-                if elapsed < cooldown_seconds:
-                    return False
-            except Exception:
-                pass
+                last_notice = int(datetime.fromisoformat(last_notice).timestamp())
+            except ValueError:
+                last_notice = None
+        if isinstance(last_notice, (int, float)) and now_ts - int(last_notice) < cooldown_seconds:
+            return False
 
         manager = self.manager_agent()
         audience = [agent, manager]
@@ -4316,14 +4649,12 @@ class Orchestrator:
                 "agent": agent,
                 "age_seconds": age_seconds,
                 "stale_after_seconds": stale_after_seconds,
-                "action": "rerun handshake",
-                "team_member_action": "run 'connect to leader'",
-                "manager_action": "run orchestrator_connect_team_members",
+                **_STALE_NOTICE_TEMPLATE,
                 "audience": audience,
             },
             source="orchestrator",
         )
-        stale_notices[agent] = self._now()
+        stale_notices[agent] = now_ts
         return True
 
     def _pick_reassignment_owner(
@@ -4339,7 +4670,7 @@ class Orchestrator:
 
         # Read agent metadata to detect degraded agents.
         _DEGRADED_STATUSES = {"budget_exhausted", "capacity_degraded"}
-        agents_data = self._read_json(self.agents_path)
+        agents_data = self._read_agents()
         if not isinstance(agents_data, dict):
             agents_data = {}
 
@@ -4380,7 +4711,7 @@ class Orchestrator:
             return sum(
                 1
                 for t in tasks
-                if t.get("owner") == agent and t.get("status") in {"assigned", "in_progress", "reported", "bug_open", "blocked"}
+                if t.get("owner") == agent and t.get("status") in _OPEN_TASK_STATUSES
             )
 
         return sorted(candidates, key=load)[0]
@@ -4393,6 +4724,37 @@ class Orchestrator:
         except Exception:
             return None
 
+    def _stamp_last_seen(self, agent: str, entry: Dict[str, Any]) -> None:
+        """Set ``entry["last_seen"]`` to now, remembering the epoch timestamp.
+
+        The ISO string is what gets persisted; the numeric copy lets
+        :meth:`_last_seen_age_seconds` skip re-parsing it in this process.
+        """
+        now = self._now()
+        entry["last_seen"] = now
+        self._last_seen_ts[agent] = (now, datetime.fromisoformat(now).timestamp())
+
+    def _last_seen_age_seconds(self, entry: Dict[str, Any], now: Optional[datetime] = None) -> Optional[int]:
+        last_seen = entry.get("last_seen") if isinstance(entry, dict) else None
+        if not last_seen:
+            return None
+        agent = str(entry.get("agent", ""))
+        stamped = self._last_seen_ts.get(agent)
+        if stamped is None or stamped[0] != last_seen:
+            # Written by another process (or rewritten): parse once and
+            # remember it until last_seen changes again.
+            try:
+                parsed = datetime.fromisoformat(str(last_seen))
+            except (TypeError, ValueError):
+                return None
+            if parsed.tzinfo is None:
+                return self._age_seconds(str(last_seen), now=now)
+            stamped = (last_seen, parsed.timestamp())
+            if agent:
+                self._last_seen_ts[agent] = stamped
+        current = now or datetime.now(timezone.utc)
+        return int(current.timestamp() - stamped[1])
+
     def _agent_is_operational(
         self,
         agent: str,
@@ -4400,42 +4762,21 @@ class Orchestrator:
     ) -> bool:
         if not isinstance(agent, str) or not agent.strip():
             return False
-        with self._state_lock():
-            agents = self._read_json(self.agents_path)
-            if not isinstance(agents, dict):
-                return False
-            entry = agents.get(agent)
-            if not isinstance(entry, dict):
-                return False
-            stale_after = stale_after_seconds if stale_after_seconds is not None else self._heartbeat_timeout_seconds()
-            identity = self._identity_snapshot(entry=entry, stale_after_seconds=stale_after)
-            # Operational guard focuses on identity + project isolation, not recency.
-            # This allows agents to recover after downtime without manual re-registration
-            # while still blocking cross-project or missing-identity access.
-            metadata = entry.get("metadata", {}) if isinstance(entry.get("metadata"), dict) else {}
-            required = [
-                "client",
-                "model",
-                "cwd",
-                "permissions_mode",
-                "sandbox_mode",
-                "session_id",
-                "connection_id",
-                "server_version",
-                "verification_source",
-            ]
-            identity_complete = all(str(metadata.get(key, "")).strip() for key in required)
-            return bool(identity_complete) and (
-                bool(identity.get("same_project")) or self._allow_cross_project_agents()
-            )
+        # Lock-free: reads the published agents snapshot (see _agents_snapshot).
+        entry = self._agents_snapshot().get(agent)
+        if not isinstance(entry, dict):
+            return False
+        # Operational guard focuses on identity + project isolation, not recency.
+        # This allows agents to recover after downtime without manual re-registration
+        # while still blocking cross-project or missing-identity access.
+        # ``stale_after_seconds`` is accepted for API compatibility only.
+        same_project, identity_complete = self._check_same_project_and_complete(entry)
+        return identity_complete and (same_project or self._allow_cross_project_agents())
 
     def _leader_is_operational_for_project_locked(self, leader: str) -> bool:
         if not isinstance(leader, str) or not leader.strip():
             return False
-        agents = self._read_json(self.agents_path)
-        if not isinstance(agents, dict):
-            return False
-        entry = agents.get(leader)
+        entry = self._agents_snapshot().get(leader)
         if not isinstance(entry, dict):
             return False
         stale_after = self._heartbeat_timeout_seconds()
@@ -4444,32 +4785,287 @@ class Orchestrator:
             bool(identity.get("same_project")) or self._allow_cross_project_agents()
         )
 
+    def _agents_snapshot(self) -> Mapping[str, Any]:
+        """Return a read-only view of agents.json for lock-free readers.
+
+        Writers in this process publish the view after each agents.json
+        rename or presence append (see _publish_agents_snapshot). Readers
+        take that reference without ``_state_lock``. If the files have
+        changed since, e.g. because another process wrote them, readers
+        rebuild it from disk instead.
+        """
+        published = self._agents_published
+        if published is not None and not self._in_batch() and published[0] == self._agents_stamp():
+            return published[1]
+        return self._publish_agents_snapshot()
+
+    def _agents_stamp(self) -> tuple:
+        """(mtime_ns, size) of agents.json and its presence log; None if missing."""
+        stamps = []
+        for path in (self.agents_path, self.agent_presence_log_path):
+            try:
+                st = os.stat(path)
+            except OSError:
+                stamps.append(None)
+            else:
+                stamps.append((st.st_mtime_ns, st.st_size))
+        return tuple(stamps)
+
+    def _publish_agents_snapshot(self) -> Mapping[str, Any]:
+        """Rebuild the read-only agents view and store it for _agents_snapshot."""
+        # Stamp before reading: a write that lands in between leaves the
+        # stamp stale, so the next reader rebuilds rather than trusting it.
+        stamp = self._agents_stamp()
+        agents = self._read_agents()
+        snapshot = MappingProxyType(agents) if isinstance(agents, dict) else _EMPTY_MAPPING
+        if not self._in_batch():
+            self._agents_published = (stamp, snapshot)
+        return snapshot
+
     def _assert_agent_operational(self, agent: str) -> None:
         if not self._agent_is_operational(agent):
             raise ValueError(f"agent_not_operational_or_wrong_project: {agent}")
 
     @staticmethod
     def _lazy_copy(data: Any) -> Any:
-        """Return a lazy copy: _LazyCopyList for lists, deepcopy for others."""
+        """Return a lazy copy: _LazyCopyList / _LazyCopyDict, deepcopy for others."""
         if isinstance(data, list):
             return _LazyCopyList(data)
+        if isinstance(data, dict):
+            return _LazyCopyDict(data)
         return copy.deepcopy(data)
 
     def _read_json(self, path: Path, make_copy: bool = False) -> Any:
         key = str(path)
+        if self._batch_writes and self._in_batch() and key in self._batch_writes:
+            data = self._batch_writes[key][1]
+            return self._lazy_copy(data) if make_copy else data
         try:
-            mtime_ns = path.stat().st_mtime_ns
+            st = path.stat()
         except FileNotFoundError:
             self._json_cache.pop(key, None)
             return []
+        mtime_ns = st.st_mtime_ns
         cached = self._json_cache.get(key)
         if cached is not None and cached[0] == mtime_ns:
             return self._lazy_copy(cached[1]) if make_copy else cached[1]
-        with path.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
+        written = self._written_tasks
+        if written is not None and written[:2] == (mtime_ns, st.st_size) and path == self.tasks_path:
+            # Our own last write, already parsed and interned.
+            self._json_cache[key] = (mtime_ns, written[2])
+            return self._lazy_copy(written[2]) if make_copy else written[2]
+        if orjson is not None:
+            data = orjson.loads(path.read_bytes())
+        else:
+            with path.open("r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        if path == self.tasks_path and isinstance(data, list):
+            self._intern_fields(data, _INTERNED_TASK_FIELDS)
+        elif path == self.agents_path and isinstance(data, dict):
+            self._intern_fields(data.values(), _INTERNED_AGENT_FIELDS)
         self._json_cache[key] = (mtime_ns, data)
         return self._lazy_copy(data) if make_copy else data
 
+    @staticmethod
+    def _intern_fields(items: Any, fields: Tuple[str, ...]) -> None:
+        """sys.intern the string values of ``fields`` in each dict of ``items``."""
+        intern = sys.intern
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            for field in fields:
+                value = item.get(field)
+                if type(value) is str:
+                    item[field] = intern(value)
+
+    def _id_positions(self, path: Path) -> Dict[Any, int]:
+        """Map item id -> list position for the cached contents of ``path``.
+
+        Rebuilt only when the cached list object changes (i.e. the file was
+        rewritten), so repeated lookups between writes are O(1).
+        """
+        raw = self._read_json(path)
+        key = str(path)
+        cached = self._id_index.get(key)
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+        positions: Dict[Any, int] = {}
+        if isinstance(raw, list):
+            for pos, item in enumerate(list.__iter__(raw)):
+                if isinstance(item, dict) and "id" in item:
+                    positions.setdefault(item["id"], pos)
+        self._id_index[key] = (raw, positions)
+        return positions
+
+    def _find_by_id(self, path: Path, items: List[Any], item_id: Any) -> Optional[Dict[str, Any]]:
+        """Return the first item of ``items`` (a read of ``path``) with ``id == item_id``.
+
+        Uses the position index and confirms the hit, falling back to a scan
+        when ``items`` has diverged from the cached list.  Candidates are
+        compared on the raw storage so lazy copies only copy the match.
+        """
+        pos = self._id_positions(path).get(item_id)
+        if pos is not None and pos < len(items):
+            candidate = list.__getitem__(items, pos)
+            if isinstance(candidate, dict) and candidate.get("id") == item_id:
+                return items[pos]
+        for pos, candidate in enumerate(list.__iter__(items)):
+            if isinstance(candidate, dict) and candidate.get("id") == item_id:
+                return items[pos]
+        return None
+
+    def _task_indexes(self) -> _TaskIndex:
+        """Owner/status indexes over the cached tasks list; rebuilt only when tasks.json changes."""
+        raw = self._read_json(self.tasks_path)
+        cached = self._task_index_cache
+        if cached is not None and cached.source is raw:
+            return cached
+        by_owner: Dict[Any, List[Dict[str, Any]]] = {}
+        owner_positions: Dict[Any, List[int]] = {}
+        status_positions: Dict[Any, List[int]] = {}
+        if isinstance(raw, list):
+            for pos, task in enumerate(raw):
+                if not isinstance(task, dict):
+                    continue
+                owner = task.get("owner")
+                by_owner.setdefault(owner, []).append(task)
+                owner_positions.setdefault(owner, []).append(pos)
+                status_positions.setdefault(task.get("status"), []).append(pos)
+        self._task_index_cache = _TaskIndex(raw, by_owner, owner_positions, status_positions)
+        return self._task_index_cache
+
+    def _tasks_by_owner(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Group the cached tasks by owner; rebuilt only when tasks.json changes."""
+        return self._task_indexes().by_owner
+
+    def _read_state_log(self, path: Path, field: str) -> Dict[str, Any]:
+        """Return the last logged *field* value per agent from an append-only state log.
+
+        The log only grows between compactions, so a changed log is read
+        from the offset parsed last time rather than from the start. The
+        first line is kept to tell a log recreated after compaction (which
+        may reuse the inode) from one that was appended to.
+        """
+        key = str(path)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            self._json_cache.pop(key, None)
+            return {}
+        # Appends can land within one mtime tick, so the size is part of the key.
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._json_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            self._json_cache.pop(key, None)
+            return {}
+        try:
+            latest: Dict[str, Any] = {}
+            offset = 0
+            head = b""
+            if cached is not None and len(cached) == 4 and cached[2] <= st.st_size:
+                _, previous, prev_offset, prev_head = cached
+                if os.pread(fd, len(prev_head), 0) == prev_head:
+                    latest = dict(previous)
+                    offset = prev_offset
+                    head = prev_head
+            os.lseek(fd, offset, os.SEEK_SET)
+            chunks = []
+            while True:
+                chunk = os.read(fd, 1 << 16)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        finally:
+            os.close(fd)
+        data = b"".join(chunks)
+        # Leave a torn final line (an append in progress) for the next read.
+        end = data.rfind(b"\n") + 1
+        if not head:
+            head = data[: data.find(b"\n") + 1]
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning("Failed to decode JSONL line in %s: %s", path, e)
+                continue
+            agent = record.get("agent") if isinstance(record, dict) else None
+            if isinstance(agent, str) and field in record:
+                latest[agent] = record[field]
+        self._json_cache[key] = (stamp, latest, offset + end, head)
+        return latest
+
+    def _read_agents(self, make_copy: bool = False) -> Any:
+        """Read agents.json with pending presence-log entries folded in."""
+        agents = self._read_json(self.agents_path)
+        presence = self._read_state_log(self.agent_presence_log_path, "last_seen")
+        if presence and isinstance(agents, dict):
+            cached = self._agents_overlay_cache
+            if cached is not None and cached[0] is agents and cached[1] is presence:
+                agents = cached[2]
+            else:
+                merged = dict(agents)
+                for agent, last_seen in presence.items():
+                    entry = merged.get(agent)
+                    if (
+                        not isinstance(entry, dict)
+                        or not isinstance(last_seen, str)
+                        or str(entry.get("last_seen", "")) >= last_seen
+                    ):
+                        continue
+                    merged[agent] = {**entry, "status": "active", "last_seen": last_seen}
+                self._agents_overlay_cache = (agents, presence, merged)
+                agents = merged
+        return self._lazy_copy(agents) if make_copy else agents
+
+    def _read_cursors(self, make_copy: bool = False) -> Any:
+        """Read event_cursors.json with pending cursor-log entries folded in."""
+        cursors = self._read_json(self.cursors_path)
+        logged = self._read_state_log(self.event_cursor_log_path, "cursor")
+        if logged and isinstance(cursors, dict):
+            cached = self._cursors_overlay_cache
+            if cached is not None and cached[0] is cursors and cached[1] is logged:
+                cursors = cached[2]
+            else:
+                merged = dict(cursors)
+                merged.update((agent, value) for agent, value in logged.items() if isinstance(value, int))
+                self._cursors_overlay_cache = (cursors, logged, merged)
+                cursors = merged
+        return self._lazy_copy(cursors) if make_copy else cursors
+
+    def _read_state_snapshot(self, snapshot_path: Path, make_copy: bool = False) -> Any:
+        """Read a log-backed snapshot file with its pending log folded in."""
+        if snapshot_path == self.agents_path:
+            return self._read_agents(make_copy=make_copy)
+        return self._read_cursors(make_copy=make_copy)
+
+    def _append_state_log_unlocked(self, snapshot_path: Path, record: Dict[str, Any]) -> None:
+        """Append one record to *snapshot_path*'s log, compacting when it grows stale or large."""
+        with self._state_logs[snapshot_path].open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(record) + "\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+            log_size = fh.tell()
+        try:
+            snapshot_age = time.time() - snapshot_path.stat().st_mtime
+        except OSError:
+            snapshot_age = 0.0
+        if log_size > _STATE_LOG_MAX_BYTES or snapshot_age > _STATE_LOG_MAX_AGE_SECONDS:
+            self._compact_state_log_unlocked(snapshot_path)
+        elif snapshot_path == self.agents_path:
+            self._publish_agents_snapshot()
+
+    def _compact_state_log_unlocked(self, snapshot_path: Path) -> None:
+        """Fold a state log into its snapshot file (caller must hold _state_lock)."""
+        snapshot = self._read_state_snapshot(snapshot_path, make_copy=True)
+        if isinstance(snapshot, dict):
+            self._write_json(snapshot_path, snapshot)
+
     def _read_jsonl_file(self, path: Path) -> List[Dict[str, Any]]:
         """Reads a .jsonl file and returns a list of dictionaries."""
         if not path.is_file():
@@ -4588,7 +5184,8 @@ class Orchestrator:
             if not isinstance(tasks, list):
                 return
             agents_with_work: set = set()
-            for t in tasks:
+            # Read-only pass: iterate raw storage so lazy copies stay uncopied.
+            for t in list.__iter__(tasks):
                 if str(t.get("status", "")).strip().lower() in {"assigned", "bug_open"}:
                     owner = str(t.get("owner", "")).strip()
                     if owner:
@@ -4604,14 +5201,100 @@ class Orchestrator:
             pass  # Best-effort; never block task mutations
 
     def _write_json(self, path: Path, value: Any) -> None:
+        # Lazy copies serialise their raw storage; iterating them would
+        # deep-copy every untouched item just to write it out.
+        if isinstance(value, _LazyCopyList):
+            value = list.copy(value)
+        elif isinstance(value, _LazyCopyDict):
+            value = dict(dict.items(value))
+        if self._in_batch():
+            self._batch_writes[str(path)] = (path, value)
+            return
+        self._publish_json(path, self._stage_json(path, value))
+
+    def _stage_json(self, path: Path, value: Any) -> Path:
+        """Serialise *value* to a durable temp file next to *path* and return it.
+
+        Uses a raw fd rather than a buffered file object: one write() per
+        snapshot and none of open()'s fstat/isatty probing.
+        """
         tmp = path.with_suffix(path.suffix + ".tmp")
-        with tmp.open("w", encoding="utf-8") as fh:
-            json.dump(value, fh, indent=2)
-            fh.flush()
-            os.fsync(fh.fileno())
+        if path == self.tasks_path:
+            self._staged_tasks = None
+        if orjson is not None and path == self.tasks_path and type(value) is list:
+            payload = self._encode_tasks(tmp, value)
+        elif orjson is not None:
+            payload = orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(value, indent=2).encode("utf-8")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+            if hasattr(os, "posix_fadvise"):
+                # Pages are already on disk; don't let short-lived snapshots
+                # crowd the page cache.
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+        return tmp
+
+    def _encode_tasks(self, tmp: Path, tasks: list) -> bytes:
+        """Encode a tasks.json snapshot, re-encoding only tasks that changed.
+
+        Items still owned by the read cache reuse the bytes they were last
+        written as, which relies on cached task dicts never being edited in
+        place (see _tasks_view); everything else is encoded and parsed back into a
+        detached copy so the published list can seed the cache without
+        sharing dicts with callers. Output matches ``orjson.OPT_INDENT_2``.
+        """
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        fragments = self._task_fragments
+        fresh: Dict[int, Tuple[Any, bytes]] = {}
+        detached = []
+        parts = []
+        for item in tasks:
+            entry = fragments.get(id(item))
+            if entry is None or entry[0] is not item:
+                # Nest one level: JSON strings never contain raw newlines.
+                part = orjson.dumps(item, option=option).replace(b"\n", b"\n  ")
+                item = orjson.loads(part)
+                if isinstance(item, dict):
+                    self._intern_fields((item,), _INTERNED_TASK_FIELDS)
+                entry = (item, part)
+            fresh[id(entry[0])] = entry
+            detached.append(entry[0])
+            parts.append(entry[1])
+        self._staged_tasks = (tmp, detached, fresh)
+        if not parts:
+            return b"[]"
+        return b"[\n  " + b",\n  ".join(parts) + b"\n]"
+
+    def _publish_json(self, path: Path, tmp: Path) -> None:
+        """Atomically swap a staged temp file into place."""
         tmp.replace(path)
         # Invalidate cache so next _read_json re-reads from disk.
         self._json_cache.pop(str(path), None)
+        staged = self._staged_tasks
+        if staged is not None and path == self.tasks_path and staged[0] == tmp:
+            # The staged list is exactly what landed on disk; keep it so
+            # the next read need not reparse the whole file.
+            self._staged_tasks = None
+            self._task_fragments = staged[2]
+            try:
+                st = path.stat()
+                self._written_tasks = (st.st_mtime_ns, st.st_size, staged[1])
+            except OSError:
+                self._written_tasks = None
+        log_path = self._state_logs.get(path)
+        if log_path is not None:
+            # A full snapshot write supersedes any pending log records.
+            log_path.unlink(missing_ok=True)
+            self._json_cache.pop(str(log_path), None)
+        if path == self.agents_path:
+            self._publish_agents_snapshot()
 
     def _append_jsonl(self, path: Path, value: Dict[str, Any]) -> None:
         """Appends a dictionary as a new line in a .jsonl file."""
@@ -4619,8 +5302,11 @@ class Orchestrator:
             fh.write(json.dumps(value) + "\n")
         self._json_cache.pop(str(path), None)
 
-    @staticmethod
-    def _now() -> str:
+    def _now(self) -> str:
+        if self._batch_depth and self._in_batch():
+            if self._batch_now is None:
+                self._batch_now = datetime.now(timezone.utc).isoformat()
+            return self._batch_now
         return datetime.now(timezone.utc).isoformat()
 
     def orchestrator_record_decision(
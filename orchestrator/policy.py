@@ -1,45 +1,147 @@
 from __future__ import annotations
 
+import copy
+import dataclasses
+import functools
 import json
-from dataclasses import dataclass
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
-@dataclass(frozen=True)
+
+# Default equal-rights trio.
+_DEFAULT_VOTERS: Tuple[str, ...] = ("codex", "claude_code", "gemini")
+
+
+@dataclass(frozen=True, slots=True)
 class Policy:
     name: str
-    roles: Dict[str, str]
-    routing: Dict[str, str]
-    decisions: Dict[str, Any]
+    roles: Mapping[str, str]
+    routing: Mapping[str, str]
+    decisions: Mapping[str, Any]
     triggers: Dict[str, Any]
+    # Derived from the fields above once in __post_init__.
+    _manager: str = field(init=False, repr=False, compare=False)
+    _default_owner: str = field(init=False, repr=False, compare=False)
+    _architecture_mode: str = field(init=False, repr=False, compare=False)
+    _voters: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_manager", self.roles.get("manager", "codex"))
+        object.__setattr__(self, "_default_owner", self.routing.get("default", self._manager))
+        architecture = self.decisions.get("architecture", {})
+        members = architecture.get("members", [])
+        mode = architecture.get("mode", "consensus")
+        if not isinstance(mode, str):
+            raise ValueError(f"decisions.architecture.mode must be a string, got {type(mode).__name__}")
+        object.__setattr__(self, "_architecture_mode", mode)
+        object.__setattr__(self, "_voters", tuple(members) if members else _DEFAULT_VOTERS)
 
     @staticmethod
     def load(path: Path) -> "Policy":
-        with path.open("r", encoding="utf-8") as fh:
-            raw = json.load(fh)
+        """Load a policy file, reusing the parsed sections while it is unchanged.
 
-        return Policy(
-            name=raw.get("name", path.stem),
-            roles=raw.get("roles", {}),
-            routing=raw.get("routing", {}),
-            decisions=raw.get("decisions", {}),
-            triggers=raw.get("triggers", {}),
-        )
+        roles, routing and decisions are read-only and shared with other
+        callers that loaded the same file. Each call gets its own deep copy of
+        triggers, so tuning a trigger (nested ones included) does not leak
+        into other instances.
+        """
+        st = os.stat(path)
+        cached = _load_cached(os.fspath(path), st.st_mtime_ns, st.st_size)
+        return dataclasses.replace(cached, triggers=copy.deepcopy(cached.triggers))
+
+    @staticmethod
+    def load_many(paths: Sequence[Path]) -> List["Policy"]:
+        """Load several policy files, overlapping their reads on a thread pool.
+
+        Prefer this over a loop of load() when reading more than one file;
+        results are returned in the order of *paths*.
+        """
+        if len(paths) <= 1:
+            return [Policy.load(path) for path in paths]
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+            return list(pool.map(Policy.load, paths))
 
     def manager(self) -> str:
-        return self.roles.get("manager", "codex")
+        return self._manager
 
     def task_owner_for(self, workstream: str) -> str:
-        return self.routing.get(workstream, self.routing.get("default", self.manager()))
+        return self.routing.get(workstream, self._default_owner)
 
     def architecture_mode(self) -> str:
-        return str(self.decisions.get("architecture", {}).get("mode", "consensus"))
+        return self._architecture_mode
+
+    def voters(self) -> Sequence[str]:
+        return self._voters
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(path: str, mtime_ns: int, size: int) -> Policy:
+    """Parse *path*; the stat fields key the cache and size the read."""
+    data = _read_policy_bytes(path, size)
+    raw = orjson.loads(data) if orjson is not None else json.loads(data)
+
+    return Policy(
+        name=raw.get("name", Path(path).stem),
+        roles=_frozen(_interned(raw.get("roles", {}))),
+        routing=_frozen(_interned(raw.get("routing", {}))),
+        decisions=_frozen(raw.get("decisions", {})),
+        triggers=raw.get("triggers", {}),
+    )
+
+
+def _interned(mapping: Any) -> Any:
+    """Return *mapping* with its string keys and values sys.intern'ed.
+
+    Agent and workstream names are compared and hashed all over the
+    engine; interning makes equal names share one object.
+    """
+    if not isinstance(mapping, dict):
+        return mapping
+    return {
+        sys.intern(k) if type(k) is str else k: sys.intern(v) if type(v) is str else v
+        for k, v in mapping.items()
+    }
+
+
+def _frozen(value: Any) -> Any:
+    """Return a read-only copy of *value* so cached policies can be shared.
+
+    Dicts become read-only views and lists become tuples, all the way down.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _frozen(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_frozen(v) for v in value)
+    return value
 
-    def voters(self) -> List[str]:
-        members = self.decisions.get("architecture", {}).get("members", [])
-        if members:
-            return members
 
-        # Default equal-rights trio.
-        return ["codex", "claude_code", "gemini"]
+def _read_policy_bytes(path: str, size: int) -> bytes:
+    """Read the whole file with one os.read() sized from the earlier stat."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if hasattr(os, "posix_fadvise"):
+            # Start readahead for a cold (e.g. network-mounted) config file.
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+        # Ask for one byte more than expected: a short read means EOF, so
+        # an unchanged file takes one syscall. Keep going if it grew.
+        want = size + 1
+        chunks = [os.read(fd, want)]
+        while len(chunks[-1]) == want:
+            want = 1 << 16
+            chunks.append(os.read(fd, want))
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
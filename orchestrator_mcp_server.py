@@ -19,10 +19,12 @@ import subprocess
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import redirect_stdout
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 # Define auto-plan interval
 AUTO_PLAN_INTERVAL_SECONDS = 86400  # 24 hours
@@ -49,19 +51,27 @@ try:
 except Exception:  # pragma: no cover
     fcntl = None
 
-# Force line-buffered stdout/stderr for MCP JSON-RPC transport.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Force line-buffered stdout/stderr for MCP JSON-RPC transport by
+# reconfiguring the existing wrappers rather than opening a second one per fd.
 # Skip when running under a test harness (pytest captures stdout via wrapper
-# objects whose fileno() may be invalid or shared).
+# objects that are not plain text wrappers).
 if not hasattr(sys, "_called_from_test") and os.environ.get("PYTEST_CURRENT_TEST") is None:
-    try:
-        sys.stdout = os.fdopen(sys.stdout.fileno(), "w", 1)
-        sys.stderr = os.fdopen(sys.stderr.fileno(), "w", 1)
-    except (OSError, AttributeError):
-        pass
+    for _stream in (sys.stdout, sys.stderr):
+        try:
+            _stream.reconfigure(line_buffering=True, write_through=True)
+        except (OSError, AttributeError, ValueError):
+            pass
 
 __version__ = "0.1.0"
 SCRIPT_DIR = Path(__file__).resolve().parent
-STARTUP_CWD = Path.cwd().resolve()
+# getcwd() already returns a symlink-free path; _select_root_dir resolves
+# it only if the cwd is the root it picks.
+STARTUP_CWD = Path.cwd()
 ORCHESTRATOR_ROOT_RAW = os.getenv("ORCHESTRATOR_ROOT", "").strip()
 EXPECTED_ROOT_RAW = os.getenv("ORCHESTRATOR_EXPECTED_ROOT", "").strip()
 ENFORCE_SHARED_BINDING = os.getenv("ORCHESTRATOR_ENFORCE_SHARED_BINDING", "1").strip().lower() not in {"0", "false", "no"}
@@ -321,11 +331,54 @@ def _server_binding_health() -> Dict[str, Any]:
     }
 
 
-def send_response(response: Dict[str, Any]) -> None:
-    print(json.dumps(response), flush=True)
+def _dumps(value: Any) -> bytes:
+    """Compact UTF-8 JSON, via orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers beyond 64 bits; let stdlib json have a go.
+            pass
+    return json.dumps(value).encode("utf-8")
+
+
+def _write_message(payload: bytes) -> None:
+    """Write one newline-framed JSON-RPC message to stdout and flush it.
+
+    Goes straight to the binary buffer under the text layer, skipping a
+    str round trip; text-only streams (e.g. redirected in tests) get str.
+    """
+    out = sys.stdout
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:
+        out.write(payload.decode("utf-8") + "\n")
+        out.flush()
+        return
+    # Drain anything printed through the text layer first to keep order.
+    out.flush()
+    buffer.write(payload + b"\n")
+    buffer.flush()
+
+
+def _encode_response(response: Any) -> bytes:
+    """Encode a response object, or a batch's list of them, without framing."""
+    if type(response) is dict and response.get("result") is _TOOLS_LIST_RESULT and len(response) == 3:
+        # Splice the id into the pre-serialised catalogue.
+        return _TOOLS_LIST_RESPONSE_HEAD + _dumps(response["id"]) + _TOOLS_LIST_RESPONSE_TAIL
+    return _dumps(response)
+
+
+def send_response(response: Any) -> None:
+    """Write a response object, or a batch's list of them, as one message."""
+    _write_message(_encode_response(response))
 
 
 def _json_text(value: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
     return json.dumps(value, indent=2)
 
 
@@ -433,7 +486,7 @@ def _parse_json_argument(raw: Any, expected: str) -> Any:
     if isinstance(raw, (dict, list)):
         return raw
     if isinstance(raw, str) and raw.strip():
-        parsed = json.loads(raw)
+        parsed = orjson.loads(raw) if orjson is not None else json.loads(raw)
         if expected == "object" and not isinstance(parsed, dict):
             raise ValueError("Expected JSON object")
         if expected == "array" and not isinstance(parsed, list):
@@ -632,7 +685,7 @@ def handle_initialize(request_id: Any) -> Dict[str, Any]:
     }
 
 
-def handle_tools_list(request_id: Any) -> Dict[str, Any]:
+def _tool_definitions() -> List[Dict[str, Any]]:
     tools = [
         {
             "name": "orchestrator_guide",
@@ -1414,7 +1467,20 @@ def handle_tools_list(request_id: Any) -> Dict[str, Any]:
         },
     ]
 
-    return {"jsonrpc": "2.0", "id": request_id, "result": {"tools": tools}}
+    return tools
+
+
+# The tool catalogue is static: build it, and its JSON, once at import.
+# Shared by every tools/list response, so callers must not mutate it.
+_TOOLS_LIST_RESULT: Dict[str, Any] = {"tools": _tool_definitions()}
+# Encoded response split around its id (the first ``null``), for send_response.
+_TOOLS_LIST_RESPONSE_HEAD, _TOOLS_LIST_RESPONSE_TAIL = _dumps(
+    {"jsonrpc": "2.0", "id": None, "result": _TOOLS_LIST_RESULT}
+).split(b"null", 1)
+
+
+def handle_tools_list(request_id: Any) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "result": _TOOLS_LIST_RESULT}
 
 
 def _ok(request_id: Any, payload: Any) -> Dict[str, Any]:
@@ -1608,9 +1674,39 @@ def _touch_wakeup_signals(created_tasks: list) -> None:
             pass
 
 
+# Task statuses that still need work; drives per-owner pending counts and
+# the contract digest in _manager_cycle.
+_PENDING_STATUSES = frozenset({"assigned", "in_progress", "reported", "bug_open", "blocked"})
+_RECONNECT_STATUSES = frozenset({"in_progress", "blocked"})
+_REVIEW_CLEARED_STATUSES = frozenset({"approved", "waived"})
+_CONTRACT_FIELDS = itemgetter("id", "owner", "title")
+
+
+def _read_report_files(reports_dir: str, task_ids: List[str]) -> List[Optional[bytes]]:
+    """Return each task's report file contents (None if missing), in order.
+
+    One open() per file both checks for and reads it; several files are
+    read on a small thread pool so their I/O overlaps.
+    """
+
+    def _read(task_id: str) -> Optional[bytes]:
+        try:
+            with open(os.path.join(reports_dir, f"{task_id}.json"), "rb") as fh:
+                return fh.read()
+        except FileNotFoundError:
+            return None
+
+    if len(task_ids) <= 1:
+        return [_read(task_id) for task_id in task_ids]
+    with ThreadPoolExecutor(max_workers=min(8, len(task_ids))) as pool:
+        return list(pool.map(_read, task_ids))
+
+
 def _manager_cycle(strict: bool) -> Dict[str, Any]:
     logger.info("manager_cycle.start strict=%s", strict)
     stale_after_seconds = ORCH._heartbeat_timeout_seconds()
+    # Resolved once: every action this cycle is attributed to the same leader.
+    manager = ORCH.manager_agent()
     tasks = ORCH.list_tasks()
     processed: List[Dict[str, Any]] = []
     deferred: List[Dict[str, Any]] = []
@@ -1628,22 +1724,25 @@ def _manager_cycle(strict: bool) -> Dict[str, Any]:
         limit=20,
     )
 
-    for task in tasks:
-        if task.get("status") != "reported":
-            continue
-
-        report_path = ORCH.bus.reports_dir / f"{task['id']}.json"
-        if not report_path.exists():
+    reported = [task for task in tasks if task.get("status") == "reported"]
+    # Report files are read up front, concurrently; validation below stays
+    # serial and in task order since it mutates shared orchestrator state
+    # and quality gates may run commands in the shared worktree.
+    report_files = _read_report_files(
+        os.fspath(ORCH.bus.reports_dir), [str(task["id"]) for task in reported]
+    )
+    for task, report_bytes in zip(reported, report_files):
+        if report_bytes is None:
             result = ORCH.validate_task(
                 task_id=task["id"],
                 passed=False,
                 notes="Missing report file",
-                source=ORCH.manager_agent(),
+                source=manager,
             )
             processed.append({"task_id": task["id"], "passed": False, "result": result})
             continue
 
-        report = json.loads(report_path.read_text(encoding="utf-8"))
+        report = orjson.loads(report_bytes) if orjson is not None else json.loads(report_bytes)
         summary = report.get("test_summary", {}) or {}
         failed_tests = int(summary.get("failed", 1))
         has_command = bool(str(summary.get("command", "")).strip())
@@ -1652,7 +1751,7 @@ def _manager_cycle(strict: bool) -> Dict[str, Any]:
         strict_requirements_met = bool(has_commit and has_command) if strict else True
         review_gate = task.get("review_gate") if isinstance(task.get("review_gate"), dict) else {}
         review_status = str(review_gate.get("status", "")).strip().lower()
-        review_approved = review_status in {"approved", "waived"}
+        review_approved = review_status in _REVIEW_CLEARED_STATUSES
         review_rejected = review_status == "rejected"
 
         # Check if wingman review is required but not yet done
@@ -1716,29 +1815,28 @@ def _manager_cycle(strict: bool) -> Dict[str, Any]:
             task_id=task["id"],
             passed=passed,
             notes=notes,
-            source=ORCH.manager_agent(),
+            source=manager,
             quality_gate_outcome=gate_outcome,
         )
         processed.append({"task_id": task["id"], "passed": passed, "result": result})
 
-    reconnect_statuses = {"in_progress", "blocked"}
     reconnect_candidates: List[str] = []
-    seen_candidates = set()
     team_members = set(ORCH.get_roles().get("team_members", []) or [])
+    reconnect_owners: List[str] = []
     for task in tasks:
-        if task.get("status") not in reconnect_statuses:
+        if task.get("status") not in _RECONNECT_STATUSES:
             continue
         owner = str(task.get("owner", "")).strip()
-        if not owner or owner == ORCH.manager_agent():
+        if not owner or owner == manager:
             continue
         if team_members and owner not in team_members:
             continue
-        if owner in seen_candidates:
-            continue
-        diag = ORCH._team_member_connect_diagnostic(team_member=owner, stale_after_seconds=stale_after_seconds)
-        if not bool(diag.get("active")):
+        if owner not in reconnect_owners:
+            reconnect_owners.append(owner)
+    owner_diagnostics = ORCH._diagnose_all(stale_after_seconds=stale_after_seconds, team_members=reconnect_owners)
+    for owner in reconnect_owners:
+        if not bool(owner_diagnostics[owner].get("active")):
             reconnect_candidates.append(owner)
-            seen_candidates.add(owner)
 
     auto_connect: Dict[str, Any] = {
         "attempted": False,
@@ -1752,7 +1850,7 @@ def _manager_cycle(strict: bool) -> Dict[str, Any]:
         reconnect_poll = int(ORCH.policy.triggers.get("manager_cycle_auto_connect_poll_seconds", 2))
         reconnect_poll = max(1, min(reconnect_poll, 10))
         connect_result = ORCH.connect_team_members(
-            source=ORCH.manager_agent(),
+            source=manager,
             team_members=reconnect_candidates,
             timeout_seconds=reconnect_timeout,
             poll_interval_seconds=reconnect_poll,
@@ -1771,21 +1869,21 @@ def _manager_cycle(strict: bool) -> Dict[str, Any]:
 
     blocker_stale_seconds = int(ORCH.policy.triggers.get("blocker_auto_resolve_stale_seconds", 3600))
     auto_resolved_blockers = ORCH.auto_resolve_stale_blockers(
-        source=ORCH.manager_agent(),
+        source=manager,
         stale_after_seconds=blocker_stale_seconds,
     )
 
     stale_reassignments = ORCH.reassign_stale_tasks_to_active_workers(
-        source=ORCH.manager_agent(),
+        source=manager,
         stale_after_seconds=stale_after_seconds,
         include_blocked=True,
     )
     claim_override_noops = ORCH.emit_stale_claim_override_noops(
-        source=ORCH.manager_agent(),
+        source=manager,
         timeout_seconds=int(ORCH.policy.triggers.get("manager_execute_noop_timeout_seconds", 60)),
     )
     lease_recoveries = ORCH.recover_expired_task_leases(
-        source=ORCH.manager_agent(),
+        source=manager,
         stale_after_seconds=stale_after_seconds,
     )
     stale_requeues = ORCH.requeue_stale_in_progress_tasks(stale_after_seconds=stale_after_seconds)
@@ -1794,28 +1892,32 @@ def _manager_cycle(strict: bool) -> Dict[str, Any]:
     latest_tasks = ORCH.list_tasks()
     open_blockers = ORCH.list_blockers(status="open")
     by_owner: Dict[str, Dict[str, int]] = {}
-    pending_statuses = {"assigned", "in_progress", "reported", "bug_open", "blocked"}
+    # Compact task contract digest, republished each manager cycle to reduce
+    # context drift; built in the same pass as the per-owner counts.
+    contracts = []
     for task in latest_tasks:
         owner = task.get("owner", "unknown")
+        status = task.get("status")
         owner_bucket = by_owner.setdefault(owner, {"pending": 0, "done": 0})
-        if task.get("status") in pending_statuses:
+        if status in _PENDING_STATUSES:
             owner_bucket["pending"] += 1
-        if task.get("status") == "done":
+            try:
+                task_id, task_owner, title = _CONTRACT_FIELDS(task)
+            except KeyError:
+                # Hand-edited or legacy tasks may lack a field; publish None for it.
+                task_id, task_owner, title = task.get("id"), task.get("owner"), task.get("title")
+            contracts.append(
+                {
+                    "task_id": task_id,
+                    "owner": task_owner,
+                    "title": title,
+                    "status": status,
+                    "acceptance_criteria": task.get("acceptance_criteria", []),
+                }
+            )
+        elif status == "done":
             owner_bucket["done"] += 1
 
-    # Republish compact task contract digest each manager cycle to reduce context drift.
-    contracts = [
-        {
-            "task_id": task.get("id"),
-            "owner": task.get("owner"),
-            "title": task.get("title"),
-            "status": task.get("status"),
-            "acceptance_criteria": task.get("acceptance_criteria", []),
-        }
-        for task in latest_tasks
-        if task.get("status") in pending_statuses
-    ]
-
     last_contracts_path = ORCH.state_dir / "last_published_contracts.json"
     last_contracts = []
     if last_contracts_path.exists():
@@ -1827,7 +1929,7 @@ def _manager_cycle(strict: bool) -> Dict[str, Any]:
     if contracts != last_contracts:
         ORCH.publish_event(
             event_type="manager.task_contracts",
-            source=ORCH.manager_agent(),
+            source=manager,
             payload={"contracts": contracts},
         )
         try:
@@ -1837,7 +1939,7 @@ def _manager_cycle(strict: bool) -> Dict[str, Any]:
     elif not contracts:
         ORCH.publish_event(
             event_type="manager.idle_heartbeat",
-            source=ORCH.manager_agent(),
+            source=manager,
             payload={"message": "No pending tasks."},
         )
 
@@ -1878,7 +1980,7 @@ def _manager_cycle(strict: bool) -> Dict[str, Any]:
         if last_auto_plan_timestamp is None or elapsed_seconds >= AUTO_PLAN_INTERVAL_SECONDS:
             try:
                 auto_plan = ORCH.plan_from_roadmap(
-                    source=ORCH.manager_agent(),
+                    source=manager,
                     limit=int(ORCH.policy.triggers.get("auto_plan_limit", 5)),
                     team_id=str(ORCH.policy.triggers.get("auto_plan_team_id", "")) or None,
                 )
@@ -1976,6 +2078,7 @@ def _auto_manager_loop() -> None:
         ORCH.state_dir / "tasks.json",
         ORCH.state_dir / "blockers.json",
         ORCH.state_dir / "agents.json",
+        ORCH.agent_presence_log_path,
     )
     _last_mtimes: Dict[str, float] = {}
     _last_full_cycle: float = 0.0
@@ -2015,8 +2118,7 @@ def _auto_manager_loop() -> None:
         OR if auto-planning might create new work from the roadmap backlog."""
         try:
             tasks = ORCH.list_tasks()
-            actionable_statuses = {"reported", "in_progress", "blocked", "bug_open", "assigned"}
-            if any(t.get("status") in actionable_statuses for t in tasks):
+            if any(t.get("status") in _PENDING_STATUSES for t in tasks):
                 return True
             open_blockers = ORCH.list_blockers(status="open")
             if open_blockers:
@@ -2105,7 +2207,8 @@ def _start_auto_manager_loop() -> None:
 def _percent(done: int, total: int) -> int:
     if total <= 0:
         return 0
-    return int(round((done / total) * 100))
+    # Integer round-half-up; no float division or banker's rounding.
+    return (done * 100 + (total >> 1)) // total
 
 
 def _parse_iso(ts: Any) -> Optional[datetime]:
@@ -2437,12 +2540,17 @@ def _aggregate_by_project_root(
 
 def _status_metrics(tasks: List[Dict[str, Any]], bugs_open: List[Dict[str, Any]], blockers_open: List[Dict[str, Any]]) -> Dict[str, Any]:
     now = datetime.now(timezone.utc)
-    done_tasks = [t for t in tasks if t.get("status") == "done"]
-    reported_tasks = [t for t in tasks if t.get("status") == "reported"]
-    in_progress_tasks = [t for t in tasks if t.get("status") == "in_progress"]
-    blocked_tasks = [t for t in tasks if t.get("status") == "blocked"]
-    superseded_tasks = [t for t in tasks if t.get("status") == "superseded"]
-    archived_tasks = [t for t in tasks if t.get("status") == "archived"]
+    # One pass buckets tasks by status and collects owners.
+    tasks_by_status: Dict[Any, List[Dict[str, Any]]] = {}
+    unique_agents = set()
+    for task in tasks:
+        tasks_by_status.setdefault(task.get("status"), []).append(task)
+        owner = task.get("owner")
+        if owner:
+            unique_agents.add(owner)
+    done_tasks = tasks_by_status.get("done", [])
+    reported_tasks = tasks_by_status.get("reported", [])
+    in_progress_tasks = tasks_by_status.get("in_progress", [])
 
     time_to_claim = [v for v in (_seconds_between(t.get("assigned_at") or t.get("created_at"), t.get("claimed_at")) for t in tasks) if v is not None]
     time_to_report = [v for v in (_seconds_between(t.get("claimed_at"), t.get("reported_at")) for t in tasks) if v is not None]
@@ -2450,12 +2558,6 @@ def _status_metrics(tasks: List[Dict[str, Any]], bugs_open: List[Dict[str, Any]]
 
     stale_in_progress = 0
     stale_reported = 0
-    unique_agents = set()
-    for task in tasks:
-        owner = task.get("owner")
-        if owner:
-            unique_agents.add(owner)
-
     for task in in_progress_tasks:
         ts = _parse_iso(task.get("claimed_at") or task.get("updated_at"))
         if ts and (now - ts).total_seconds() > 1800:
@@ -2494,9 +2596,9 @@ def _status_metrics(tasks: List[Dict[str, Any]], bugs_open: List[Dict[str, Any]]
             "tasks_done": len(done_tasks),
             "tasks_reported": len(reported_tasks),
             "tasks_in_progress": len(in_progress_tasks),
-            "tasks_blocked": len(blocked_tasks),
-            "tasks_superseded": len(superseded_tasks),
-            "tasks_archived": len(archived_tasks),
+            "tasks_blocked": len(tasks_by_status.get("blocked", ())),
+            "tasks_superseded": len(tasks_by_status.get("superseded", ())),
+            "tasks_archived": len(tasks_by_status.get("archived", ())),
             "completion_rate_percent": _percent(len(done_tasks), len(tasks)),
             "tasks_done_per_hour": tasks_per_hour,
         },
@@ -2579,6 +2681,68 @@ def _suggest_recovery_actions(
     return actions
 
 
+def _parse_project_identity(root: Path) -> Dict[str, str]:
+    meta = {"project_name": root.name, "version_current": "-", "version_name": "-"}
+    project_yaml = root / "project.yaml"
+    if not project_yaml.exists():
+        return meta
+    try:
+        import yaml  # type: ignore
+
+        data = yaml.safe_load(project_yaml.read_text(encoding="utf-8")) or {}
+        if isinstance(data, dict):
+            if isinstance(data.get("name"), str) and data["name"].strip():
+                meta["project_name"] = data["name"].strip()
+            version = data.get("version")
+            if isinstance(version, dict):
+                if isinstance(version.get("current"), str) and version["current"].strip():
+                    meta["version_current"] = version["current"].strip()
+                if isinstance(version.get("name"), str) and version["name"].strip():
+                    meta["version_name"] = version["name"].strip()
+    except Exception:
+        text = project_yaml.read_text(encoding="utf-8", errors="ignore")
+        name_match = re.search(r"^name:\s*(.+)$", text, flags=re.MULTILINE)
+        current_match = re.search(r"^\s*current:\s*(.+)$", text, flags=re.MULTILINE)
+        version_name_match = re.search(r'^\s{2}name:\s*"?(.*?)"?\s*$', text, flags=re.MULTILINE)
+        if name_match:
+            meta["project_name"] = name_match.group(1).strip().strip('"')
+        if current_match:
+            meta["version_current"] = current_match.group(1).strip().strip('"')
+        if version_name_match:
+            meta["version_name"] = version_name_match.group(1).strip().strip('"')
+    return meta
+
+
+# display name, role label, provider, type label
+_AGENT_PROFILES: Dict[str, Tuple[str, str, str, str]] = {
+    "codex": ("Codex", "Leader/Manager", "OpenAI", "Codex CLI"),
+    "claude_code": ("Claude Code", "Implementation Worker", "Anthropic", "Claude Code"),
+    "ccm": ("Claude Wingman", "Wingman/Reviewer", "Anthropic", "Claude Code"),
+    "gemini": ("Gemini", "Worker", "Google", "Gemini CLI"),
+}
+_REPORT_SEP = "\u2500" * 70
+_REPORT_THICK_SEP = "\u2550" * 70
+
+# (root, project.yaml stat) -> parsed identity; the live status report is
+# polled on a cadence while project.yaml rarely changes.
+_PROJECT_IDENTITY_CACHE: Optional[Tuple[Tuple[Any, ...], Dict[str, str]]] = None
+
+
+def _project_identity(root: Path) -> Dict[str, str]:
+    global _PROJECT_IDENTITY_CACHE
+    try:
+        st = os.stat(root / "project.yaml")
+        key: Tuple[Any, ...] = (root, st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = (root, None, None)
+    cached = _PROJECT_IDENTITY_CACHE
+    if cached is not None and cached[0] == key:
+        return dict(cached[1])
+    meta = _parse_project_identity(root)
+    _PROJECT_IDENTITY_CACHE = (key, meta)
+    return dict(meta)
+
+
 def _live_status_report(args: Dict[str, Any]) -> Dict[str, Any]:
     tasks = ORCH.list_tasks()
     blockers_open = ORCH.list_blockers(status="open")
@@ -2587,33 +2751,58 @@ def _live_status_report(args: Dict[str, Any]) -> Dict[str, Any]:
     agents_all = ORCH.list_agents(active_only=False)
     by_agent = {item.get("agent"): item for item in agents_all}
 
+    # One pass over tasks for every count, focus task and bucket below.
     total_tasks = len(tasks)
-    done_tasks = len([task for task in tasks if task.get("status") == "done"])
-    reported_tasks = [task for task in tasks if task.get("status") == "reported"]
-    reported_count = len(reported_tasks)
+    done_tasks = reported_count = assigned_count = 0
+    backend_total = backend_done = frontend_total = frontend_done = 0
+    backend_focus: Optional[Dict[str, Any]] = None
+    frontend_focus: Optional[Dict[str, Any]] = None
+    backend_last: Optional[Dict[str, Any]] = None
+    frontend_last: Optional[Dict[str, Any]] = None
+    ip_tasks: List[Dict[str, Any]] = []
+    ip_ids_by_owner: Dict[Any, List[Any]] = {}
+    queued: List[Dict[str, Any]] = []
+    blocked: List[Dict[str, Any]] = []
+    for task in tasks:
+        status = task.get("status")
+        if status == "done":
+            done_tasks += 1
+        elif status == "in_progress":
+            ip_tasks.append(task)
+            ip_ids_by_owner.setdefault(task.get("owner"), []).append(task.get("id", ""))
+        elif status == "blocked":
+            blocked.append(task)
+        elif status in ("assigned", "reported", "bug_open"):
+            queued.append(task)
+            if status == "assigned":
+                assigned_count += 1
+            elif status == "reported":
+                reported_count += 1
+        workstream = task.get("workstream")
+        if workstream == "backend":
+            backend_total += 1
+            backend_last = task
+            if status == "done":
+                backend_done += 1
+            elif backend_focus is None:
+                backend_focus = task
+        elif workstream == "frontend":
+            frontend_total += 1
+            frontend_last = task
+            if status == "done":
+                frontend_done += 1
+            elif frontend_focus is None:
+                frontend_focus = task
     overall_auto = _percent(done_tasks, total_tasks)
 
-    # Wingman Lane Visibility: tasks with review_gate status 'pending' or 'rejected'
-    wingman_pending = [t for t in tasks if isinstance(t.get("review_gate"), dict) and t["review_gate"].get("status") == "pending"]
-    wingman_rejected = [t for t in tasks if isinstance(t.get("review_gate"), dict) and t["review_gate"].get("status") == "rejected"]
-    len(wingman_pending) + len(wingman_rejected)
-
     recovery_actions = _suggest_recovery_actions(tasks, blockers_open, bugs_open)
 
-    backend_tasks = [task for task in tasks if task.get("workstream") == "backend"]
-    frontend_tasks = [task for task in tasks if task.get("workstream") == "frontend"]
-    backend_done = len([task for task in backend_tasks if task.get("status") == "done"])
-    frontend_done = len([task for task in frontend_tasks if task.get("status") == "done"])
-    backend_auto = _percent(backend_done, len(backend_tasks))
-    frontend_auto = _percent(frontend_done, len(frontend_tasks))
-
-    backend_focus = next((task for task in backend_tasks if task.get("status") != "done"), None)
-    if backend_focus is None and backend_tasks:
-        backend_focus = backend_tasks[-1]
-
-    frontend_focus = next((task for task in frontend_tasks if task.get("status") != "done"), None)
-    if frontend_focus is None and frontend_tasks:
-        frontend_focus = frontend_tasks[-1]
+    backend_auto = _percent(backend_done, backend_total)
+    frontend_auto = _percent(frontend_done, frontend_total)
+    if backend_focus is None:
+        backend_focus = backend_last
+    if frontend_focus is None:
+        frontend_focus = frontend_last
 
     overall = int(args.get("overall_percent", overall_auto))
     phase_1 = int(args.get("phase_1_percent", overall))
@@ -2636,46 +2825,9 @@ def _live_status_report(args: Dict[str, Any]) -> Dict[str, Any]:
     if not frontend_task_id:
         frontend_task_id = "n/a"
 
-    def _project_identity() -> Dict[str, str]:
-        meta = {"project_name": ROOT_DIR.name, "version_current": "-", "version_name": "-"}
-        project_yaml = ROOT_DIR / "project.yaml"
-        if not project_yaml.exists():
-            return meta
-        try:
-            import yaml  # type: ignore
-
-            data = yaml.safe_load(project_yaml.read_text(encoding="utf-8")) or {}
-            if isinstance(data, dict):
-                if isinstance(data.get("name"), str) and data["name"].strip():
-                    meta["project_name"] = data["name"].strip()
-                version = data.get("version")
-                if isinstance(version, dict):
-                    if isinstance(version.get("current"), str) and version["current"].strip():
-                        meta["version_current"] = version["current"].strip()
-                    if isinstance(version.get("name"), str) and version["name"].strip():
-                        meta["version_name"] = version["name"].strip()
-        except Exception:
-            text = project_yaml.read_text(encoding="utf-8", errors="ignore")
-            name_match = re.search(r"^name:\s*(.+)$", text, flags=re.MULTILINE)
-            current_match = re.search(r"^\s*current:\s*(.+)$", text, flags=re.MULTILINE)
-            version_name_match = re.search(r'^\s{2}name:\s*"?(.*?)"?\s*$', text, flags=re.MULTILINE)
-            if name_match:
-                meta["project_name"] = name_match.group(1).strip().strip('"')
-            if current_match:
-                meta["version_current"] = current_match.group(1).strip().strip('"')
-            if version_name_match:
-                meta["version_name"] = version_name_match.group(1).strip().strip('"')
-        return meta
-
     def _agent_identity(agent: str, info: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
         metadata = info.get("metadata") if isinstance(info, dict) and isinstance(info.get("metadata"), dict) else {}
-        profiles = {
-            "codex": ("Codex", "Leader/Manager", "OpenAI", "Codex CLI"),
-            "claude_code": ("Claude Code", "Implementation Worker", "Anthropic", "Claude Code"),
-            "ccm": ("Claude Wingman", "Wingman/Reviewer", "Anthropic", "Claude Code"),
-            "gemini": ("Gemini", "Worker", "Google", "Gemini CLI"),
-        }
-        display_name, role_label, provider, type_label = profiles.get(agent, (agent, "Worker", "Unknown", "Unknown"))
+        display_name, role_label, provider, type_label = _AGENT_PROFILES.get(agent, (agent, "Worker", "Unknown", "Unknown"))
         model = metadata.get("model") if isinstance(metadata.get("model"), str) and metadata.get("model", "").strip() else "-"
         return {
             "display_name": display_name,
@@ -2685,16 +2837,10 @@ def _live_status_report(args: Dict[str, Any]) -> Dict[str, Any]:
             "model": model,
         }
 
-    project_identity = _project_identity()
+    project_identity = _project_identity(ROOT_DIR)
 
     # Unified Header for both Interactive and Headless
-    leader = str(roles.get("leader", "codex"))
-    _agent_identity(leader, by_agent.get(leader, {}))
-    team_agents = sorted(roles.get("team_members", []) or [])
-    ", ".join(_agent_identity(agent).get("display_name", agent) for agent in team_agents)
     status_state = "Active" if any(a.get("status") == "active" for a in agents_all) else "Idle"
-    len([t for t in tasks if t.get("status") == "in_progress"])
-    assigned_count = len([t for t in tasks if t.get("status") == "assigned"])
 
     # Unicode progress bar helper
     def _ubar(pct: int, w: int = 20) -> str:
@@ -2702,8 +2848,8 @@ def _live_status_report(args: Dict[str, Any]) -> Dict[str, Any]:
         fill = int(w * pct / 100)
         return "\u2588" * fill + "\u2591" * (w - fill)
 
-    sep = "\u2500" * 70
-    thick_sep = "\u2550" * 70
+    sep = _REPORT_SEP
+    thick_sep = _REPORT_THICK_SEP
 
     lines = [
         thick_sep,
@@ -2719,7 +2865,6 @@ def _live_status_report(args: Dict[str, Any]) -> Dict[str, Any]:
     # LIVE STATUS
     lines.append("")
     lines.append("\u25b6 LIVE STATUS")
-    ip_tasks = [t for t in tasks if t.get("status") == "in_progress"]
     if ip_tasks:
         for t in ip_tasks[:4]:
             own = _agent_identity(str(t.get("owner", "")), by_agent.get(str(t.get("owner", "")), {}))
@@ -2755,7 +2900,7 @@ def _live_status_report(args: Dict[str, Any]) -> Dict[str, Any]:
         tag = inst[-4:] if len(inst) >= 4 else ""
         name_tag = f"{identity['display_name']} #{tag}" if tag else identity['display_name']
 
-        ip_ids = [t.get("id","") for t in tasks if t.get("owner") == agent and t.get("status") == "in_progress"]
+        ip_ids = ip_ids_by_owner.get(agent, [])
         if ip_ids:
             activity = "working: " + ", ".join(ip_ids[:2])
             badge = "\u25cf WORKING"
@@ -2796,8 +2941,6 @@ def _live_status_report(args: Dict[str, Any]) -> Dict[str, Any]:
             lines.append(f"    {ag_display:<16} {ag_stats.get('commits',0)} commits  +{ag_stats.get('lines_added',0)}/-{ag_stats.get('lines_deleted',0)} ({ag_stats.get('net_lines',0)} net)")
 
     # WORK QUEUE
-    queued = [t for t in tasks if t.get("status") in ("assigned", "reported", "bug_open")]
-    blocked = [t for t in tasks if t.get("status") == "blocked"]
     if queued or blocked:
         lines.extend(["", sep])
         lines.append("\u2630 WORK QUEUE")
@@ -2842,796 +2985,926 @@ def _live_status_report(args: Dict[str, Any]) -> Dict[str, Any]:
     return payload
 
 
-def handle_tool_call(request_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
-    name = params.get("name")
-    args = params.get("arguments", {})
+def _handle_guide(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    if ORCH is None:
+        return _ok_and_audit(request_id, name, args, {"error": "orchestrator not initialized", "hint": "Check ORCHESTRATOR_ROOT and ORCHESTRATOR_POLICY settings."})
+    return _ok_and_audit(request_id, name, args, _guide_payload())
 
-    try:
-        if name == "orchestrator_guide":
-            if ORCH is None:
-                return _ok_and_audit(request_id, name, args, {"error": "orchestrator not initialized", "hint": "Check ORCHESTRATOR_ROOT and ORCHESTRATOR_POLICY settings."})
-            return _ok_and_audit(request_id, name, args, _guide_payload())
-
-        if name == "orchestrator_doctor":
-            stale_after = int(args.get("stale_after_seconds", 600))
-            roles: Dict[str, Any] = {"leader": None, "team_members": []}
-            manager: Optional[str] = None
-            agents: List[Dict[str, Any]] = []
-            discovered: Dict[str, Any] = {"registered_count": 0, "inferred_only_count": 0, "agents": []}
-            if ORCH is not None:
-                roles = ORCH.get_roles()
-                manager = roles.get("leader")
-                agents = ORCH.list_agents(active_only=False, stale_after_seconds=stale_after)
-                discovered = ORCH.discover_agents(active_only=False, stale_after_seconds=stale_after)
-            payload = build_doctor_payload(
-                root_dir=ROOT_DIR,
-                policy_path=POLICY_PATH,
-                policy_name=POLICY.name if POLICY is not None else POLICY_PATH.name,
-                policy_loaded=POLICY is not None,
-                binding_error=_BINDING_ERROR,
-                server_binding=_server_binding_health(),
-                runtime_source_consistency=_runtime_source_consistency(),
-                manager=manager,
-                roles=roles,
-                agents=agents,
-                discovered=discovered,
-                orch_available=ORCH is not None,
-            )
-            return _ok_and_audit(request_id, name, args, payload)
-
-        if name == "orchestrator_headless_start":
-            logger.info("headless.start project=%s leader=%s", str(args.get("project_root", "")), str(args.get("leader_agent", "")))
-            supervisor = _supervisor_from_tool_args(args if isinstance(args, dict) else {})
-            payload = _run_supervisor_action(supervisor, "start")
-            running = [p for p in payload.get("processes", []) if p.get("state") == "running"]
-            logger.info("headless.started processes=%d pids=%s", len(running), [p.get("pid") for p in running])
-            # Spawn the supervisor monitor as a detached background process so it
-            # survives MCP server restarts and continuously restarts dead workers.
-            monitor_pid = _start_supervisor_monitor(supervisor)
-            if monitor_pid:
-                payload["monitor_pid"] = monitor_pid
-                logger.info("headless.monitor started pid=%d", monitor_pid)
-            return _ok_and_audit(request_id, name, args, payload)
-
-        if name == "orchestrator_headless_stop":
-            logger.info("headless.stop project=%s", str(args.get("project_root", "")))
-            supervisor = _supervisor_from_tool_args(args if isinstance(args, dict) else {})
-            # Stop the monitor process before stopping supervised processes.
-            _stop_supervisor_monitor(supervisor.cfg.pid_dir)
-            payload = _run_supervisor_action(supervisor, "stop")
-            logger.info("headless.stopped")
-            return _ok_and_audit(request_id, name, args, payload)
-
-        if name == "orchestrator_parity_smoke":
-            checks = []
-            overall_status = "pass"
-
-            # 1. Lifecycle: Check if ORCH engine is loaded
-            if ORCH is None:
-                checks.append({"name": "engine_loaded", "status": "fail", "reason": "Orchestrator engine not initialized.", "action": "Check project root binding and configuration (ORCHESTRATOR_ROOT, ORCHESTRATOR_POLICY)."})
-                overall_status = "fail"
-            else:
-                checks.append({"name": "engine_loaded", "status": "pass", "reason": "Engine loaded successfully.", "action": None})
 
-                # 2. Status: Check roles
-                roles = ORCH.get_roles()
-                if not roles.get("leader"):
-                    checks.append({"name": "leader_assigned", "status": "fail", "reason": "No leader assigned in roles.", "action": "Agent should run orchestrator_set_role or manager_loop.sh."})
-                    overall_status = "fail"
-                else:
-                    checks.append({"name": "leader_assigned", "status": "pass", "reason": f"Leader is {roles['leader']}.", "action": None})
+def _handle_doctor(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    stale_after = int(args.get("stale_after_seconds", 600))
+    roles: Dict[str, Any] = {"leader": None, "team_members": []}
+    manager: Optional[str] = None
+    agents: List[Dict[str, Any]] = []
+    discovered: Dict[str, Any] = {"registered_count": 0, "inferred_only_count": 0, "agents": []}
+    if ORCH is not None:
+        roles = ORCH.get_roles()
+        manager = roles.get("leader")
+        agents = ORCH.list_agents(active_only=False, stale_after_seconds=stale_after)
+        discovered = ORCH.discover_agents(active_only=False, stale_after_seconds=stale_after)
+    payload = build_doctor_payload(
+        root_dir=ROOT_DIR,
+        policy_path=POLICY_PATH,
+        policy_name=POLICY.name if POLICY is not None else POLICY_PATH.name,
+        policy_loaded=POLICY is not None,
+        binding_error=_BINDING_ERROR,
+        server_binding=_server_binding_health(),
+        runtime_source_consistency=_runtime_source_consistency(),
+        manager=manager,
+        roles=roles,
+        agents=agents,
+        discovered=discovered,
+        orch_available=ORCH is not None,
+    )
+    return _ok_and_audit(request_id, name, args, payload)
+
+
+def _handle_headless_start(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    logger.info("headless.start project=%s leader=%s", str(args.get("project_root", "")), str(args.get("leader_agent", "")))
+    supervisor = _supervisor_from_tool_args(args if isinstance(args, dict) else {})
+    payload = _run_supervisor_action(supervisor, "start")
+    running = [p for p in payload.get("processes", []) if p.get("state") == "running"]
+    logger.info("headless.started processes=%d pids=%s", len(running), [p.get("pid") for p in running])
+    # Spawn the supervisor monitor as a detached background process so it
+    # survives MCP server restarts and continuously restarts dead workers.
+    monitor_pid = _start_supervisor_monitor(supervisor)
+    if monitor_pid:
+        payload["monitor_pid"] = monitor_pid
+        logger.info("headless.monitor started pid=%d", monitor_pid)
+    return _ok_and_audit(request_id, name, args, payload)
+
+
+def _handle_headless_stop(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    logger.info("headless.stop project=%s", str(args.get("project_root", "")))
+    supervisor = _supervisor_from_tool_args(args if isinstance(args, dict) else {})
+    # Stop the monitor process before stopping supervised processes.
+    _stop_supervisor_monitor(supervisor.cfg.pid_dir)
+    payload = _run_supervisor_action(supervisor, "stop")
+    logger.info("headless.stopped")
+    return _ok_and_audit(request_id, name, args, payload)
+
+
+def _handle_parity_smoke(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    checks = []
+    overall_status = "pass"
+
+    # 1. Lifecycle: Check if ORCH engine is loaded
+    if ORCH is None:
+        checks.append({"name": "engine_loaded", "status": "fail", "reason": "Orchestrator engine not initialized.", "action": "Check project root binding and configuration (ORCHESTRATOR_ROOT, ORCHESTRATOR_POLICY)."})
+        overall_status = "fail"
+    else:
+        checks.append({"name": "engine_loaded", "status": "pass", "reason": "Engine loaded successfully.", "action": None})
+
+        # 2. Status: Check roles
+        roles = ORCH.get_roles()
+        if not roles.get("leader"):
+            checks.append({"name": "leader_assigned", "status": "fail", "reason": "No leader assigned in roles.", "action": "Agent should run orchestrator_set_role or manager_loop.sh."})
+            overall_status = "fail"
+        else:
+            checks.append({"name": "leader_assigned", "status": "pass", "reason": f"Leader is {roles['leader']}.", "action": None})
 
-                # 3. Task flow: Check tasks can be listed
-                try:
-                    tasks = ORCH.list_tasks()
-                    checks.append({"name": "task_listing", "status": "pass", "reason": f"Found {len(tasks)} tasks.", "action": None})
-                except Exception as e:
-                    checks.append({"name": "task_listing", "status": "fail", "reason": f"Error listing tasks: {e}", "action": "Check task storage file integrity in state/ directory."})
-                    overall_status = "fail"
-
-                # 4. Storage: Check state and bus health
-                for subdir in ["state", "bus", "config"]:
-                    p = ROOT_DIR / subdir
-                    if not p.is_dir():
-                        checks.append({"name": f"{subdir}_dir", "status": "fail", "reason": f"Directory {subdir}/ missing.", "action": f"Ensure project is bootstrapped and {subdir}/ exists."})
-                        overall_status = "fail"
-                    else:
-                        checks.append({"name": f"{subdir}_dir", "status": "pass", "reason": f"Directory {subdir}/ present.", "action": None})
-
-                # 5. Config: Check .mcp.json
-                mcp_json = ROOT_DIR / ".mcp.json"
-                if not mcp_json.exists():
-                    checks.append({"name": "mcp_config", "status": "fail", "reason": ".mcp.json missing.", "action": "Ensure .mcp.json is present for project-scoped MCP binding."})
-                    overall_status = "fail"
-                else:
-                    checks.append({"name": "mcp_config", "status": "pass", "reason": ".mcp.json present.", "action": None})
-
-            # 6. Check headless execution path
-            script_path = ROOT_DIR / "scripts" / "autopilot" / "headless_status.sh"
-            if not script_path.exists() or not os.access(script_path, os.X_OK):
-                checks.append({"name": "headless_status_script", "status": "fail", "reason": f"Script {script_path.name} missing or not executable.", "action": "Ensure scripts/autopilot/headless_status.sh is installed and chmod +x."})
+        # 3. Task flow: Check tasks can be listed
+        try:
+            tasks = ORCH.list_tasks()
+            checks.append({"name": "task_listing", "status": "pass", "reason": f"Found {len(tasks)} tasks.", "action": None})
+        except Exception as e:
+            checks.append({"name": "task_listing", "status": "fail", "reason": f"Error listing tasks: {e}", "action": "Check task storage file integrity in state/ directory."})
+            overall_status = "fail"
+
+        # 4. Storage: Check state and bus health
+        for subdir in ["state", "bus", "config"]:
+            p = ROOT_DIR / subdir
+            if not p.is_dir():
+                checks.append({"name": f"{subdir}_dir", "status": "fail", "reason": f"Directory {subdir}/ missing.", "action": f"Ensure project is bootstrapped and {subdir}/ exists."})
                 overall_status = "fail"
             else:
-                checks.append({"name": "headless_status_script", "status": "pass", "reason": "Headless status script is present and executable.", "action": None})
+                checks.append({"name": f"{subdir}_dir", "status": "pass", "reason": f"Directory {subdir}/ present.", "action": None})
 
-            payload = {
-                "overall_status": overall_status,
-                "checks": checks,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }
-            return _ok_and_audit(request_id, name, args, payload)
-
-        if name == "orchestrator_normalize_github_ci":
-            raw = args.get("payload", {})
-            if isinstance(raw, str):
-                raw = _parse_json_argument(raw, "object")
-            if not isinstance(raw, dict):
-                raise ValueError("payload must be an object")
-            payload = normalize_github_ci_result(raw)
-            return _ok_and_audit(request_id, name, args, payload)
-
-        if name == "orchestrator_create_github_issue":
-            if ORCH is None:
-                return _ok_and_audit(request_id, name, args, {"error": "orchestrator not initialized"})
-            bug_id = args.get("bug_id", "")
-            repo = args.get("repo")
-            result = ORCH.orchestrator_create_github_issue(bug_id=bug_id, repo=repo)
-            return _ok_and_audit(request_id, name, args, result)
-
-
-        if name == "orchestrator_process_github_webhook":
-            raw_payload = args.get("payload", {})
-            source = args.get("source", "github")
-            headers = args.get("headers", {})
-            if isinstance(raw_payload, str):
-                raw_payload = _parse_json_argument(raw_payload, "object")
-            if not isinstance(raw_payload, dict):
-                raise ValueError("payload must be an object")
-
-            if ORCH is None:
-                raise ValueError("orchestrator not initialized")
-
-            # Inject headers into payload if provided separately (engine expects them inside payload)
-            if headers and "headers" not in raw_payload:
-                raw_payload["headers"] = headers
-
-            result = ORCH.process_github_webhook(payload=raw_payload, source=source)
-
-            return _ok_and_audit(request_id, name, args, result)
-        if name == "orchestrator_headless_status":
-            supervisor = _supervisor_from_tool_args(args if isinstance(args, dict) else {})
-
-            tasks = ORCH.list_tasks() if ORCH else []
-            blockers_open = ORCH.list_blockers(status="open") if ORCH else []
-            bugs_open = ORCH.list_bugs(status="open") if ORCH else []
-
-            proc_statuses = supervisor.status_json()
-
-            # Detect stale leader heartbeat from process status.
-            leader_heartbeat_stale = any(
-                p.get("leader_heartbeat_stale") for p in proc_statuses
-            )
+        # 5. Config: Check .mcp.json
+        mcp_json = ROOT_DIR / ".mcp.json"
+        if not mcp_json.exists():
+            checks.append({"name": "mcp_config", "status": "fail", "reason": ".mcp.json missing.", "action": "Ensure .mcp.json is present for project-scoped MCP binding."})
+            overall_status = "fail"
+        else:
+            checks.append({"name": "mcp_config", "status": "pass", "reason": ".mcp.json present.", "action": None})
 
-            payload = {
-                "ok": True,
-                "project_root": supervisor.cfg.project_root,
-                "leader_agent": supervisor.cfg.leader_agent,
-                "claude_lanes": supervisor.cfg.claude_lanes,
-                "processes": proc_statuses,
-                "pipeline": {
-                    "total": len(tasks),
-                    "done": len([t for t in tasks if t.get("status") == "done"]),
-                    "reported": len([t for t in tasks if t.get("status") == "reported"]),
-                    "in_progress": len([t for t in tasks if t.get("status") == "in_progress"]),
-                    "assigned": len([t for t in tasks if t.get("status") == "assigned"]),
-                },
-                "blockers_open_count": len(blockers_open),
-                "bugs_open_count": len(bugs_open),
-            }
-            if leader_heartbeat_stale:
-                payload["leader_heartbeat_stale"] = True
-                payload["leader_heartbeat_remediation"] = (
-                    "Leader process is running but its orchestrator heartbeat is stale. "
-                    "Check manager_loop health or restart the supervisor."
-                )
-            return _ok_and_audit(request_id, name, args, payload)
+    # 6. Check headless execution path
+    script_path = ROOT_DIR / "scripts" / "autopilot" / "headless_status.sh"
+    if not script_path.exists() or not os.access(script_path, os.X_OK):
+        checks.append({"name": "headless_status_script", "status": "fail", "reason": f"Script {script_path.name} missing or not executable.", "action": "Ensure scripts/autopilot/headless_status.sh is installed and chmod +x."})
+        overall_status = "fail"
+    else:
+        checks.append({"name": "headless_status_script", "status": "pass", "reason": "Headless status script is present and executable.", "action": None})
 
-        if name == "orchestrator_headless_restart":
-            supervisor = _supervisor_from_tool_args(args if isinstance(args, dict) else {})
-            payload = _run_supervisor_action(supervisor, "restart")
-            return _ok_and_audit(request_id, name, args, payload)
+    payload = {
+        "overall_status": overall_status,
+        "checks": checks,
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+    return _ok_and_audit(request_id, name, args, payload)
 
-        if name == "orchestrator_headless_clean":
-            supervisor = _supervisor_from_tool_args(args if isinstance(args, dict) else {})
-            payload = _run_supervisor_action(supervisor, "clean")
-            return _ok_and_audit(request_id, name, args, payload)
 
-        # ── Degraded-mode guard: reject tool calls when binding failed ──
-        if _BINDING_ERROR and ORCH is None:
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "result": {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": json.dumps({
-                                "error": "orchestrator_binding_error",
-                                "message": _BINDING_ERROR,
-                                "hint": (
-                                    "The MCP server started in degraded mode because of a "
-                                    "configuration issue. Ensure ORCHESTRATOR_ROOT, "
-                                    "ORCHESTRATOR_EXPECTED_ROOT, and ORCHESTRATOR_POLICY "
-                                    "are set correctly in your MCP server config. "
-                                    "See scripts/install_agent_leader_mcp.sh --help."
-                                ),
-                            }),
-                        }
-                    ],
-                    "isError": True,
-                },
-            }
+def _handle_normalize_github_ci(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    raw = args.get("payload", {})
+    if isinstance(raw, str):
+        raw = _parse_json_argument(raw, "object")
+    if not isinstance(raw, dict):
+        raise ValueError("payload must be an object")
+    payload = normalize_github_ci_result(raw)
+    return _ok_and_audit(request_id, name, args, payload)
 
-        if name == "orchestrator_status":
-            tasks = ORCH.list_tasks()
-            bugs = ORCH.list_bugs()
-            agents = ORCH.list_agents(active_only=True)
-            agent_instances = ORCH.list_agent_instances(active_only=False)
-            roles = ORCH.get_roles()
-            # Compute cross-project data before live_status_report needs it
-            cross_project_summary = _aggregate_by_project_root(tasks, bugs, agent_instances)
-            multi_project_data = cross_project_summary if len(cross_project_summary) > 1 else {}
-            live_status = _live_status_report({"cross_project_summary": multi_project_data})
-            by_status: Dict[str, int] = {}
-            for task in tasks:
-                by_status[task["status"]] = by_status.get(task["status"], 0) + 1
-            integrity = _status_integrity_and_provenance(
-                current_task_count=len(tasks),
-                current_done_count=int(by_status.get("done", 0)),
-            )
-            rsc = _runtime_source_consistency()
-            binding = _server_binding_health()
-            if not rsc["ok"]:
-                integrity["warnings"] = integrity.get("warnings", []) + rsc["warnings"]
-                integrity["ok"] = False
-            if not binding["ok"]:
-                integrity["warnings"] = integrity.get("warnings", []) + binding["warnings"]
-                integrity["ok"] = False
-            in_progress_tasks = [t for t in tasks if t.get("status") == "in_progress"]
-            wingman_pending = [t for t in tasks if isinstance(t.get("review_gate"), dict) and t["review_gate"].get("status") == "pending"]
-            wingman_rejected = [t for t in tasks if isinstance(t.get("review_gate"), dict) and t["review_gate"].get("status") == "rejected"]
-
-            # cross_project_summary already computed above
-
-            payload: Dict[str, Any] = {
+
+def _handle_create_github_issue(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    if ORCH is None:
+        return _ok_and_audit(request_id, name, args, {"error": "orchestrator not initialized"})
+    bug_id = args.get("bug_id", "")
+    repo = args.get("repo")
+    result = ORCH.orchestrator_create_github_issue(bug_id=bug_id, repo=repo)
+    return _ok_and_audit(request_id, name, args, result)
+
+
+def _handle_process_github_webhook(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    raw_payload = args.get("payload", {})
+    source = args.get("source", "github")
+    headers = args.get("headers", {})
+    if isinstance(raw_payload, str):
+        raw_payload = _parse_json_argument(raw_payload, "object")
+    if not isinstance(raw_payload, dict):
+        raise ValueError("payload must be an object")
+
+    if ORCH is None:
+        raise ValueError("orchestrator not initialized")
+
+    # Inject headers into payload if provided separately (engine expects them inside payload)
+    if headers and "headers" not in raw_payload:
+        raw_payload["headers"] = headers
+
+    result = ORCH.process_github_webhook(payload=raw_payload, source=source)
+
+    return _ok_and_audit(request_id, name, args, result)
+
+
+def _handle_headless_status(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    supervisor = _supervisor_from_tool_args(args if isinstance(args, dict) else {})
+
+    tasks = ORCH.list_tasks() if ORCH else []
+    blockers_open = ORCH.list_blockers(status="open") if ORCH else []
+    bugs_open = ORCH.list_bugs(status="open") if ORCH else []
+
+    proc_statuses = supervisor.status_json()
+    status_counts: Dict[Any, int] = {}
+    for task in tasks:
+        status = task.get("status")
+        status_counts[status] = status_counts.get(status, 0) + 1
+
+    # Detect stale leader heartbeat from process status.
+    leader_heartbeat_stale = any(
+        p.get("leader_heartbeat_stale") for p in proc_statuses
+    )
+
+    payload = {
+        "ok": True,
+        "project_root": supervisor.cfg.project_root,
+        "leader_agent": supervisor.cfg.leader_agent,
+        "claude_lanes": supervisor.cfg.claude_lanes,
+        "processes": proc_statuses,
+        "pipeline": {
+            "total": len(tasks),
+            "done": status_counts.get("done", 0),
+            "reported": status_counts.get("reported", 0),
+            "in_progress": status_counts.get("in_progress", 0),
+            "assigned": status_counts.get("assigned", 0),
+        },
+        "blockers_open_count": len(blockers_open),
+        "bugs_open_count": len(bugs_open),
+    }
+    if leader_heartbeat_stale:
+        payload["leader_heartbeat_stale"] = True
+        payload["leader_heartbeat_remediation"] = (
+            "Leader process is running but its orchestrator heartbeat is stale. "
+            "Check manager_loop health or restart the supervisor."
+        )
+    return _ok_and_audit(request_id, name, args, payload)
+
+
+def _handle_headless_restart(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    supervisor = _supervisor_from_tool_args(args if isinstance(args, dict) else {})
+    payload = _run_supervisor_action(supervisor, "restart")
+    return _ok_and_audit(request_id, name, args, payload)
+
+
+def _handle_headless_clean(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    supervisor = _supervisor_from_tool_args(args if isinstance(args, dict) else {})
+    payload = _run_supervisor_action(supervisor, "clean")
+    return _ok_and_audit(request_id, name, args, payload)
+
+
+def _handle_status(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    tasks = ORCH.list_tasks()
+    bugs = ORCH.list_bugs()
+    agents = ORCH.list_agents(active_only=True)
+    agent_instances = ORCH.list_agent_instances(active_only=False)
+    roles = ORCH.get_roles()
+    # Compute cross-project data before live_status_report needs it
+    cross_project_summary = _aggregate_by_project_root(tasks, bugs, agent_instances)
+    multi_project_data = cross_project_summary if len(cross_project_summary) > 1 else {}
+    live_status = _live_status_report({"cross_project_summary": multi_project_data})
+    by_status: Dict[str, int] = {}
+    for task in tasks:
+        by_status[task["status"]] = by_status.get(task["status"], 0) + 1
+    integrity = _status_integrity_and_provenance(
+        current_task_count=len(tasks),
+        current_done_count=int(by_status.get("done", 0)),
+    )
+    rsc = _runtime_source_consistency()
+    binding = _server_binding_health()
+    if not rsc["ok"]:
+        integrity["warnings"] = integrity.get("warnings", []) + rsc["warnings"]
+        integrity["ok"] = False
+    if not binding["ok"]:
+        integrity["warnings"] = integrity.get("warnings", []) + binding["warnings"]
+        integrity["ok"] = False
+    in_progress_tasks = [t for t in tasks if t.get("status") == "in_progress"]
+    wingman_pending = [t for t in tasks if isinstance(t.get("review_gate"), dict) and t["review_gate"].get("status") == "pending"]
+    wingman_rejected = [t for t in tasks if isinstance(t.get("review_gate"), dict) and t["review_gate"].get("status") == "rejected"]
+
+    # cross_project_summary already computed above
+
+    payload: Dict[str, Any] = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "server": "agent-leader-orchestrator",
+        "version": __version__,
+        "root_name": ROOT_DIR.name,
+        "policy_name": POLICY.name,
+        "manager": roles.get("leader"),
+        "roles": roles,
+        "task_count": len(tasks),
+        "task_status_counts": by_status,
+        "team_lane_counters": _aggregate_team_lanes(tasks),
+        "bug_count": len(bugs),
+        "in_progress": [
+            {
+                "id": t.get("id"),
+                "owner": t.get("owner"),
+                "title": t.get("title"),
+                "updated_at": t.get("updated_at"),
+            }
+            for t in sorted(in_progress_tasks, key=lambda x: str(x.get("updated_at", "")), reverse=True)[:8]
+        ],
+        "wingman_count": len(wingman_pending) + len(wingman_rejected),
+        "recovery_actions": live_status.get("report", {}).get("suggested_recovery_actions", []),
+        "active_agents": [agent["agent"] for agent in agents],
+        "active_agent_identities": [
+            {
+                "agent": agent.get("agent"),
+                "instance_id": agent.get("instance_id"),
+                "status": agent.get("status"),
+                "last_seen": agent.get("last_seen"),
+            }
+            for agent in agents
+        ],
+        "agent_instances": [
+            {
+                "agent_name": item.get("agent_name"),
+                "instance_id": item.get("instance_id"),
+                "role": item.get("role"),
+                "status": item.get("status"),
+                "project_root": item.get("project_root"),
+                "current_task_id": item.get("current_task_id"),
+                "last_seen": item.get("last_seen"),
+            }
+            for item in agent_instances
+        ],
+        "live_status_text": live_status.get("report_text", ""),
+        "live_status": live_status.get("report", {}),
+        "integrity": integrity,
+        "runtime_source_consistency": rsc,
+        "server_binding": binding,
+        "stats_provenance": {
+            "dashboard_percent": "live_status_report_estimate",
+            "task_summary": integrity.get("provenance", {}).get("task_counts"),
+            "integrity_state": "ok" if (integrity.get("ok") and rsc["ok"]) else "degraded",
+        },
+        "recommended_status_cadence_seconds": live_status.get("recommended_cadence_seconds", 600),
+        "run_context": {
+            "run_id": RUN_ID or None,
+            "orchestrator_version": __version__,
+            "policy_name": POLICY.name,
+            "prompt_profile_version": PROMPT_PROFILE_VERSION or None,
+            "root_name": ROOT_DIR.name,
+        },
+        "metrics": _status_metrics(tasks=tasks, bugs_open=ORCH.list_bugs(status="open"), blockers_open=ORCH.list_blockers(status="open")),
+        "auto_manager_cycle": {
+            "running": bool(_AUTO_LOOP_THREAD and _AUTO_LOOP_THREAD.is_alive()),
+            "interval_seconds": max(5, min(int(os.getenv("ORCHESTRATOR_AUTO_MANAGER_CYCLE_SECONDS", "15")), 300)),
+        },
+        "stop_policy": ORCH.evaluate_stop_policy(),
+    }
+    if multi_project_data:
+        payload["cross_project_summary"] = multi_project_data
+    if STATUS_VERBOSE_PATHS:
+        payload["root"] = str(ROOT_DIR)
+        payload["policy"] = str(POLICY_PATH)
+    try:
+        _append_jsonl(
+            STATUS_SNAPSHOTS_PATH,
+            STATUS_SNAPSHOTS_LOCK,
+            {
                 "timestamp": datetime.now(timezone.utc).isoformat(),
-                "server": "agent-leader-orchestrator",
-                "version": __version__,
+                "run_id": RUN_ID or None,
                 "root_name": ROOT_DIR.name,
-                "policy_name": POLICY.name,
-                "manager": roles.get("leader"),
-                "roles": roles,
                 "task_count": len(tasks),
                 "task_status_counts": by_status,
-                "team_lane_counters": _aggregate_team_lanes(tasks),
-                "bug_count": len(bugs),
-                "in_progress": [
-                    {
-                        "id": t.get("id"),
-                        "owner": t.get("owner"),
-                        "title": t.get("title"),
-                        "updated_at": t.get("updated_at"),
-                    }
-                    for t in sorted(in_progress_tasks, key=lambda x: str(x.get("updated_at", "")), reverse=True)[:8]
-                ],
-                "wingman_count": len(wingman_pending) + len(wingman_rejected),
-                "recovery_actions": live_status.get("report", {}).get("suggested_recovery_actions", []),
-                "active_agents": [agent["agent"] for agent in agents],
-                "active_agent_identities": [
-                    {
-                        "agent": agent.get("agent"),
-                        "instance_id": agent.get("instance_id"),
-                        "status": agent.get("status"),
-                        "last_seen": agent.get("last_seen"),
-                    }
-                    for agent in agents
-                ],
-                "agent_instances": [
-                    {
-                        "agent_name": item.get("agent_name"),
-                        "instance_id": item.get("instance_id"),
-                        "role": item.get("role"),
-                        "status": item.get("status"),
-                        "project_root": item.get("project_root"),
-                        "current_task_id": item.get("current_task_id"),
-                        "last_seen": item.get("last_seen"),
-                    }
-                    for item in agent_instances
-                ],
-                "live_status_text": live_status.get("report_text", ""),
                 "live_status": live_status.get("report", {}),
-                "integrity": integrity,
-                "runtime_source_consistency": rsc,
-                "server_binding": binding,
-                "stats_provenance": {
-                    "dashboard_percent": "live_status_report_estimate",
-                    "task_summary": integrity.get("provenance", {}).get("task_counts"),
-                    "integrity_state": "ok" if (integrity.get("ok") and rsc["ok"]) else "degraded",
-                },
-                "recommended_status_cadence_seconds": live_status.get("recommended_cadence_seconds", 600),
-                "run_context": {
-                    "run_id": RUN_ID or None,
-                    "orchestrator_version": __version__,
-                    "policy_name": POLICY.name,
-                    "prompt_profile_version": PROMPT_PROFILE_VERSION or None,
-                    "root_name": ROOT_DIR.name,
-                },
-                "metrics": _status_metrics(tasks=tasks, bugs_open=ORCH.list_bugs(status="open"), blockers_open=ORCH.list_blockers(status="open")),
-                "auto_manager_cycle": {
-                    "running": bool(_AUTO_LOOP_THREAD and _AUTO_LOOP_THREAD.is_alive()),
-                    "interval_seconds": max(5, min(int(os.getenv("ORCHESTRATOR_AUTO_MANAGER_CYCLE_SECONDS", "15")), 300)),
-                },
-                "stop_policy": ORCH.evaluate_stop_policy(),
-            }
-            if multi_project_data:
-                payload["cross_project_summary"] = multi_project_data
-            if STATUS_VERBOSE_PATHS:
-                payload["root"] = str(ROOT_DIR)
-                payload["policy"] = str(POLICY_PATH)
-            try:
-                _append_jsonl(
-                    STATUS_SNAPSHOTS_PATH,
-                    STATUS_SNAPSHOTS_LOCK,
-                    {
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "run_id": RUN_ID or None,
-                        "root_name": ROOT_DIR.name,
-                        "task_count": len(tasks),
-                        "task_status_counts": by_status,
-                        "live_status": live_status.get("report", {}),
-                        "integrity_ok": bool(integrity.get("ok")),
-                        "integrity_warnings": integrity.get("warnings", []),
-                        "provenance": payload.get("stats_provenance", {}),
-                    },
-                )
-            except Exception:
-                # Status should still succeed even if snapshot logging fails.
-                pass
-            return _ok_and_audit(
-                request_id,
-                name,
-                args,
-                payload,
-            )
+                "integrity_ok": bool(integrity.get("ok")),
+                "integrity_warnings": integrity.get("warnings", []),
+                "provenance": payload.get("stats_provenance", {}),
+            },
+        )
+    except Exception:
+        # Status should still succeed even if snapshot logging fails.
+        pass
+    return _ok_and_audit(
+        request_id,
+        name,
+        args,
+        payload,
+    )
 
-        if name == "orchestrator_get_roles":
-            return _ok_and_audit(request_id, name, args, ORCH.get_roles())
 
-        if name == "orchestrator_set_role":
-            result = ORCH.set_role(
-                agent=args["agent"],
-                role=args["role"],
-                source=args["source"],
-                instance_id=args.get("instance_id"),
-                source_instance_id=args.get("source_instance_id"),
-            )
-            return _ok_and_audit(request_id, name, args, result)
-
-        if name == "orchestrator_list_audit_logs":
-            logs = list(
-                ORCH.bus.read_audit(
-                    limit=int(args.get("limit", 100)),
-                    tool_name=args.get("tool"),
-                    status=args.get("status"),
-                )
-            )
-            return _ok_and_audit(request_id, name, args, logs)
-
-        if name == "orchestrator_live_status_report":
-            return _ok_and_audit(request_id, name, args, _live_status_report(args))
-
-        if name == "orchestrator_register_agent":
-            metadata = args.get("metadata", {})
-            if isinstance(metadata, str):
-                metadata = _parse_json_argument(metadata, "object")
-            if _ORCHESTRATOR_INSTANCE_ID:
-                metadata["instance_id"] = _ORCHESTRATOR_INSTANCE_ID
-            entry = ORCH.register_agent(agent=args["agent"], metadata=metadata)
-            return _ok_and_audit(request_id, name, args, entry)
-
-        if name == "orchestrator_heartbeat":
-            metadata = args.get("metadata", {})
-            if isinstance(metadata, str):
-                metadata = _parse_json_argument(metadata, "object")
-            if _ORCHESTRATOR_INSTANCE_ID:
-                metadata["instance_id"] = _ORCHESTRATOR_INSTANCE_ID
-            entry = ORCH.heartbeat(agent=args["agent"], metadata=metadata)
-            return _ok_and_audit(request_id, name, args, entry)
-
-        if name in {"orchestrator_connect_team_members", "orchestrator_connect_workers"}:
-            team_members = args.get("team_members", [])
-            if not team_members:
-                team_members = args.get("workers", [])
-            if isinstance(team_members, str):
-                team_members = _parse_json_argument(team_members, "array")
-            result = ORCH.connect_team_members(
-                source=args["source"],
-                team_members=team_members,
-                timeout_seconds=int(args.get("timeout_seconds", 60)),
-                poll_interval_seconds=int(args.get("poll_interval_seconds", 2)),
-                stale_after_seconds=int(args.get("stale_after_seconds", 600)),
-            )
-            return _ok_and_audit(request_id, name, args, result)
-
-        if name == "orchestrator_connect_to_leader":
-            metadata = args.get("metadata", {})
-            if isinstance(metadata, str):
-                metadata = _parse_json_argument(metadata, "object")
-            result = ORCH.connect_to_leader(
-                agent=args["agent"],
-                metadata=metadata,
-                status=args.get("status", "idle"),
-                announce=bool(args.get("announce", True)),
-                source=args.get("source"),
-            )
-            return _ok_and_audit(request_id, name, args, result)
+def _handle_get_roles(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    return _ok_and_audit(request_id, name, args, ORCH.get_roles())
 
-        if name == "orchestrator_list_agents":
-            agents = ORCH.list_agents(
-                active_only=bool(args.get("active_only", False)),
-                stale_after_seconds=int(args.get("stale_after_seconds", 600)),
-            )
-            return _ok_and_audit(request_id, name, args, agents)
 
-        if name == "orchestrator_discover_agents":
-            discovered = ORCH.discover_agents(
-                active_only=bool(args.get("active_only", False)),
-                stale_after_seconds=int(args.get("stale_after_seconds", 600)),
-            )
-            return _ok_and_audit(request_id, name, args, discovered)
-
-        if name == "orchestrator_bootstrap":
-            ORCH.bootstrap()
-            return _ok_and_audit(request_id, name, args, {"ok": True, "policy": POLICY.name, "manager": ORCH.manager_agent()})
-
-        if name == "orchestrator_create_task":
-            acceptance = args.get("acceptance_criteria")
-            if acceptance is None:
-                acceptance = ["Tests pass", "Acceptance criteria satisfied"]
-            if isinstance(acceptance, str):
-                acceptance = [acceptance]
-            tags = args.get("tags")
-            if isinstance(tags, str):
-                tags = _parse_json_argument(tags, "array")
-            task = ORCH.create_task(
-                title=args.get("title", ""),
-                workstream=args.get("workstream", "default"),
-                description=args.get("description", ""),
-                owner=args.get("owner"),
-                acceptance_criteria=acceptance,
-                risk=args.get("risk"),
-                test_plan=args.get("test_plan"),
-                doc_impact=args.get("doc_impact"),
-                project_root=args.get("project_root"),
-                project_name=args.get("project_name"),
-                tags=tags,
-                team_id=args.get("team_id"),
-                task_type=args.get("task_type"),
-                parent_task_id=args.get("parent_task_id"),
-            )
-            return _ok_and_audit(request_id, name, args, task)
-
-        if name == "orchestrator_dedupe_tasks":
-            result = ORCH.dedupe_open_tasks(source=args.get("source", ORCH.manager_agent()))
-            return _ok_and_audit(request_id, name, args, result)
-
-        if name == "orchestrator_list_tasks":
-            tags = args.get("tags")
-            if isinstance(tags, str):
-                tags = _parse_json_argument(tags, "array")
-            tasks = ORCH.list_tasks(
-                status=args.get("status"),
-                owner=args.get("owner"),
-                project_name=args.get("project_name"),
-                project_root=args.get("project_root"),
-                team_id=args.get("team_id"),
-                tags=tags,
-                lane=args.get("lane"),
-            )
-            return _ok_and_audit(request_id, name, args, tasks)
+def _handle_set_role(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    result = ORCH.set_role(
+        agent=args["agent"],
+        role=args["role"],
+        source=args["source"],
+        instance_id=args.get("instance_id"),
+        source_instance_id=args.get("source_instance_id"),
+    )
+    return _ok_and_audit(request_id, name, args, result)
 
-        if name == "orchestrator_get_tasks_for_agent":
-            tasks = ORCH.list_tasks_for_owner(owner=args["agent"], status=args.get("status"))
-            return _ok_and_audit(request_id, name, args, tasks)
 
-        if name == "orchestrator_claim_next_task":
-            result = ORCH.claim_next_task(
-                owner=args["agent"],
-                instance_id=args.get("instance_id"),
-                team_id=args.get("team_id"),
-            )
-            if result and isinstance(result, dict) and result.get("throttled"):
-                # Anti-spam cooldown: rapid empty claims are suppressed.
-                backoff = result.get("backoff_seconds", 5)
-                return _ok(
-                    request_id,
-                    {
-                        "task": None,
-                        "throttled": True,
-                        "message": result.get("message", "claim_cooldown"),
-                        "retry_hint": {
-                            "strategy": "backoff",
-                            "backoff_seconds": backoff,
-                            "cooldown_seconds": result.get("cooldown_seconds", 5),
-                        },
-                    },
-                )
-            if result:
-                return _ok_and_audit(request_id, name, args, result)
-            return _ok(
-                request_id,
-                {
-                    "task": None,
-                    "message": "No claimable task",
-                    "retry_hint": {
-                        "strategy": "event_poll_then_backoff",
-                        "poll_timeout_ms": 120000,
-                        "backoff_seconds": 15,
-                    },
+def _handle_list_audit_logs(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    logs = list(
+        ORCH.bus.read_audit(
+            limit=int(args.get("limit", 100)),
+            tool_name=args.get("tool"),
+            status=args.get("status"),
+        )
+    )
+    return _ok_and_audit(request_id, name, args, logs)
+
+
+def _handle_live_status_report(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    return _ok_and_audit(request_id, name, args, _live_status_report(args))
+
+
+def _handle_register_agent(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    metadata = args.get("metadata", {})
+    if isinstance(metadata, str):
+        metadata = _parse_json_argument(metadata, "object")
+    if _ORCHESTRATOR_INSTANCE_ID:
+        metadata["instance_id"] = _ORCHESTRATOR_INSTANCE_ID
+    entry = ORCH.register_agent(agent=args["agent"], metadata=metadata)
+    return _ok_and_audit(request_id, name, args, entry)
+
+
+def _handle_heartbeat(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    metadata = args.get("metadata", {})
+    if isinstance(metadata, str):
+        metadata = _parse_json_argument(metadata, "object")
+    if _ORCHESTRATOR_INSTANCE_ID:
+        metadata["instance_id"] = _ORCHESTRATOR_INSTANCE_ID
+    entry = ORCH.heartbeat(agent=args["agent"], metadata=metadata)
+    return _ok_and_audit(request_id, name, args, entry)
+
+
+def _handle_connect_team_members(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    team_members = args.get("team_members", [])
+    if not team_members:
+        team_members = args.get("workers", [])
+    if isinstance(team_members, str):
+        team_members = _parse_json_argument(team_members, "array")
+    result = ORCH.connect_team_members(
+        source=args["source"],
+        team_members=team_members,
+        timeout_seconds=int(args.get("timeout_seconds", 60)),
+        poll_interval_seconds=int(args.get("poll_interval_seconds", 2)),
+        stale_after_seconds=int(args.get("stale_after_seconds", 600)),
+    )
+    return _ok_and_audit(request_id, name, args, result)
+
+
+def _handle_connect_to_leader(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    metadata = args.get("metadata", {})
+    if isinstance(metadata, str):
+        metadata = _parse_json_argument(metadata, "object")
+    result = ORCH.connect_to_leader(
+        agent=args["agent"],
+        metadata=metadata,
+        status=args.get("status", "idle"),
+        announce=bool(args.get("announce", True)),
+        source=args.get("source"),
+    )
+    return _ok_and_audit(request_id, name, args, result)
+
+
+def _handle_list_agents(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    agents = ORCH.list_agents(
+        active_only=bool(args.get("active_only", False)),
+        stale_after_seconds=int(args.get("stale_after_seconds", 600)),
+    )
+    return _ok_and_audit(request_id, name, args, agents)
+
+
+def _handle_discover_agents(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    discovered = ORCH.discover_agents(
+        active_only=bool(args.get("active_only", False)),
+        stale_after_seconds=int(args.get("stale_after_seconds", 600)),
+    )
+    return _ok_and_audit(request_id, name, args, discovered)
+
+
+def _handle_bootstrap(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    ORCH.bootstrap()
+    return _ok_and_audit(request_id, name, args, {"ok": True, "policy": POLICY.name, "manager": ORCH.manager_agent()})
+
+
+def _handle_create_task(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    acceptance = args.get("acceptance_criteria")
+    if acceptance is None:
+        acceptance = ["Tests pass", "Acceptance criteria satisfied"]
+    if isinstance(acceptance, str):
+        acceptance = [acceptance]
+    tags = args.get("tags")
+    if isinstance(tags, str):
+        tags = _parse_json_argument(tags, "array")
+    task = ORCH.create_task(
+        title=args.get("title", ""),
+        workstream=args.get("workstream", "default"),
+        description=args.get("description", ""),
+        owner=args.get("owner"),
+        acceptance_criteria=acceptance,
+        risk=args.get("risk"),
+        test_plan=args.get("test_plan"),
+        doc_impact=args.get("doc_impact"),
+        project_root=args.get("project_root"),
+        project_name=args.get("project_name"),
+        tags=tags,
+        team_id=args.get("team_id"),
+        task_type=args.get("task_type"),
+        parent_task_id=args.get("parent_task_id"),
+    )
+    return _ok_and_audit(request_id, name, args, task)
+
+
+def _handle_dedupe_tasks(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    result = ORCH.dedupe_open_tasks(source=args.get("source", ORCH.manager_agent()))
+    return _ok_and_audit(request_id, name, args, result)
+
+
+def _handle_list_tasks(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    tags = args.get("tags")
+    if isinstance(tags, str):
+        tags = _parse_json_argument(tags, "array")
+    tasks = ORCH.list_tasks(
+        status=args.get("status"),
+        owner=args.get("owner"),
+        project_name=args.get("project_name"),
+        project_root=args.get("project_root"),
+        team_id=args.get("team_id"),
+        tags=tags,
+        lane=args.get("lane"),
+    )
+    return _ok_and_audit(request_id, name, args, tasks)
+
+
+def _handle_get_tasks_for_agent(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    tasks = ORCH.list_tasks_for_owner(owner=args["agent"], status=args.get("status"))
+    return _ok_and_audit(request_id, name, args, tasks)
+
+
+def _handle_claim_next_task(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    result = ORCH.claim_next_task(
+        owner=args["agent"],
+        instance_id=args.get("instance_id"),
+        team_id=args.get("team_id"),
+    )
+    if result and isinstance(result, dict) and result.get("throttled"):
+        # Anti-spam cooldown: rapid empty claims are suppressed.
+        backoff = result.get("backoff_seconds", 5)
+        return _ok(
+            request_id,
+            {
+                "task": None,
+                "throttled": True,
+                "message": result.get("message", "claim_cooldown"),
+                "retry_hint": {
+                    "strategy": "backoff",
+                    "backoff_seconds": backoff,
+                    "cooldown_seconds": result.get("cooldown_seconds", 5),
                 },
-            )
+            },
+        )
+    if result:
+        return _ok_and_audit(request_id, name, args, result)
+    return _ok(
+        request_id,
+        {
+            "task": None,
+            "message": "No claimable task",
+            "retry_hint": {
+                "strategy": "event_poll_then_backoff",
+                "poll_timeout_ms": 120000,
+                "backoff_seconds": 15,
+            },
+        },
+    )
 
-        if name == "orchestrator_renew_task_lease":
-            result = ORCH.renew_task_lease(
-                task_id=args["task_id"],
-                agent=args["agent"],
-                lease_id=args["lease_id"],
-                instance_id=args.get("instance_id"),
-            )
-            return _ok_and_audit(request_id, name, args, result)
 
-        if name == "orchestrator_set_claim_override":
-            result = ORCH.set_claim_override(
-                agent=args["agent"],
-                task_id=args["task_id"],
-                source=args["source"],
-            )
-            return _ok_and_audit(request_id, name, args, result)
-
-        if name == "orchestrator_update_task_status":
-            task = ORCH.set_task_status(
-                task_id=args["task_id"],
-                status=args["status"],
-                source=args["source"],
-                note=args.get("note", ""),
-            )
-            return _ok_and_audit(request_id, name, args, task)
-
-        if name == "orchestrator_submit_report":
-            test_summary = args.get("test_summary", {})
-            if isinstance(test_summary, str):
-                test_summary = _parse_json_argument(test_summary, "object")
-            review_gate = args.get("review_gate")
-            if isinstance(review_gate, str):
-                review_gate = _parse_json_argument(review_gate, "object")
-            reporting_agent = args["agent"]
-            report = {
-                "task_id": args["task_id"],
-                "agent": reporting_agent,
-                "commit_sha": args["commit_sha"],
-                "status": args["status"],
-                "test_summary": test_summary,
-                "artifacts": args.get("artifacts", []),
-                "notes": args.get("notes", ""),
-            }
-            if isinstance(review_gate, dict):
-                report["review_gate"] = review_gate
-            comprehension_summary = args.get("comprehension_summary")
-            if isinstance(comprehension_summary, str):
-                comprehension_summary = _parse_json_argument(comprehension_summary, "object")
-            if isinstance(comprehension_summary, dict):
-                report["comprehension_summary"] = comprehension_summary
-            report["run_context"] = {
-                "run_id": RUN_ID or None,
-                "orchestrator_version": __version__,
-                "policy_name": POLICY.name,
-                "prompt_profile_version": PROMPT_PROFILE_VERSION or None,
-                "root_name": ROOT_DIR.name,
-            }
-            report["commit_metrics"] = _collect_commit_metrics(report["commit_sha"])
-            try:
-                result = ORCH.ingest_report(report)
-            except Exception as exc:
-                queue_entry = ORCH.enqueue_report_retry(report=report, error=str(exc))
-                result = {
-                    "queued_for_retry": True,
-                    "queue_entry": queue_entry,
-                    "submit_error": str(exc),
-                }
-            auto_validate = bool(ORCH.policy.triggers.get("auto_validate_reports_on_submit", True))
-            # If review gates are required by policy, still run cycle but it will defer pending reviews
-            if auto_validate:
-                cycle = _manager_cycle(strict=True)
-                # Log if tasks were deferred for wingman review
-                deferred = cycle.get("deferred_reports", [])
-                if deferred:
-                    logger.info("submit_report: %d task(s) deferred for wingman review: %s",
-                                len(deferred), [d.get("task_id") for d in deferred])
-                result = {
-                    "report": result,
-                    "auto_manager_cycle": {
-                        "enabled": True,
-                        "processed_reports": cycle.get("processed_reports", []),
-                        "deferred_reports": cycle.get("deferred_reports", []),
-                        "pending_total": cycle.get("pending_total", 0),
-                    },
-                }
-                # Help workers continue without extra manual "claim next" reminders.
-                result["auto_claim_next"] = ORCH.claim_next_task(owner=reporting_agent, engine_initiated=True)
-            return _ok_and_audit(request_id, name, args, result)
+def _handle_renew_task_lease(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    result = ORCH.renew_task_lease(
+        task_id=args["task_id"],
+        agent=args["agent"],
+        lease_id=args["lease_id"],
+        instance_id=args.get("instance_id"),
+    )
+    return _ok_and_audit(request_id, name, args, result)
 
-        if name == "orchestrator_validate_task":
-            result = ORCH.validate_task(
-                task_id=args["task_id"],
-                passed=bool(args["passed"]),
-                notes=args["notes"],
-                source=args["source"],
-            )
-            return _ok_and_audit(request_id, name, args, result)
-
-        if name == "orchestrator_list_bugs":
-            bugs = ORCH.list_bugs(status=args.get("status"), owner=args.get("owner"))
-            return _ok_and_audit(request_id, name, args, bugs)
-
-        if name == "orchestrator_raise_blocker":
-            blocker = ORCH.raise_blocker(
-                task_id=args["task_id"],
-                agent=args["agent"],
-                question=args["question"],
-                options=args.get("options", []),
-                severity=args.get("severity", "medium"),
-            )
-            return _ok_and_audit(request_id, name, args, blocker)
 
-        if name == "orchestrator_list_blockers":
-            blockers = ORCH.list_blockers(status=args.get("status"), agent=args.get("agent"))
-            return _ok_and_audit(request_id, name, args, blockers)
+def _handle_set_claim_override(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    result = ORCH.set_claim_override(
+        agent=args["agent"],
+        task_id=args["task_id"],
+        source=args["source"],
+    )
+    return _ok_and_audit(request_id, name, args, result)
 
-        if name == "orchestrator_resolve_blocker":
-            blocker = ORCH.resolve_blocker(
-                blocker_id=args["blocker_id"],
-                resolution=args["resolution"],
-                source=args["source"],
-            )
-            return _ok_and_audit(request_id, name, args, blocker)
-
-        if name == "orchestrator_publish_event":
-            payload = args.get("payload", {})
-            if isinstance(payload, str):
-                payload = _parse_json_argument(payload, "object")
-            audience = args.get("audience", [])
-            if isinstance(audience, str):
-                audience = _parse_json_argument(audience, "array")
-            event = ORCH.publish_event(
-                event_type=args["type"],
-                source=args["source"],
-                payload=payload,
-                audience=audience,
-            )
-            return _ok_and_audit(request_id, name, args, event)
-
-        if name == "orchestrator_poll_events":
-            polled = ORCH.poll_events(
-                agent=args["agent"],
-                cursor=args.get("cursor"),
-                limit=int(args.get("limit", 50)),
-                timeout_ms=int(args.get("timeout_ms", 0)),
-                auto_advance=bool(args.get("auto_advance", True)),
-            )
-            return _ok_and_audit(request_id, name, args, polled)
-
-        if name == "orchestrator_ack_event":
-            ack = ORCH.ack_event(agent=args["agent"], event_id=args["event_id"])
-            return _ok_and_audit(request_id, name, args, ack)
-
-        if name == "orchestrator_get_agent_cursor":
-            cursor = ORCH.get_agent_cursor(agent=args["agent"])
-            return _ok_and_audit(request_id, name, args, {"agent": args["agent"], "cursor": cursor})
-
-        if name == "orchestrator_manager_cycle":
-            strict = bool(args.get("strict", False))
-            cycle = _manager_cycle(strict=strict)
-            return _ok_and_audit(request_id, name, args, cycle)
-
-        if name == "orchestrator_plan_from_roadmap":
-            result = ORCH.plan_from_roadmap(
-                source=args.get("source", ORCH.manager_agent()),
-                version=args.get("version"),
-                limit=int(args.get("limit", 5)),
-                team_id=args.get("team_id"),
-            )
-            return _ok_and_audit(request_id, name, args, result)
 
-        if name == "orchestrator_reassign_stale_tasks":
-            result = ORCH.reassign_stale_tasks_to_active_workers(
-                source=args.get("source", ORCH.manager_agent()),
-                stale_after_seconds=int(args.get("stale_after_seconds", 600)),
-                include_blocked=bool(args.get("include_blocked", True)),
-            )
-            return _ok_and_audit(request_id, name, args, result)
-
-        if name == "orchestrator_decide_architecture":
-            votes = args.get("votes", {})
-            rationale = args.get("rationale", {})
-            if isinstance(votes, str):
-                votes = _parse_json_argument(votes, "object")
-            if isinstance(rationale, str):
-                rationale = _parse_json_argument(rationale, "object")
-            options = args.get("options", [])
-            if isinstance(options, str):
-                options = _parse_json_argument(options, "array")
-
-            path = ORCH.record_architecture_decision(
-                topic=args["topic"],
-                options=options,
-                votes=votes,
-                rationale=rationale,
-            )
-            return _ok_and_audit(request_id, name, args, {"decision_path": str(path)})
-
-        if name == "orchestrator_set_review_gate":
-            result = ORCH.set_review_gate(
-                task_id=args["task_id"],
-                status=args["status"],
-                reviewer_agent=args["reviewer_agent"],
-                notes=str(args.get("notes", "")),
-            )
-            # If approved, trigger manager cycle to process the now-reviewable task
-            if args["status"] == "approved":
-                cycle = _manager_cycle(strict=True)
-                result["auto_manager_cycle"] = {
-                    "processed_reports": cycle.get("processed_reports", []),
-                    "deferred_reports": cycle.get("deferred_reports", []),
+def _handle_update_task_status(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    task = ORCH.set_task_status(
+        task_id=args["task_id"],
+        status=args["status"],
+        source=args["source"],
+        note=args.get("note", ""),
+    )
+    return _ok_and_audit(request_id, name, args, task)
+
+
+def _handle_submit_report(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    test_summary = args.get("test_summary", {})
+    if isinstance(test_summary, str):
+        test_summary = _parse_json_argument(test_summary, "object")
+    review_gate = args.get("review_gate")
+    if isinstance(review_gate, str):
+        review_gate = _parse_json_argument(review_gate, "object")
+    reporting_agent = args["agent"]
+    report = {
+        "task_id": args["task_id"],
+        "agent": reporting_agent,
+        "commit_sha": args["commit_sha"],
+        "status": args["status"],
+        "test_summary": test_summary,
+        "artifacts": args.get("artifacts", []),
+        "notes": args.get("notes", ""),
+    }
+    if isinstance(review_gate, dict):
+        report["review_gate"] = review_gate
+    comprehension_summary = args.get("comprehension_summary")
+    if isinstance(comprehension_summary, str):
+        comprehension_summary = _parse_json_argument(comprehension_summary, "object")
+    if isinstance(comprehension_summary, dict):
+        report["comprehension_summary"] = comprehension_summary
+    report["run_context"] = {
+        "run_id": RUN_ID or None,
+        "orchestrator_version": __version__,
+        "policy_name": POLICY.name,
+        "prompt_profile_version": PROMPT_PROFILE_VERSION or None,
+        "root_name": ROOT_DIR.name,
+    }
+    report["commit_metrics"] = _collect_commit_metrics(report["commit_sha"])
+    try:
+        result = ORCH.ingest_report(report)
+    except Exception as exc:
+        queue_entry = ORCH.enqueue_report_retry(report=report, error=str(exc))
+        result = {
+            "queued_for_retry": True,
+            "queue_entry": queue_entry,
+            "submit_error": str(exc),
+        }
+    auto_validate = bool(ORCH.policy.triggers.get("auto_validate_reports_on_submit", True))
+    # If review gates are required by policy, still run cycle but it will defer pending reviews
+    if auto_validate:
+        cycle = _manager_cycle(strict=True)
+        # Log if tasks were deferred for wingman review
+        deferred = cycle.get("deferred_reports", [])
+        if deferred:
+            logger.info("submit_report: %d task(s) deferred for wingman review: %s",
+                        len(deferred), [d.get("task_id") for d in deferred])
+        result = {
+            "report": result,
+            "auto_manager_cycle": {
+                "enabled": True,
+                "processed_reports": cycle.get("processed_reports", []),
+                "deferred_reports": cycle.get("deferred_reports", []),
+                "pending_total": cycle.get("pending_total", 0),
+            },
+        }
+        # Help workers continue without extra manual "claim next" reminders.
+        result["auto_claim_next"] = ORCH.claim_next_task(owner=reporting_agent, engine_initiated=True)
+    return _ok_and_audit(request_id, name, args, result)
+
+
+def _handle_validate_task(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    result = ORCH.validate_task(
+        task_id=args["task_id"],
+        passed=bool(args["passed"]),
+        notes=args["notes"],
+        source=args["source"],
+    )
+    return _ok_and_audit(request_id, name, args, result)
+
+
+def _handle_list_bugs(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    bugs = ORCH.list_bugs(status=args.get("status"), owner=args.get("owner"))
+    return _ok_and_audit(request_id, name, args, bugs)
+
+
+def _handle_raise_blocker(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    blocker = ORCH.raise_blocker(
+        task_id=args["task_id"],
+        agent=args["agent"],
+        question=args["question"],
+        options=args.get("options", []),
+        severity=args.get("severity", "medium"),
+    )
+    return _ok_and_audit(request_id, name, args, blocker)
+
+
+def _handle_list_blockers(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    blockers = ORCH.list_blockers(status=args.get("status"), agent=args.get("agent"))
+    return _ok_and_audit(request_id, name, args, blockers)
+
+
+def _handle_resolve_blocker(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    blocker = ORCH.resolve_blocker(
+        blocker_id=args["blocker_id"],
+        resolution=args["resolution"],
+        source=args["source"],
+    )
+    return _ok_and_audit(request_id, name, args, blocker)
+
+
+def _handle_publish_event(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    payload = args.get("payload", {})
+    if isinstance(payload, str):
+        payload = _parse_json_argument(payload, "object")
+    audience = args.get("audience", [])
+    if isinstance(audience, str):
+        audience = _parse_json_argument(audience, "array")
+    event = ORCH.publish_event(
+        event_type=args["type"],
+        source=args["source"],
+        payload=payload,
+        audience=audience,
+    )
+    return _ok_and_audit(request_id, name, args, event)
+
+
+def _handle_poll_events(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    polled = ORCH.poll_events(
+        agent=args["agent"],
+        cursor=args.get("cursor"),
+        limit=int(args.get("limit", 50)),
+        timeout_ms=int(args.get("timeout_ms", 0)),
+        auto_advance=bool(args.get("auto_advance", True)),
+    )
+    return _ok_and_audit(request_id, name, args, polled)
+
+
+def _handle_ack_event(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    ack = ORCH.ack_event(agent=args["agent"], event_id=args["event_id"])
+    return _ok_and_audit(request_id, name, args, ack)
+
+
+def _handle_get_agent_cursor(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    cursor = ORCH.get_agent_cursor(agent=args["agent"])
+    return _ok_and_audit(request_id, name, args, {"agent": args["agent"], "cursor": cursor})
+
+
+def _handle_manager_cycle(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    strict = bool(args.get("strict", False))
+    cycle = _manager_cycle(strict=strict)
+    return _ok_and_audit(request_id, name, args, cycle)
+
+
+def _handle_plan_from_roadmap(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    result = ORCH.plan_from_roadmap(
+        source=args.get("source", ORCH.manager_agent()),
+        version=args.get("version"),
+        limit=int(args.get("limit", 5)),
+        team_id=args.get("team_id"),
+    )
+    return _ok_and_audit(request_id, name, args, result)
+
+
+def _handle_reassign_stale_tasks(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    result = ORCH.reassign_stale_tasks_to_active_workers(
+        source=args.get("source", ORCH.manager_agent()),
+        stale_after_seconds=int(args.get("stale_after_seconds", 600)),
+        include_blocked=bool(args.get("include_blocked", True)),
+    )
+    return _ok_and_audit(request_id, name, args, result)
+
+
+def _handle_decide_architecture(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    votes = args.get("votes", {})
+    rationale = args.get("rationale", {})
+    if isinstance(votes, str):
+        votes = _parse_json_argument(votes, "object")
+    if isinstance(rationale, str):
+        rationale = _parse_json_argument(rationale, "object")
+    options = args.get("options", [])
+    if isinstance(options, str):
+        options = _parse_json_argument(options, "array")
+
+    path = ORCH.record_architecture_decision(
+        topic=args["topic"],
+        options=options,
+        votes=votes,
+        rationale=rationale,
+    )
+    return _ok_and_audit(request_id, name, args, {"decision_path": str(path)})
+
+
+def _handle_set_review_gate(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    result = ORCH.set_review_gate(
+        task_id=args["task_id"],
+        status=args["status"],
+        reviewer_agent=args["reviewer_agent"],
+        notes=str(args.get("notes", "")),
+    )
+    # If approved, trigger manager cycle to process the now-reviewable task
+    if args["status"] == "approved":
+        cycle = _manager_cycle(strict=True)
+        result["auto_manager_cycle"] = {
+            "processed_reports": cycle.get("processed_reports", []),
+            "deferred_reports": cycle.get("deferred_reports", []),
+        }
+    return _ok_and_audit(request_id, name, args, result)
+
+
+def _handle_create_consult(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    target_agents = args.get("target_agents", [])
+    if isinstance(target_agents, str):
+        target_agents = _parse_json_argument(target_agents, "array")
+    consult = ORCH.create_consult(
+        source=args["source"],
+        consult_type=args["consult_type"],
+        question=args["question"],
+        context=args.get("context", ""),
+        target_agents=target_agents,
+    )
+    return _ok_and_audit(request_id, name, args, consult)
+
+
+def _handle_respond_consult(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    consult = ORCH.respond_consult(
+        consult_id=args["consult_id"],
+        agent=args["agent"],
+        body=args["body"],
+    )
+    return _ok_and_audit(request_id, name, args, consult)
+
+
+def _handle_list_consults(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    consults = ORCH.list_consults(
+        status=args.get("status"),
+        consult_type=args.get("consult_type"),
+        agent=args.get("agent"),
+    )
+    return _ok_and_audit(request_id, name, args, consults)
+
+
+def _handle_get_task_spec(request_id: Any, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    task_id = args.get("task_id", "")
+    spec = ORCH.get_spec(task_id)
+    if spec is None:
+        return _ok_and_audit(request_id, name, args, {"task_id": task_id, "spec": None, "message": "No spec found for this task."})
+    return _ok_and_audit(request_id, name, args, {"task_id": task_id, "spec": spec})
+
+
+def _binding_error_response(request_id: Any) -> Dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "result": {
+            "content": [
+                {
+                    "type": "text",
+                    "text": json.dumps({
+                        "error": "orchestrator_binding_error",
+                        "message": _BINDING_ERROR,
+                        "hint": (
+                            "The MCP server started in degraded mode because of a "
+                            "configuration issue. Ensure ORCHESTRATOR_ROOT, "
+                            "ORCHESTRATOR_EXPECTED_ROOT, and ORCHESTRATOR_POLICY "
+                            "are set correctly in your MCP server config. "
+                            "See scripts/install_agent_leader_mcp.sh --help."
+                        ),
+                    }),
                 }
-            return _ok_and_audit(request_id, name, args, result)
-
-        if name == "orchestrator_create_consult":
-            target_agents = args.get("target_agents", [])
-            if isinstance(target_agents, str):
-                target_agents = _parse_json_argument(target_agents, "array")
-            consult = ORCH.create_consult(
-                source=args["source"],
-                consult_type=args["consult_type"],
-                question=args["question"],
-                context=args.get("context", ""),
-                target_agents=target_agents,
-            )
-            return _ok_and_audit(request_id, name, args, consult)
+            ],
+            "isError": True,
+        },
+    }
 
-        if name == "orchestrator_respond_consult":
-            consult = ORCH.respond_consult(
-                consult_id=args["consult_id"],
-                agent=args["agent"],
-                body=args["body"],
-            )
-            return _ok_and_audit(request_id, name, args, consult)
 
-        if name == "orchestrator_list_consults":
-            consults = ORCH.list_consults(
-                status=args.get("status"),
-                consult_type=args.get("consult_type"),
-                agent=args.get("agent"),
-            )
-            return _ok_and_audit(request_id, name, args, consults)
+# Tool name -> handler(request_id, name, args). Dispatch is one dict lookup.
+_TOOL_HANDLERS: Dict[str, Callable[[Any, str, Dict[str, Any]], Dict[str, Any]]] = {
+    "orchestrator_guide": _handle_guide,
+    "orchestrator_doctor": _handle_doctor,
+    "orchestrator_headless_start": _handle_headless_start,
+    "orchestrator_headless_stop": _handle_headless_stop,
+    "orchestrator_parity_smoke": _handle_parity_smoke,
+    "orchestrator_normalize_github_ci": _handle_normalize_github_ci,
+    "orchestrator_create_github_issue": _handle_create_github_issue,
+    "orchestrator_process_github_webhook": _handle_process_github_webhook,
+    "orchestrator_headless_status": _handle_headless_status,
+    "orchestrator_headless_restart": _handle_headless_restart,
+    "orchestrator_headless_clean": _handle_headless_clean,
+    "orchestrator_status": _handle_status,
+    "orchestrator_get_roles": _handle_get_roles,
+    "orchestrator_set_role": _handle_set_role,
+    "orchestrator_list_audit_logs": _handle_list_audit_logs,
+    "orchestrator_live_status_report": _handle_live_status_report,
+    "orchestrator_register_agent": _handle_register_agent,
+    "orchestrator_heartbeat": _handle_heartbeat,
+    "orchestrator_connect_team_members": _handle_connect_team_members,
+    "orchestrator_connect_workers": _handle_connect_team_members,
+    "orchestrator_connect_to_leader": _handle_connect_to_leader,
+    "orchestrator_list_agents": _handle_list_agents,
+    "orchestrator_discover_agents": _handle_discover_agents,
+    "orchestrator_bootstrap": _handle_bootstrap,
+    "orchestrator_create_task": _handle_create_task,
+    "orchestrator_dedupe_tasks": _handle_dedupe_tasks,
+    "orchestrator_list_tasks": _handle_list_tasks,
+    "orchestrator_get_tasks_for_agent": _handle_get_tasks_for_agent,
+    "orchestrator_claim_next_task": _handle_claim_next_task,
+    "orchestrator_renew_task_lease": _handle_renew_task_lease,
+    "orchestrator_set_claim_override": _handle_set_claim_override,
+    "orchestrator_update_task_status": _handle_update_task_status,
+    "orchestrator_submit_report": _handle_submit_report,
+    "orchestrator_validate_task": _handle_validate_task,
+    "orchestrator_list_bugs": _handle_list_bugs,
+    "orchestrator_raise_blocker": _handle_raise_blocker,
+    "orchestrator_list_blockers": _handle_list_blockers,
+    "orchestrator_resolve_blocker": _handle_resolve_blocker,
+    "orchestrator_publish_event": _handle_publish_event,
+    "orchestrator_poll_events": _handle_poll_events,
+    "orchestrator_ack_event": _handle_ack_event,
+    "orchestrator_get_agent_cursor": _handle_get_agent_cursor,
+    "orchestrator_manager_cycle": _handle_manager_cycle,
+    "orchestrator_plan_from_roadmap": _handle_plan_from_roadmap,
+    "orchestrator_reassign_stale_tasks": _handle_reassign_stale_tasks,
+    "orchestrator_decide_architecture": _handle_decide_architecture,
+    "orchestrator_set_review_gate": _handle_set_review_gate,
+    "orchestrator_create_consult": _handle_create_consult,
+    "orchestrator_respond_consult": _handle_respond_consult,
+    "orchestrator_list_consults": _handle_list_consults,
+    "orchestrator_get_task_spec": _handle_get_task_spec,
+}
+# Tools that still work when the server started without a bound orchestrator.
+_UNBOUND_TOOLS = frozenset({
+    "orchestrator_guide",
+    "orchestrator_doctor",
+    "orchestrator_headless_start",
+    "orchestrator_headless_stop",
+    "orchestrator_parity_smoke",
+    "orchestrator_normalize_github_ci",
+    "orchestrator_create_github_issue",
+    "orchestrator_process_github_webhook",
+    "orchestrator_headless_status",
+    "orchestrator_headless_restart",
+    "orchestrator_headless_clean",
+})
+
 
-        if name == "orchestrator_get_task_spec":
-            task_id = args.get("task_id", "")
-            spec = ORCH.get_spec(task_id)
-            if spec is None:
-                return _ok_and_audit(request_id, name, args, {"task_id": task_id, "spec": None, "message": "No spec found for this task."})
-            return _ok_and_audit(request_id, name, args, {"task_id": task_id, "spec": spec})
+def handle_tool_call(request_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+    name = params.get("name")
+    args = params.get("arguments", {})
 
-        raise ValueError(f"Unknown tool: {name}")
+    try:
+        # ── Degraded-mode guard: reject tool calls when binding failed ──
+        if _BINDING_ERROR and ORCH is None and name not in _UNBOUND_TOOLS:
+            return _binding_error_response(request_id)
+        handler = _TOOL_HANDLERS.get(name)
+        if handler is None:
+            raise ValueError(f"Unknown tool: {name}")
+        return handler(request_id, name, args)
     except Exception as exc:
         _audit_tool_call(
             tool_name=str(name),
@@ -3649,6 +3922,114 @@ def handle_tool_call(request_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
+def _dispatch_request(request: Any) -> Optional[Dict[str, Any]]:
+    """Handle one JSON-RPC request object; None when no response is due."""
+    if not isinstance(request, dict):
+        return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
+    method = request.get("method")
+    request_id = request.get("id")
+    params = request.get("params", {})
+
+    # JSON-RPC notifications do not include an id and must not receive responses.
+    is_notification = "id" not in request
+    if is_notification:
+        if method == "notifications/initialized":
+            return None
+        # Ignore unknown notifications silently for compatibility with strict clients.
+        return None
+
+    if method == "initialize":
+        return handle_initialize(request_id)
+    if method == "tools/list":
+        return handle_tools_list(request_id)
+    if method == "tools/call":
+        return handle_tool_call(request_id, params)
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {
+            "code": -32601,
+            "message": f"Method not found: {method}",
+        },
+    }
+
+
+def _dispatch_batch(requests: List[Any]) -> Any:
+    """Handle a JSON-RPC batch, answering with one array (or nothing).
+
+    Entries are processed in order; notifications produce no entry and a
+    failing entry gets its own error without aborting the rest.
+    """
+    if not requests:
+        return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
+    responses = []
+    for request in requests:
+        try:
+            response = _dispatch_request(request)
+        except Exception as exc:
+            request_id = request.get("id") if isinstance(request, dict) else None
+            response = {"jsonrpc": "2.0", "id": request_id, "error": {"code": -32603, "message": f"Internal error: {exc}"}}
+        if response is not None:
+            responses.append(response)
+    return responses or None
+
+
+_STDIN_CHUNK_BYTES = 65536
+# Only the message varies; the id is unknown once parsing/dispatch has failed.
+_INTERNAL_ERROR_TEMPLATE = b'{"jsonrpc":"2.0","id":null,"error":{"code":-32603,"message":%b}}'
+
+
+def _iter_request_lines(stdin: Any) -> Iterator[List[bytes]]:
+    """Yield the newline-delimited request lines of stdin, one read at a time.
+
+    Reads whatever is already available (read1) and hands out every
+    complete line in it as one list before reading again, instead of one
+    readline() per request. A trailing line without a newline is yielded
+    at EOF. Streams without read1 fall back to readline(), a line per list.
+    """
+    read1 = getattr(stdin, "read1", None)
+    if read1 is None:
+        # readline(0) gives the stream's own EOF sentinel ("" or b"").
+        for line in iter(stdin.readline, stdin.readline(0)):
+            yield [line]
+        return
+    buf = bytearray()
+    while True:
+        chunk = read1(_STDIN_CHUNK_BYTES)
+        if not chunk:
+            if buf:
+                yield [bytes(buf)]
+            return
+        # Only the new chunk can hold a newline: buf has none left over.
+        newline = chunk.rfind(b"\n")
+        if newline < 0:
+            buf += chunk
+            continue
+        lines = (bytes(buf) + chunk[:newline]).split(b"\n")
+        buf[:] = chunk[newline + 1 :]
+        yield lines
+
+
+def _handle_request_line(line: Any) -> Optional[bytes]:
+    """Parse and dispatch one request line; return the encoded response, if any."""
+    if not line.strip():
+        # Blank keepalive lines: nothing to parse.
+        return None
+    try:
+        request = orjson.loads(line) if orjson is not None else json.loads(line)
+        if isinstance(request, list):
+            response = _dispatch_batch(request)
+        else:
+            response = _dispatch_request(request)
+        if response is None:
+            return None
+        return _encode_response(response)
+    except json.JSONDecodeError:
+        return None
+    except Exception as exc:
+        return _INTERNAL_ERROR_TEMPLATE % _dumps(f"Internal error: {exc}")
+
+
 def main() -> None:
     if ORCH is not None:
         # Recovery sweep: clean up stale tasks from any previous session before
@@ -3667,57 +4048,17 @@ def main() -> None:
         except Exception as exc:
             logger.warning("mcp_server.recovery_sweep failed: %s", exc)
         _start_auto_manager_loop()
-    while True:
-        try:
-            line = sys.stdin.readline()
-            if not line:
-                break
-
-            request = json.loads(line.strip())
-            method = request.get("method")
-            request_id = request.get("id")
-            params = request.get("params", {})
-
-            # JSON-RPC notifications do not include an id and must not receive responses.
-            is_notification = "id" not in request
-            if is_notification:
-                if method == "notifications/initialized":
-                    continue
-                # Ignore unknown notifications silently for compatibility with strict clients.
-                continue
-
-            if method == "initialize":
-                response = handle_initialize(request_id)
-            elif method == "tools/list":
-                response = handle_tools_list(request_id)
-            elif method == "tools/call":
-                response = handle_tool_call(request_id, params)
-            else:
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "error": {
-                        "code": -32601,
-                        "message": f"Method not found: {method}",
-                    },
-                }
-
-            send_response(response)
-        except json.JSONDecodeError:
-            continue
-        except EOFError:
-            break
-        except Exception as exc:
-            send_response(
-                {
-                    "jsonrpc": "2.0",
-                    "id": None,
-                    "error": {
-                        "code": -32603,
-                        "message": f"Internal error: {exc}",
-                    },
-                }
-            )
+    # Requests are read as bytes so orjson can parse them without a text
+    # decode; orjson.JSONDecodeError subclasses json.JSONDecodeError.
+    # Each response is written as soon as it is ready, rather than joined
+    # into one write per stdin read: a quick request pipelined ahead of a
+    # long-poll must not wait for the long-poll.
+    stdin = getattr(sys.stdin, "buffer", sys.stdin)
+    for lines in _iter_request_lines(stdin):
+        for line in lines:
+            payload = _handle_request_line(line)
+            if payload is not None:
+                _write_message(payload)
 
 
 if __name__ == "__main__":
@@ -111,6 +111,19 @@ class DiscoverAgentsTests(unittest.TestCase):
             self.assertTrue(inferred[0]["inferred"])
             self.assertFalse(inferred[0]["verified"])
 
+    def test_inferred_names_pick_up_new_events(self) -> None:
+        """Later events are folded into the cached inferred-name scan."""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            orch = _make_orch(root)
+            orch.publish_event("test.ping", "first_agent", {})
+            orch.discover_agents()
+            orch.publish_event("test.ping", "orchestrator", {"audience": ["second_agent"]})
+
+            names = {a.get("agent") for a in orch.discover_agents()["agents"]}
+
+            self.assertTrue({"first_agent", "second_agent"} <= names)
+
     def test_registered_not_duplicated_as_inferred(self) -> None:
         """A registered agent should not also appear as inferred."""
         with tempfile.TemporaryDirectory() as tmp:
@@ -9,6 +9,7 @@ import threading
 import time
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from orchestrator.bus import EventBus
 from orchestrator.engine import Orchestrator
@@ -97,6 +98,25 @@ class EventBusTests(_OrchestratorMixin, unittest.TestCase):
         acks_data = json.loads(self.orch.acks_path.read_text(encoding="utf-8"))
         self.assertEqual(acks_data.get("claude_code", []).count(event["event_id"]), 1)
 
+    def test_repeat_ack_skips_rewrite(self) -> None:
+        event = self.orch.publish_event("test.repeat", source="codex")
+        self.orch.ack_event(agent="claude_code", event_id=event["event_id"])
+        mtime_ns = self.orch.acks_path.stat().st_mtime_ns
+        self.orch.ack_event(agent="claude_code", event_id=event["event_id"])
+        self.assertEqual(self.orch.acks_path.stat().st_mtime_ns, mtime_ns)
+        self.assertIn(event["event_id"], self.orch._acked_event_ids("claude_code"))
+
+    def test_ack_set_extends_with_new_acks(self) -> None:
+        first = self.orch.publish_event("test.first", source="codex")
+        second = self.orch.publish_event("test.second", source="codex")
+        self.orch.ack_event(agent="claude_code", event_id=first["event_id"])
+        acked = self.orch._acked_event_ids("claude_code")
+        self.orch.ack_event(agent="claude_code", event_id=second["event_id"])
+        self.assertIs(acked, self.orch._acked_event_ids("claude_code"))
+        self.assertEqual({first["event_id"], second["event_id"]}, acked)
+        self.orch._write_json(self.orch.acks_path, {})
+        self.assertEqual(set(), self.orch._acked_event_ids("claude_code"))
+
     def test_ack_emits_event_acked(self) -> None:
         event = self.orch.publish_event("test.ackemit", source="codex")
         self.orch.ack_event(agent="claude_code", event_id=event["event_id"])
@@ -159,6 +179,54 @@ class EventCompactionTests(unittest.TestCase):
         self.assertEqual(result["archived"], 0)
         self.assertEqual(result["retained"], 0)
 
+    def test_iter_events_from_seeks_by_index(self) -> None:
+        for i in range(6):
+            self.bus.emit("test.evt", {"n": i}, source="codex")
+        self.assertEqual([0, 1, 2, 3, 4, 5], [e["payload"]["n"] for _, e in self.bus.iter_events_from(0)])
+        self.bus.emit("test.evt", {"n": 6}, source="codex")
+        tail = list(self.bus.iter_events_from(4))
+        self.assertEqual([4, 5, 6], [idx for idx, _ in tail])
+        self.assertEqual([4, 5, 6], [e["payload"]["n"] for _, e in tail])
+        self.assertEqual([], list(self.bus.iter_events_from(20)))
+        self.assertEqual(7, self.bus.event_count())
+
+    def test_deferred_emits_append_once_on_exit(self) -> None:
+        self.bus.emit("test.before", {}, source="codex")
+        with patch.object(self.bus, "_append_event_lines", wraps=self.bus._append_event_lines) as append:
+            with self.bus.deferred_emits():
+                first = self.bus.emit("test.a", {"n": 1}, source="codex")
+                with self.bus.deferred_emits():
+                    self.bus.emit("test.b", {"n": 2}, source="codex")
+                self.assertEqual(1, self.bus.event_count())
+        append.assert_called_once()
+        events = list(self.bus.iter_events())
+        self.assertEqual(["test.before", "test.a", "test.b"], [e["type"] for e in events])
+        self.assertEqual(first["event_id"], events[1]["event_id"])
+
+    def test_index_resets_after_compaction(self) -> None:
+        for i in range(12):
+            self.bus.emit("test.evt", {"n": i}, source="codex")
+        self.assertEqual(12, self.bus.event_count())
+        generation = self.bus.events_generation()
+        self.bus.compact_events(retention_limit=4)
+        self.assertNotEqual(generation, self.bus.events_generation())
+        self.assertEqual(4, self.bus.event_count())
+        self.assertEqual([9, 10, 11], [e["payload"]["n"] for _, e in self.bus.iter_events_from(1)])
+
+
+    def test_in_process_emit_wakes_fallback_long_poll(self) -> None:
+        self.bus.emit("test.before", {}, source="codex")
+        timer = threading.Timer(0.1, self.bus.emit, args=("test.evt", {}, "codex"))
+        with patch("orchestrator.bus.inotify_simple", None), \
+                patch.object(EventBus, "_POLL_FALLBACK_SLEEP", 30.0):
+            started = time.monotonic()
+            timer.start()
+            self.bus.wait_for_event_index(start=1, timeout_ms=20000)
+            elapsed = time.monotonic() - started
+        timer.join()
+        self.assertEqual(2, self.bus.event_count())
+        self.assertLess(elapsed, 5.0)
+
 
 class OrchestratorCompactionTests(_OrchestratorMixin, unittest.TestCase):
     retention = 10
@@ -174,6 +242,36 @@ class OrchestratorCompactionTests(_OrchestratorMixin, unittest.TestCase):
         self.assertGreater(adj, 0)
         self.assertEqual(self.orch.get_agent_cursor("claude_code"), max(0, cursor_before - adj))
 
+    def test_concurrent_reader_never_sees_unshifted_cursor(self) -> None:
+        for i in range(20):
+            self.orch.publish_event(f"test.bulk.{i}", source="codex")
+        self.orch.poll_events(agent="claude_code")
+        self.orch.get_agent_cursor("gemini")
+        cursor_before = self.orch.get_agent_cursor("claude_code")
+        self.assertTrue(self.orch.event_cursor_log_path.exists())
+
+        reader = _make_orch(self.root, retention=self.retention)
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(reader.get_agent_cursor("claude_code")))
+        publish = self.orch._publish_json
+
+        def publish_while_reading(path, tmp):
+            if path == self.orch.cursors_path and thread.ident is None:
+                # Snapshot swapped in, cursor log not yet dropped: the reader
+                # must wait rather than fold the old log onto the new snapshot.
+                staged = tmp.read_bytes()
+                tmp.replace(path)
+                thread.start()
+                thread.join(0.3)
+                tmp.write_bytes(staged)
+            publish(path, tmp)
+
+        with patch.object(self.orch, "_publish_json", side_effect=publish_while_reading):
+            result = self.orch.compact_events()
+        thread.join(5)
+        self.assertGreater(result["offset_adjustment"], 0)
+        self.assertEqual(seen, [max(0, cursor_before - result["offset_adjustment"])])
+
     def test_no_event_loss_for_lagging_agent(self) -> None:
         for i in range(20):
             self.orch.publish_event(f"test.seq.{i}", source="codex")
@@ -305,6 +403,20 @@ class PollEventsTests(_OrchestratorMixin, unittest.TestCase):
         self.assertEqual(len([e for e in result["events"] if e["type"] == "e2"]), 1)
         self.assertEqual(result["next_cursor"], 3)
 
+    def test_limit_merges_broadcast_and_targeted_in_order(self) -> None:
+        self.orch.bus.events_path.write_text("", encoding="utf-8")
+        self.orch.bus.emit("e0", {"audience": ["claude_code"]}, source="test")
+        self.orch.bus.emit("e1", {"audience": ["gemini"]}, source="test")
+        self.orch.bus.emit("e2", {}, source="test")
+        self.orch.bus.emit("e3", {"audience": ["gemini", "claude_code"]}, source="test")
+        self.orch.bus.emit("e4", {"audience": ["*"]}, source="test")
+        result = self.orch.poll_events(agent="claude_code", cursor=0, limit=2, auto_advance=False, timeout_ms=0)
+        self.assertEqual(["e0", "e2"], [e["type"] for e in result["events"]])
+        self.assertEqual(3, result["next_cursor"])
+        rest = self.orch.poll_events(agent="claude_code", cursor=3, limit=10, auto_advance=False, timeout_ms=0)
+        self.assertEqual([3, 4], [e["offset"] for e in rest["events"]])
+        self.assertEqual(5, rest["next_cursor"])
+
     def test_zero_timeout_returns_immediately(self) -> None:
         self.orch.bus.events_path.write_text("", encoding="utf-8")
         start = time.time()
@@ -526,6 +638,35 @@ class AgentCursorTests(unittest.TestCase):
             self.assertGreater(orch.get_agent_cursor("claude_code"),
                                orch.get_agent_cursor("gemini"))
 
+    def test_cursor_advance_appends_to_log(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = _make_orch(Path(tmp))
+            snapshot = orch.cursors_path.read_text(encoding="utf-8")
+            orch._set_agent_cursor("claude_code", 7)
+            self.assertEqual(snapshot, orch.cursors_path.read_text(encoding="utf-8"))
+            self.assertEqual(7, orch.get_agent_cursor("claude_code"))
+            lines = orch.event_cursor_log_path.read_text(encoding="utf-8").splitlines()
+            self.assertEqual([{"agent": "claude_code", "cursor": 7}], [json.loads(x) for x in lines])
+
+    def test_unchanged_cursor_skips_write(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = _make_orch(Path(tmp))
+            orch._set_agent_cursor("claude_code", 3)
+            size = orch.event_cursor_log_path.stat().st_size
+            orch._set_agent_cursor("claude_code", 3)
+            self.assertEqual(size, orch.event_cursor_log_path.stat().st_size)
+
+    def test_cursor_log_compacts_into_snapshot(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = _make_orch(Path(tmp))
+            orch._set_agent_cursor("claude_code", 4)
+            with orch._state_lock():
+                orch._compact_state_log_unlocked(orch.cursors_path)
+            self.assertFalse(orch.event_cursor_log_path.exists())
+            cursors = json.loads(orch.cursors_path.read_text(encoding="utf-8"))
+            self.assertEqual(4, cursors["claude_code"])
+            self.assertEqual(4, orch.get_agent_cursor("claude_code"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import json
+import os
 import tempfile
 import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch
 
-from orchestrator.engine import Orchestrator
+from orchestrator.engine import Orchestrator, orjson
 from orchestrator.policy import Policy
 
 
@@ -191,6 +192,42 @@ class MtimeCacheTests(unittest.TestCase):
         self.assertEqual(cached_ref[0]["status"], "in_progress",
                          "ingest_report must not corrupt cached reference")
 
+    @unittest.skipIf(orjson is None, "orjson not installed")
+    def test_lifecycle_never_mutates_cached_tasks_in_place(self) -> None:
+        """Rewrites reuse each cached task's last-written bytes, so no code
+        path may edit a cached task dict in place; this fails if one does."""
+        self._register_operational_agent()
+
+        def assert_cache_matches_bytes() -> None:
+            for cached, part in self.orch._task_fragments.values():
+                self.assertEqual(orjson.loads(part), cached)
+            on_disk = json.loads(self.orch.tasks_path.read_bytes())
+            self.assertEqual(on_disk, self.orch._read_json(self.orch.tasks_path))
+
+        root = {"project_root": str(self.root), "project_name": self.root.name}
+        tasks = [
+            self.orch.create_task(title=f"t{i}", workstream="backend", acceptance_criteria=["a"], **root)
+            for i in range(3)
+        ]
+        assert_cache_matches_bytes()
+        claimed = self.orch.claim_next_task(owner="claude_code")
+        assert_cache_matches_bytes()
+        self.orch.ingest_report({
+            "task_id": claimed["id"], "agent": "claude_code", "status": "done", "commit_sha": "abc123",
+            "test_summary": {"command": "pytest", "passed": 1, "failed": 0},
+        })
+        assert_cache_matches_bytes()
+        self.orch.validate_task(task_id=claimed["id"], passed=False, notes="n", source="codex")
+        assert_cache_matches_bytes()
+        self.orch.set_task_status(tasks[1]["id"], "blocked", source="codex")
+        assert_cache_matches_bytes()
+        self.orch.claim_next_task(owner="claude_code")
+        self.orch.requeue_stale_in_progress_tasks(stale_after_seconds=0)
+        self.orch.reassign_stale_tasks_to_active_workers(source="codex", stale_after_seconds=0)
+        self.orch.recover_expired_task_leases(source="codex", stale_after_seconds=0)
+        self.orch.dedupe_open_tasks(source="codex")
+        assert_cache_matches_bytes()
+
     def test_read_json_list_make_copy(self) -> None:
         """_read_json_list with make_copy=True returns independent copy."""
         blocker = {"id": "BLK-1", "status": "open", "task_id": "T1"}
@@ -238,6 +275,129 @@ class MtimeCacheTests(unittest.TestCase):
         avg_ms = (elapsed / iterations) * 1000
         self.assertLess(avg_ms, 1.0, f"avg claim_next_task={avg_ms:.3f}ms, expected <1ms")
 
+    @unittest.skipUnless(hasattr(os, "posix_fadvise"), "posix_fadvise not available")
+    def test_write_json_drops_written_pages_from_cache(self) -> None:
+        with patch("orchestrator.engine.os.posix_fadvise") as fadvise:
+            self.orch._write_json(self.orch.tasks_path, [])
+        fadvise.assert_called_once()
+        self.assertEqual(fadvise.call_args.args[1:], (0, 0, os.POSIX_FADV_DONTNEED))
+        self.assertEqual(self.orch._read_json(self.orch.tasks_path), [])
+
+    def test_stdlib_json_fallback_round_trip(self) -> None:
+        """Without orjson, state files are still read and written with stdlib json."""
+        payload = [{"id": "T1", "title": "caf\u00e9", "tags": ["a"]}]
+        with patch("orchestrator.engine.orjson", None):
+            self.orch._write_json(self.orch.tasks_path, payload)
+            self.orch._json_cache.clear()
+            self.assertEqual(self.orch._read_json(self.orch.tasks_path), payload)
+        self.orch._json_cache.clear()
+        self.assertEqual(self.orch._read_json(self.orch.tasks_path), payload)
+
+    def test_written_file_is_indented_json(self) -> None:
+        self.orch._write_json(self.orch.stale_notices_path, {"a": 1, 2: "int-key"})
+        text = self.orch.stale_notices_path.read_text(encoding="utf-8")
+        self.assertIn('\n  "a": 1', text)
+        self.assertEqual(json.loads(text), {"a": 1, "2": "int-key"})
+
+
+class TaskIndexTests(unittest.TestCase):
+    """Id/owner indexes over the cached tasks list."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.orch = _make_orch(self.root)
+        self.tasks = [
+            {"id": f"T{i}", "status": "assigned", "owner": "a" if i % 2 else "b"} for i in range(6)
+        ]
+        self.orch._write_json(self.orch.tasks_path, self.tasks)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_find_by_id_copies_only_the_match(self) -> None:
+        mutable = self.orch._read_json(self.orch.tasks_path, make_copy=True)
+        found = self.orch._find_by_id(self.orch.tasks_path, mutable, "T4")
+        self.assertEqual(found["id"], "T4")
+        self.assertEqual(mutable._copied, {4})
+        self.assertIsNone(self.orch._find_by_id(self.orch.tasks_path, mutable, "missing"))
+        self.assertEqual(mutable._copied, {4})
+
+    def test_index_reused_until_file_changes(self) -> None:
+        first = self.orch._id_positions(self.orch.tasks_path)
+        self.assertIs(self.orch._id_positions(self.orch.tasks_path), first)
+        self.orch._write_json(self.orch.tasks_path, list(reversed(self.tasks)))
+        self.assertEqual(self.orch._id_positions(self.orch.tasks_path)["T0"], 5)
+
+    def test_find_by_id_handles_diverged_list(self) -> None:
+        mutable = self.orch._read_json(self.orch.tasks_path, make_copy=True)
+        mutable.insert(0, {"id": "NEW"})
+        self.assertEqual(self.orch._find_by_id(self.orch.tasks_path, mutable, "T2")["id"], "T2")
+        self.assertEqual(self.orch._find_by_id(self.orch.tasks_path, mutable, "NEW")["id"], "NEW")
+
+    def test_status_and_owner_positions(self) -> None:
+        index = self.orch._task_indexes()
+        self.assertEqual(index.owner_positions["a"], [1, 3, 5])
+        self.assertEqual(index.status_positions["assigned"], list(range(6)))
+        self.assertFalse(hasattr(index, "__dict__"))
+
+    def test_claim_copies_only_owner_tasks(self) -> None:
+        self.orch.register_agent("a", metadata={
+            "client": "a", "model": "a", "cwd": str(self.root), "project_root": str(self.root),
+            "permissions_mode": "default", "sandbox_mode": "false", "session_id": "s",
+            "connection_id": "c", "server_version": "1.0", "verification_source": "a",
+        })
+        copies = []
+        original = Orchestrator._lazy_copy
+
+        def tracking(data):
+            lazy = original(data)
+            copies.append(lazy)
+            return lazy
+
+        with patch.object(Orchestrator, "_lazy_copy", staticmethod(tracking)):
+            claimed = self.orch.claim_next_task(owner="a")
+        self.assertEqual(claimed["id"], "T1")
+        task_copies = [c for c in copies if isinstance(c, list) and len(c) == 6]
+        self.assertTrue(task_copies)
+        self.assertTrue(all(c._copied <= {1, 3, 5} for c in task_copies))
+
+    def test_requeue_copies_only_stale_owner_tasks(self) -> None:
+        tasks = [dict(t, status="in_progress") for t in self.tasks]
+        self.orch._write_json(self.orch.tasks_path, tasks)
+        self.orch._write_json(self.orch.agents_path, {
+            "a": {"agent": "a", "status": "active", "last_seen": "2000-01-01T00:00:00+00:00"},
+            "b": {"agent": "b", "status": "active", "last_seen": self.orch._now()},
+        })
+        copies = []
+        original = Orchestrator._lazy_copy
+
+        def tracking(data):
+            lazy = original(data)
+            copies.append(lazy)
+            return lazy
+
+        with patch.object(Orchestrator, "_lazy_copy", staticmethod(tracking)), \
+                patch.object(self.orch, "compact_events"), patch.object(self.orch, "_cleanup_old_reports"):
+            requeued = self.orch.requeue_stale_in_progress_tasks(stale_after_seconds=60)
+        self.assertEqual([r["task_id"] for r in requeued], ["T1", "T3", "T5"])
+        task_copies = [c for c in copies if isinstance(c, list) and len(c) == 6]
+        self.assertTrue(task_copies)
+        self.assertTrue(all(c._copied <= {1, 3, 5} for c in task_copies))
+
+    def test_list_tasks_for_owner_uses_owner_index(self) -> None:
+        self.assertEqual([t["id"] for t in self.orch.list_tasks_for_owner("a")], ["T1", "T3", "T5"])
+        self.assertEqual(self.orch.list_tasks_for_owner("a", status="done"), [])
+        self.assertEqual(self.orch.list_tasks_for_owner("nobody"), [])
+
+    def test_loaded_fields_are_interned(self) -> None:
+        tasks = self.orch._read_json(self.orch.tasks_path)
+        self.assertIs(tasks[0]["status"], tasks[2]["status"])
+        self.assertIs(tasks[1]["owner"], tasks[3]["owner"])
+        self.orch._write_json(self.orch.agents_path, {"x": {"status": "active"}, "y": {"status": "active"}})
+        agents = self.orch._read_json(self.orch.agents_path)
+        self.assertIs(agents["x"]["status"], agents["y"]["status"])
+
 
 class LazyCopyListTests(unittest.TestCase):
     """Tests for _LazyCopyList lazy deep-copy behaviour."""
@@ -364,6 +524,91 @@ class LazyCopyListTests(unittest.TestCase):
         self.assertEqual(on_disk[0]["status"], "assigned")
         self.assertEqual(on_disk[4]["status"], "assigned")
 
+    def test_write_json_does_not_copy_untouched_items(self) -> None:
+        """Serialising a lazy copy must not deep-copy items nobody touched."""
+        tasks = [{"id": f"T{i}", "status": "assigned"} for i in range(5)]
+        self.orch._write_json(self.orch.tasks_path, tasks)
+        mutable = self.orch._read_json(self.orch.tasks_path, make_copy=True)
+        mutable[1]["status"] = "done"
+        self.orch._write_json(self.orch.tasks_path, mutable)
+        self.assertEqual(mutable._copied, {1})
+
+    @unittest.skipIf(orjson is None, "orjson not installed")
+    def test_rewrite_encodes_only_changed_tasks(self) -> None:
+        tasks = [{"id": f"T{i}", "status": "assigned", "tags": ["x"]} for i in range(5)]
+        self.orch._write_json(self.orch.tasks_path, tasks)
+        mutable = self.orch._read_json(self.orch.tasks_path, make_copy=True)
+        mutable[3]["status"] = "done"
+        mutable.append({"id": "T5", "status": "assigned", "tags": []})
+        with patch("orchestrator.engine.orjson.dumps", wraps=orjson.dumps) as dumps:
+            self.orch._write_json(self.orch.tasks_path, mutable)
+        self.assertEqual(dumps.call_count, 2)
+        on_disk = self.orch.tasks_path.read_bytes()
+        self.assertEqual(on_disk, orjson.dumps(json.loads(on_disk), option=orjson.OPT_INDENT_2))
+        self.assertEqual(json.loads(on_disk)[3]["status"], "done")
+
+    def test_write_seeds_cache_with_detached_tasks(self) -> None:
+        tasks = [{"id": "T0", "status": "assigned"}]
+        self.orch._write_json(self.orch.tasks_path, tasks)
+        tasks[0]["status"] = "mutated-after-write"
+        self.assertEqual(self.orch._read_json(self.orch.tasks_path), [{"id": "T0", "status": "assigned"}])
+
+
+class LazyCopyDictTests(unittest.TestCase):
+    """Tests for _LazyCopyDict lazy deep-copy behaviour."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.orch = _make_orch(self.root)
+        agents = {f"agent{i}": {"agent": f"agent{i}", "metadata": {"model": "m"}} for i in range(4)}
+        self.orch._write_json(self.orch.agents_path, agents)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_make_copy_returns_lazy_dict(self) -> None:
+        mutable = self.orch._read_json(self.orch.agents_path, make_copy=True)
+        self.assertIsInstance(mutable, dict)
+        self.assertEqual(mutable._copied, set())
+
+    def test_mutation_does_not_corrupt_cache(self) -> None:
+        mutable = self.orch._read_json(self.orch.agents_path, make_copy=True)
+        mutable["agent1"]["metadata"]["model"] = "changed"
+        mutable.get("agent2")["status"] = "active"
+        for _, entry in mutable.items():
+            entry["touched"] = True
+        copied = dict(mutable)
+        copied["agent3"]["metadata"]["model"] = "also_changed"
+        pristine = self.orch._read_json(self.orch.agents_path)
+        self.assertEqual(pristine["agent1"]["metadata"]["model"], "m")
+        self.assertEqual(pristine["agent3"]["metadata"]["model"], "m")
+        self.assertNotIn("status", pristine["agent2"])
+        self.assertNotIn("touched", pristine["agent0"])
+
+    def test_only_accessed_values_are_copied(self) -> None:
+        mutable = self.orch._read_json(self.orch.agents_path, make_copy=True)
+        mutable["agent2"]["status"] = "active"
+        self.assertEqual(mutable._copied, {"agent2"})
+
+    def test_assigned_values_keep_identity(self) -> None:
+        mutable = self.orch._read_json(self.orch.agents_path, make_copy=True)
+        entry = {"agent": "new"}
+        mutable["new"] = entry
+        self.assertIs(mutable["new"], entry)
+        self.assertIs(mutable.setdefault("other", {}), mutable["other"])
+
+    def test_write_back_round_trip(self) -> None:
+        mutable = self.orch._read_json(self.orch.agents_path, make_copy=True)
+        mutable["agent0"]["status"] = "active"
+        mutable.pop("agent3")
+        self.orch._write_json(self.orch.agents_path, mutable)
+        self.assertEqual(mutable._copied, {"agent0", "agent3"})
+        on_disk = json.loads(self.orch.agents_path.read_text(encoding="utf-8"))
+        self.assertEqual(on_disk["agent0"]["status"], "active")
+        self.assertNotIn("agent3", on_disk)
+        self.assertEqual(on_disk["agent1"], {"agent": "agent1", "metadata": {"model": "m"}})
+
 
 if __name__ == "__main__":
     unittest.main()
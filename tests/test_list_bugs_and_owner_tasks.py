@@ -182,6 +182,22 @@ class ListBugsTests(unittest.TestCase):
             bugs = orch.list_bugs()
             self.assertGreaterEqual(len(bugs), 1)
 
+    def test_unfiltered_result_is_a_fresh_list(self) -> None:
+        """Mutating the returned list must not leak into later calls."""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            orch = _make_orch(root)
+            _register_agent(orch, "claude_code")
+
+            _full_lifecycle_to_bug(orch, "Fresh list task", "claude_code")
+
+            bugs = orch.list_bugs()
+            bugs.clear()
+            self.assertGreaterEqual(len(orch.list_bugs()), 1)
+            tasks = orch.list_tasks()
+            tasks.clear()
+            self.assertGreaterEqual(len(orch.list_tasks()), 1)
+
     def test_filter_by_status_open(self) -> None:
         """list_bugs(status='open') should return only open bugs."""
         with tempfile.TemporaryDirectory() as tmp:
@@ -10,8 +10,11 @@ from __future__ import annotations
 
 import json
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from orchestrator.engine import Orchestrator
 from orchestrator.policy import Policy
@@ -582,6 +585,52 @@ class ManagerCycleNonBlockingConnectTests(unittest.TestCase):
             self.assertEqual("connected", result["status"])
             self.assertIn("claude_code", result["connected"])
 
+    def test_blocking_connect_wakes_on_registration(self) -> None:
+        """A registration mid-wait is picked up without sitting out the poll interval."""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            orch = _make_orch(root)
+            joiner = threading.Timer(0.3, _connect_agent, args=(orch, root, "claude_code"))
+            joiner.start()
+            try:
+                started = time.monotonic()
+                result = orch.connect_team_members(
+                    source="codex",
+                    team_members=["claude_code"],
+                    timeout_seconds=20,
+                    poll_interval_seconds=15,
+                )
+            finally:
+                joiner.join()
+
+            self.assertEqual("connected", result["status"])
+            self.assertLess(time.monotonic() - started, 10)
+
+    def test_event_between_check_and_wait_is_not_missed(self) -> None:
+        """An event emitted right after a failed check ends the wait immediately."""
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = _make_orch(Path(tmp))
+            calls = []
+
+            def check(requested, stale_after_seconds):
+                calls.append(requested)
+                if len(calls) == 1:
+                    orch.bus.emit("agent.heartbeat", {"agent": "claude_code"}, source="claude_code")
+                    return []
+                return list(requested)
+
+            with patch.object(orch, "_connected_team_members", side_effect=check):
+                started = time.monotonic()
+                result = orch.connect_team_members(
+                    source="codex",
+                    team_members=["claude_code"],
+                    timeout_seconds=20,
+                    poll_interval_seconds=15,
+                )
+
+            self.assertEqual("connected", result["status"])
+            self.assertLess(time.monotonic() - started, 0.4)
+
 
 if __name__ == "__main__":
     unittest.main()
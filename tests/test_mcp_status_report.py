@@ -0,0 +1,142 @@
+"""Tests for the MCP server's live status report and manager cycle summaries."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from orchestrator.engine import Orchestrator
+from orchestrator.policy import Policy
+
+
+def _make_orch(root: Path) -> Orchestrator:
+    raw = {
+        "name": "test-policy",
+        "roles": {"manager": "codex"},
+        "routing": {"backend": "claude_code", "frontend": "gemini", "default": "codex"},
+        "triggers": {"heartbeat_timeout_minutes": 10, "lease_ttl_seconds": 300},
+    }
+    (root / "policy.json").write_text(json.dumps(raw), encoding="utf-8")
+    orch = Orchestrator(root=root, policy=Policy.load(root / "policy.json"))
+    orch.bootstrap()
+    return orch
+
+
+def _task(task_id: str, workstream: str, status: str, owner: str = "claude_code") -> dict:
+    return {"id": task_id, "title": task_id, "workstream": workstream, "status": status, "owner": owner}
+
+
+class PercentTests(unittest.TestCase):
+    def test_rounds_half_up_with_integer_math(self) -> None:
+        from orchestrator_mcp_server import _percent
+
+        self.assertEqual(_percent(0, 0), 0)
+        self.assertEqual(_percent(1, 3), 33)
+        self.assertEqual(_percent(2, 3), 67)
+        self.assertEqual(_percent(1, 8), 13)
+        self.assertEqual(_percent(5, 5), 100)
+
+
+class LiveStatusReportTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.orch = _make_orch(Path(self._tmp.name))
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _report(self, tasks: list) -> dict:
+        import orchestrator_mcp_server as srv
+
+        self.orch._write_json(self.orch.tasks_path, tasks)
+        with patch.object(srv, "ORCH", self.orch):
+            return srv._live_status_report({})["report"]
+
+    def test_counts_and_focus_tasks(self) -> None:
+        report = self._report([
+            _task("B1", "backend", "done"),
+            _task("B2", "backend", "in_progress"),
+            _task("B3", "backend", "assigned"),
+            _task("F1", "frontend", "done"),
+            _task("Q1", "qa", "reported", owner="codex"),
+        ])
+        self.assertEqual(report["overall_project_percent"], 40)
+        self.assertEqual(report["backend_percent"], 33)
+        self.assertEqual(report["backend_task_id"], "B2")
+        self.assertEqual(report["frontend_percent"], 100)
+        # Every frontend task is done: focus falls back to the last one.
+        self.assertEqual(report["frontend_task_id"], "F1")
+        self.assertEqual(report["pipeline_health"]["reported_tasks"], 1)
+
+    def test_empty_task_list(self) -> None:
+        report = self._report([])
+        self.assertEqual(report["backend_task_id"], "n/a")
+        self.assertEqual(report["frontend_task_id"], "n/a")
+        self.assertEqual(report["pipeline_health"]["reported_tasks"], 0)
+
+
+    def test_project_identity_reparsed_only_when_project_yaml_changes(self) -> None:
+        import orchestrator_mcp_server as srv
+
+        root = Path(self._tmp.name)
+        project_yaml = root / "project.yaml"
+        project_yaml.write_text('name: alpha\nversion:\n  current: "1.0"\n', encoding="utf-8")
+        with patch.object(srv, "_parse_project_identity", wraps=srv._parse_project_identity) as parse:
+            first = srv._project_identity(root)
+            first["project_name"] = "mutated"
+            self.assertEqual(srv._project_identity(root)["project_name"], "alpha")
+            self.assertEqual(parse.call_count, 1)
+            project_yaml.write_text('name: beta-project\nversion:\n  current: "2.0"\n', encoding="utf-8")
+            self.assertEqual(srv._project_identity(root)["project_name"], "beta-project")
+            self.assertEqual(parse.call_count, 2)
+
+
+class ManagerCycleReportTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.orch = _make_orch(Path(self._tmp.name))
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_reported_task_without_report_file_fails_validation(self) -> None:
+        import orchestrator_mcp_server as srv
+
+        task = self.orch.create_task(title="t", workstream="backend", acceptance_criteria=["a"])
+        tasks = self.orch._read_json(self.orch.tasks_path, make_copy=True)
+        tasks[0]["status"] = "reported"
+        self.orch._write_json(self.orch.tasks_path, tasks)
+        with patch.object(srv, "ORCH", self.orch):
+            cycle = srv._manager_cycle(strict=True)
+        self.assertEqual([(p["task_id"], p["passed"]) for p in cycle["processed_reports"]], [(task["id"], False)])
+
+    def test_contracts_tolerate_tasks_missing_fields(self) -> None:
+        import orchestrator_mcp_server as srv
+
+        task = self.orch.create_task(title="t", workstream="backend", acceptance_criteria=["a"])
+        tasks = self.orch._read_json(self.orch.tasks_path, make_copy=True)
+        del tasks[0]["title"]
+        self.orch._write_json(self.orch.tasks_path, tasks)
+        with patch.object(srv, "ORCH", self.orch):
+            srv._manager_cycle(strict=True)
+        contracts = json.loads((self.orch.state_dir / "last_published_contracts.json").read_text(encoding="utf-8"))
+        self.assertEqual(contracts[0]["task_id"], task["id"])
+        self.assertIsNone(contracts[0]["title"])
+        self.assertEqual(contracts[0]["acceptance_criteria"], ["a"])
+
+    def test_report_files_are_read_in_task_order(self) -> None:
+        from orchestrator_mcp_server import _read_report_files
+
+        reports = Path(self._tmp.name) / "reports"
+        reports.mkdir()
+        for task_id in ("T1", "T3"):
+            (reports / f"{task_id}.json").write_bytes(task_id.encode())
+        self.assertEqual(_read_report_files(str(reports), ["T3", "T2", "T1"]), [b"T3", None, b"T1"])
+        self.assertEqual(_read_report_files(str(reports), []), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+"""Tests for the MCP server's JSON-RPC framing and dispatch."""
+
+from __future__ import annotations
+
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+
+class ToolsListResponseTests(unittest.TestCase):
+    def test_tools_list_reuses_cached_catalogue(self) -> None:
+        from orchestrator_mcp_server import handle_tools_list
+
+        first = handle_tools_list(1)
+        second = handle_tools_list(2)
+        self.assertIs(first["result"], second["result"])
+        self.assertEqual(second["id"], 2)
+
+    def test_tools_list_fast_path_matches_full_encoding(self) -> None:
+        from orchestrator_mcp_server import _dumps, handle_tools_list, send_response
+
+        for request_id in (7, "req-é", None):
+            response = handle_tools_list(request_id)
+            buf = io.StringIO()
+            with redirect_stdout(buf):
+                send_response(response)
+            # A structurally equal copy takes the full encoding path.
+            self.assertEqual(buf.getvalue(), _dumps(json.loads(json.dumps(response))).decode() + "\n")
+
+
+class JsonEncodingTests(unittest.TestCase):
+    def test_stdlib_fallback_without_orjson(self) -> None:
+        import orchestrator_mcp_server as srv
+
+        with patch.object(srv, "orjson", None):
+            self.assertEqual(srv._dumps({"a": [1]}), b'{"a": [1]}')
+            self.assertEqual(srv._json_text({"a": 1}), '{\n  "a": 1\n}')
+            self.assertEqual(srv._parse_json_argument('{"a": 1}', "object"), {"a": 1})
+
+    def test_values_orjson_rejects_fall_back_to_json(self) -> None:
+        from orchestrator_mcp_server import _dumps, _json_text
+
+        big = 1 << 70
+        self.assertEqual(json.loads(_dumps({"n": big})), {"n": big})
+        self.assertEqual(json.loads(_json_text({1: big})), {"1": big})
+
+
+class WriteMessageTests(unittest.TestCase):
+    def test_binary_stream_gets_one_framed_write(self) -> None:
+        from orchestrator_mcp_server import send_response
+
+        raw = io.BytesIO()
+        out = io.TextIOWrapper(raw, encoding="utf-8")
+        out.write("before\n")
+        with patch("sys.stdout", out):
+            send_response({"jsonrpc": "2.0", "id": 1, "result": {"text": "é"}})
+        lines = raw.getvalue().decode("utf-8").splitlines()
+        self.assertEqual(lines[0], "before")
+        self.assertEqual(json.loads(lines[1])["result"]["text"], "é")
+
+
+class ToolDispatchTests(unittest.TestCase):
+    def test_every_listed_tool_has_a_handler(self) -> None:
+        from orchestrator_mcp_server import _TOOL_HANDLERS, handle_tools_list
+
+        listed = {tool["name"] for tool in handle_tools_list(1)["result"]["tools"]}
+        self.assertEqual(listed - set(_TOOL_HANDLERS), set())
+
+    def test_unknown_tool_returns_error(self) -> None:
+        import orchestrator_mcp_server as srv
+
+        # Keep the error audit row out of the repo's own bus/audit.jsonl.
+        with patch.object(srv, "_audit_tool_call") as audit:
+            response = srv.handle_tool_call(3, {"name": "orchestrator_nope", "arguments": {}})
+        self.assertEqual(response["error"]["message"], "Unknown tool: orchestrator_nope")
+        self.assertEqual(audit.call_args.kwargs["status"], "error")
+
+    def test_degraded_mode_rejects_only_bound_tools(self) -> None:
+        import orchestrator_mcp_server as srv
+
+        with patch.object(srv, "ORCH", None), patch.object(srv, "_BINDING_ERROR", "bad root"):
+            blocked = srv.handle_tool_call(1, {"name": "orchestrator_list_tasks", "arguments": {}})
+            guide = srv.handle_tool_call(2, {"name": "orchestrator_guide", "arguments": {}})
+        self.assertTrue(blocked["result"]["isError"])
+        self.assertIn("orchestrator_binding_error", blocked["result"]["content"][0]["text"])
+        self.assertNotIn("isError", guide["result"])
+
+
+class MainLoopTests(unittest.TestCase):
+    def test_reads_byte_lines_and_skips_unparseable_ones(self) -> None:
+        import orchestrator_mcp_server as srv
+
+        raw = b'\n'.join([
+            b'{"jsonrpc": "2.0", "id": 1, "method": "tools/list"}',
+            b"",
+            b"not json",
+            b'  {"jsonrpc": "2.0", "id": "\xc3\xa9", "method": "tools/list"}  ',
+        ]) + b"\n"
+        writes = []
+        stdin = io.TextIOWrapper(io.BytesIO(raw), encoding="utf-8")
+        with patch.object(srv, "ORCH", None), patch.object(srv.sys, "stdin", stdin), \
+                patch.object(srv, "_write_message", writes.append):
+            srv.main()
+        self.assertEqual([json.loads(payload)["id"] for payload in writes], [1, "\u00e9"])
+
+    def test_pipelined_response_is_written_before_next_call_runs(self) -> None:
+        import orchestrator_mcp_server as srv
+
+        raw = (
+            b'{"jsonrpc": "2.0", "id": 1, "method": "tools/list"}\n'
+            b'{"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": {"name": "slow"}}\n'
+        )
+        writes = []
+        written_before_call = []
+
+        def slow_call(request_id, params):
+            written_before_call.extend(json.loads(payload)["id"] for payload in writes)
+            return {"jsonrpc": "2.0", "id": request_id, "result": {}}
+
+        stdin = io.TextIOWrapper(io.BytesIO(raw), encoding="utf-8")
+        with patch.object(srv, "ORCH", None), patch.object(srv.sys, "stdin", stdin), \
+                patch.object(srv, "_write_message", writes.append), \
+                patch.object(srv, "handle_tool_call", slow_call):
+            srv.main()
+        self.assertEqual(written_before_call, [1])
+        self.assertEqual([json.loads(payload)["id"] for payload in writes], [1, 2])
+
+    def test_request_lines_split_across_reads(self) -> None:
+        from orchestrator_mcp_server import _iter_request_lines
+
+        class _Chunked:
+            def __init__(self, chunks):
+                self._chunks = list(chunks)
+
+            def read1(self, size):
+                return self._chunks.pop(0) if self._chunks else b""
+
+        stream = _Chunked([b'{"a":', b' 1}\n{"b": 2}\n{"c"', b": 3}\n\n", b'{"d": 4}'])
+        self.assertEqual(
+            list(_iter_request_lines(stream)),
+            [[b'{"a": 1}', b'{"b": 2}'], [b'{"c": 3}', b""], [b'{"d": 4}']],
+        )
+        self.assertEqual(list(_iter_request_lines(io.StringIO("x\ny"))), [["x\n"], ["y"]])
+        long_line = _Chunked([b"a" * 5, b"b" * 5, b"c" * 5 + b"\nd", b"\n"])
+        self.assertEqual(list(_iter_request_lines(long_line)), [[b"aaaaabbbbbccccc"], [b"d"]])
+
+    def test_internal_error_is_answered_and_loop_continues(self) -> None:
+        import orchestrator_mcp_server as srv
+
+        with patch.object(srv, "_dispatch_request", side_effect=RuntimeError("boom")):
+            payload = srv._handle_request_line(b'{"jsonrpc": "2.0", "id": 1, "method": "x"}')
+        self.assertEqual(
+            json.loads(payload),
+            {"jsonrpc": "2.0", "id": None, "error": {"code": -32603, "message": "Internal error: boom"}},
+        )
+        with patch.object(srv, "_dispatch_request", side_effect=RuntimeError('say "hi"\n')):
+            payload = srv._handle_request_line(b'{"jsonrpc": "2.0", "id": 1, "method": "x"}')
+        self.assertEqual(json.loads(payload)["error"]["message"], 'Internal error: say "hi"\n')
+        self.assertIsNone(srv._handle_request_line(b"{"))
+
+
+class BatchRequestTests(unittest.TestCase):
+    def test_batch_answers_requests_in_order_and_skips_notifications(self) -> None:
+        from orchestrator_mcp_server import _dispatch_batch
+
+        responses = _dispatch_batch([
+            {"jsonrpc": "2.0", "id": 1, "method": "initialize"},
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            {"jsonrpc": "2.0", "id": 2, "method": "nope"},
+            "garbage",
+        ])
+        self.assertEqual([r["id"] for r in responses], [1, 2, None])
+        self.assertIn("result", responses[0])
+        self.assertEqual(responses[1]["error"]["code"], -32601)
+        self.assertEqual(responses[2]["error"]["code"], -32600)
+
+    def test_batch_of_notifications_gets_no_response(self) -> None:
+        from orchestrator_mcp_server import _dispatch_batch
+
+        self.assertIsNone(_dispatch_batch([{"jsonrpc": "2.0", "method": "notifications/initialized"}]))
+
+    def test_empty_batch_is_invalid(self) -> None:
+        from orchestrator_mcp_server import _dispatch_batch
+
+        self.assertEqual(_dispatch_batch([])["error"]["code"], -32600)
+
+    def test_batch_response_is_one_message(self) -> None:
+        from orchestrator_mcp_server import _dispatch_batch, send_response
+
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            send_response(_dispatch_batch([
+                {"jsonrpc": "2.0", "id": 1, "method": "tools/list"},
+                {"jsonrpc": "2.0", "id": 2, "method": "initialize"},
+            ]))
+        lines = buf.getvalue().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual([r["id"] for r in json.loads(lines[0])], [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -210,6 +210,35 @@ class TestReportDeduplication:
         assert len(dedupe_events) == 0
 
 
+class TestReportPayloadValidation:
+    @staticmethod
+    def _report(**overrides):
+        report = {
+            "commit_sha": "abc123",
+            "test_summary": {"command": "pytest", "passed": 3, "failed": 0},
+        }
+        report.update(overrides)
+        return report
+
+    def test_valid_payload_passes(self, temp_orchestrator: Orchestrator):
+        temp_orchestrator._validate_report_payload(self._report())
+
+    @pytest.mark.parametrize(
+        ("overrides", "message"),
+        [
+            ({"commit_sha": "  "}, "commit_sha must be a non-empty string"),
+            ({"test_summary": []}, "test_summary must be an object"),
+            ({"test_summary": {"command": "pytest", "failed": 0}}, "missing required field: passed"),
+            ({"test_summary": {"command": "", "passed": 1, "failed": 0}}, "command must be a non-empty string"),
+            ({"test_summary": {"command": "pytest", "passed": -1, "failed": 0}}, "passed must be a non-negative"),
+            ({"test_summary": {"command": "pytest", "passed": 1, "failed": "0"}}, "failed must be a non-negative"),
+        ],
+    )
+    def test_invalid_payload_reports_first_problem(self, temp_orchestrator: Orchestrator, overrides, message):
+        with pytest.raises(ValueError, match=message):
+            temp_orchestrator._validate_report_payload(self._report(**overrides))
+
+
 class TestReportCleanup:
     def test_cleanup_removes_old_reports(self, temp_orchestrator: Orchestrator, mock_now, tmp_path: Path):
         agent_name = "test_agent"
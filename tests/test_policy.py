@@ -0,0 +1,142 @@
+"""Tests for Policy loading."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from orchestrator.policy import Policy
+
+
+class PolicyLoadTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "policy.json"
+        self._write({"name": "p1", "roles": {"manager": "codex"}})
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _write(self, raw: dict, mtime_ns: int = 1_000_000_000) -> None:
+        self.path.write_text(json.dumps(raw), encoding="utf-8")
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_unchanged_file_reuses_parsed_sections(self) -> None:
+        first, second = Policy.load(self.path), Policy.load(self.path)
+        self.assertIs(first.roles, second.roles)
+        self.assertEqual(first, second)
+
+    def test_trigger_edits_stay_on_their_own_instance(self) -> None:
+        self._write({"name": "p1", "triggers": {"auto_plan_limit": 1}}, mtime_ns=7_000_000_000)
+        first = Policy.load(self.path)
+        first.triggers["auto_plan_limit"] = 5
+        self.assertEqual(Policy.load(self.path).triggers["auto_plan_limit"], 1)
+
+    def test_nested_trigger_edits_stay_on_their_own_instance(self) -> None:
+        self._write({"triggers": {"quality_gates": {"enabled": False}}}, mtime_ns=9_000_000_000)
+        Policy.load(self.path).triggers["quality_gates"]["enabled"] = True
+        self.assertFalse(Policy.load(self.path).triggers["quality_gates"]["enabled"])
+
+    def test_rewritten_file_is_reparsed(self) -> None:
+        first = Policy.load(self.path)
+        self._write({"name": "p2", "roles": {"manager": "claude_code"}}, mtime_ns=2_000_000_000)
+        second = Policy.load(self.path)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.name, "p2")
+        self.assertEqual(second.manager(), "claude_code")
+
+    def test_name_defaults_to_file_stem(self) -> None:
+        self._write({}, mtime_ns=3_000_000_000)
+        policy = Policy.load(self.path)
+        self.assertEqual(policy.name, "policy")
+        self.assertEqual(policy.voters(), ("codex", "claude_code", "gemini"))
+
+    def test_stdlib_json_fallback(self) -> None:
+        self._write({"name": "caf\u00e9", "triggers": {"a": 1}}, mtime_ns=4_000_000_000)
+        with patch("orchestrator.policy.orjson", None):
+            policy = Policy.load(self.path)
+        self.assertEqual(policy.name, "caf\u00e9")
+        self.assertEqual(policy.triggers, {"a": 1})
+
+    def test_policy_is_frozen_and_slotted(self) -> None:
+        policy = Policy.load(self.path)
+        self.assertFalse(hasattr(policy, "__dict__"))
+        with self.assertRaises(AttributeError):
+            policy.name = "other"  # type: ignore[misc]
+
+    def test_file_grown_since_stat_is_read_whole(self) -> None:
+        from orchestrator.policy import _read_policy_bytes
+
+        self._write({"name": "grown", "triggers": {"pad": "x" * 1000}})
+        self.assertEqual(json.loads(_read_policy_bytes(str(self.path), 10))["name"], "grown")
+
+    def test_architecture_settings_resolved_at_construction(self) -> None:
+        policy = Policy(
+            name="p",
+            roles={},
+            routing={},
+            decisions={"architecture": {"mode": "leader", "members": ["a", "b"]}},
+            triggers={},
+        )
+        self.assertEqual(policy.architecture_mode(), "leader")
+        self.assertEqual(policy.voters(), ("a", "b"))
+        self.assertIs(policy.voters(), policy.voters())
+
+    def test_role_and_routing_names_are_interned(self) -> None:
+        self._write({"roles": {"manager": "codex"}, "routing": {"backend": "claude_code"}}, mtime_ns=5_000_000_000)
+        policy = Policy.load(self.path)
+        self.assertIs(policy.manager(), sys.intern("codex"))
+        self.assertIs(policy.task_owner_for("backend"), sys.intern("claude_code"))
+        self.assertIs(next(iter(policy.routing)), sys.intern("backend"))
+
+    def test_task_owner_falls_back_to_default_then_manager(self) -> None:
+        routed = Policy("p", {"manager": "m"}, {"backend": "b", "default": "d"}, {}, {})
+        self.assertEqual(routed.task_owner_for("backend"), "b")
+        self.assertEqual(routed.task_owner_for("qa"), "d")
+        self.assertEqual(Policy("p", {"manager": "m"}, {}, {}, {}).task_owner_for("qa"), "m")
+        self.assertEqual(Policy("p", {}, {}, {}, {}).task_owner_for("qa"), "codex")
+
+    def test_loaded_sections_are_read_only(self) -> None:
+        policy = Policy.load(self.path)
+        with self.assertRaises(TypeError):
+            policy.roles["manager"] = "other"  # type: ignore[index]
+        self.assertEqual(Policy.load(self.path).manager(), "codex")
+
+    def test_nested_decisions_are_read_only(self) -> None:
+        self._write({"decisions": {"architecture": {"mode": "leader", "members": ["a"]}}}, mtime_ns=8_000_000_000)
+        architecture = Policy.load(self.path).decisions["architecture"]
+        with self.assertRaises(TypeError):
+            architecture["mode"] = "consensus"  # type: ignore[index]
+        self.assertEqual(architecture["members"], ("a",))
+        self.assertEqual(Policy.load(self.path).architecture_mode(), "leader")
+
+    def test_non_string_architecture_mode_is_rejected(self) -> None:
+        self._write({"decisions": {"architecture": {"mode": 3}}}, mtime_ns=6_000_000_000)
+        with self.assertRaisesRegex(ValueError, "architecture.mode must be a string"):
+            Policy.load(self.path)
+
+    @unittest.skipUnless(hasattr(os, "posix_fadvise"), "posix_fadvise not available")
+    def test_policy_read_requests_readahead(self) -> None:
+        from orchestrator.policy import _read_policy_bytes
+
+        with patch("orchestrator.policy.os.posix_fadvise") as fadvise:
+            _read_policy_bytes(str(self.path), self.path.stat().st_size)
+        self.assertEqual(fadvise.call_args.args[1:], (0, 0, os.POSIX_FADV_WILLNEED))
+
+    def test_load_many_preserves_order(self) -> None:
+        paths = []
+        for i in range(3):
+            path = Path(self._tmp.name) / f"p{i}.json"
+            path.write_text(json.dumps({"name": f"p{i}"}), encoding="utf-8")
+            paths.append(path)
+        self.assertEqual([p.name for p in Policy.load_many(paths)], ["p0", "p1", "p2"])
+        self.assertEqual(Policy.load_many([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import json
+import os
 import tempfile
 import unittest
+import unittest.mock
+from datetime import datetime, timezone
 from pathlib import Path
 
 from orchestrator.engine import Orchestrator
@@ -179,6 +182,27 @@ class StatusTests(_OrchestratorTestCase):
         self.assertEqual(cc["task_counts"]["superseded"], 1)
         self.assertEqual(cc["task_counts"]["archived"], 1)
 
+    def test_task_counts_are_per_agent(self) -> None:
+        _register(self.orch, "claude_code")
+        _register(self.orch, "gemini")
+        self.orch.create_task("backend 1", "backend", ["test"], owner="claude_code")
+        self.orch.create_task("backend 2", "backend", ["test"], owner="claude_code")
+        self.orch.create_task("frontend 1", "frontend", ["test"], owner="gemini")
+        counts = {a["agent"]: a["task_counts"] for a in self.orch.list_agents(active_only=False)}
+        self.assertEqual(counts["claude_code"], {
+            "assigned": 2, "in_progress": 0, "blocked": 0, "done": 0, "superseded": 0, "archived": 0,
+        })
+        self.assertEqual(counts["gemini"]["assigned"], 1)
+
+    def test_list_agents_leaves_cached_entries_untouched(self) -> None:
+        _register(self.orch, "claude_code")
+        cached = self.orch._read_agents()["claude_code"]
+        before = dict(cached)
+        listed = self.orch.list_agents()
+        self.assertIn("task_counts", listed[0])
+        self.assertEqual(before, cached)
+        self.assertNotIn("task_counts", cached)
+
     def test_reassign_stale_ignores_superseded_and_archived(self) -> None:
         _register(self.orch, "claude_code")
         t1 = self.orch.create_task("s1", "backend", ["test"], owner="claude_code")
@@ -419,5 +443,225 @@ class MetadataTests(_OrchestratorTestCase):
         self.assertEqual(entry["metadata"]["instance_id"], "fresh-id")
 
 
+# ── Operational guard tests ───────────────────────────────────────────
+
+class OperationalGuardTests(_OrchestratorTestCase):
+    """_agent_is_operational uses the lean identity check, not a full snapshot."""
+
+    def test_complete_same_project_agent_is_operational(self) -> None:
+        _register(self.orch, "claude_code")
+        self.assertTrue(self.orch._agent_is_operational("claude_code"))
+
+    def test_stale_agent_remains_operational(self) -> None:
+        _register(self.orch, "claude_code")
+        _make_stale(self.orch, "claude_code")
+        self.assertTrue(self.orch._agent_is_operational("claude_code"))
+
+    def test_missing_identity_field_not_operational(self) -> None:
+        _register(self.orch, "claude_code", model="")
+        self.assertFalse(self.orch._agent_is_operational("claude_code"))
+
+    def test_other_project_not_operational(self) -> None:
+        with tempfile.TemporaryDirectory() as other:
+            _register(self.orch, "claude_code", cwd=other, project_root=other)
+            self.assertFalse(self.orch._agent_is_operational("claude_code"))
+
+    def test_guard_skips_identity_snapshot(self) -> None:
+        _register(self.orch, "claude_code")
+        with unittest.mock.patch.object(self.orch, "_identity_snapshot", side_effect=AssertionError("built")):
+            self.assertTrue(self.orch._agent_is_operational("claude_code"))
+
+    def test_guard_does_not_take_state_lock(self) -> None:
+        _register(self.orch, "claude_code")
+        with unittest.mock.patch.object(self.orch, "_state_lock", side_effect=AssertionError("locked")):
+            self.assertTrue(self.orch._agent_is_operational("claude_code"))
+
+    def test_agents_snapshot_is_read_only(self) -> None:
+        _register(self.orch, "claude_code")
+        snapshot = self.orch._agents_snapshot()
+        self.assertIn("claude_code", snapshot)
+        with self.assertRaises(TypeError):
+            snapshot["gemini"] = {}  # type: ignore[index]
+
+    def test_agents_snapshot_is_published_by_writes(self) -> None:
+        _register(self.orch, "claude_code")
+        published = self.orch._agents_published[1]
+        with unittest.mock.patch.object(self.orch, "_read_agents", side_effect=AssertionError("rebuilt")):
+            self.assertIs(self.orch._agents_snapshot(), published)
+
+    def test_agents_snapshot_sees_external_writes(self) -> None:
+        _register(self.orch, "claude_code")
+        self.orch._agents_snapshot()
+        other = _make_orch(self.root)
+        _make_stale(other, "claude_code")
+        self.assertEqual(self.orch._agents_snapshot()["claude_code"]["last_seen"], "2020-01-01T00:00:00+00:00")
+
+    def test_check_same_project_and_complete_pair(self) -> None:
+        entry = _register(self.orch, "claude_code")
+        self.assertEqual(self.orch._check_same_project_and_complete(entry), (True, True))
+        self.assertEqual(self.orch._check_same_project_and_complete({}), (False, False))
+
+    def test_unregistered_diagnostic_skips_task_scan(self) -> None:
+        with unittest.mock.patch.object(self.orch, "list_tasks", side_effect=AssertionError("scanned")):
+            diag = self.orch._team_member_connect_diagnostic("gemini", stale_after_seconds=600)
+        self.assertFalse(diag["registered"])
+        self.assertFalse(diag["active"])
+        self.assertEqual(diag["reason"], "not_registered")
+        self.assertEqual(diag["owned_open_tasks"], 0)
+        self.assertFalse(diag["identity"]["verified"])
+
+    def test_diagnose_all_matches_per_agent_diagnostics(self) -> None:
+        _register(self.orch, "claude_code")
+        _register(self.orch, "gemini")
+        _make_stale(self.orch, "gemini")
+        self.orch.create_task(
+            title="Backend task", workstream="backend", owner="claude_code",
+            acceptance_criteria=["done"],
+        )
+        expected = {
+            name: self.orch._team_member_connect_diagnostic(name, stale_after_seconds=600)
+            for name in ("claude_code", "gemini", "codex")
+        }
+        with unittest.mock.patch.object(self.orch, "_tasks_view", wraps=self.orch._tasks_view) as tasks_view:
+            bulk = self.orch._diagnose_all(stale_after_seconds=600, team_members=["claude_code", "gemini", "codex"])
+        tasks_view.assert_called_once()
+        self.assertEqual(bulk, expected)
+        self.assertEqual(bulk["claude_code"]["owned_open_tasks"], 1)
+        self.assertFalse(bulk["gemini"]["active"])
+
+    def test_diagnose_all_defaults_to_registered_agents(self) -> None:
+        _register(self.orch, "claude_code")
+        self.assertEqual(list(self.orch._diagnose_all(stale_after_seconds=600)), ["claude_code"])
+
+
+class LastSeenClockTests(_OrchestratorTestCase):
+    """Ages of last_seen values stamped by this process skip ISO parsing."""
+
+    def test_fresh_heartbeat_age_uses_stamped_timestamp(self) -> None:
+        entry = self.orch.heartbeat("claude_code")
+        with unittest.mock.patch.object(self.orch, "_age_seconds", side_effect=AssertionError("parsed")):
+            self.assertEqual(self.orch._last_seen_age_seconds(entry), 0)
+
+    def test_heartbeat_in_batch_stamps_batch_clock(self) -> None:
+        with self.orch.batch():
+            now = self.orch._now()
+            entry = self.orch.heartbeat("claude_code")
+        self.assertEqual(entry["last_seen"], now)
+        self.assertEqual(self.orch._last_seen_age_seconds(entry, now=datetime.fromisoformat(now)), 0)
+
+    def test_externally_rewritten_last_seen_falls_back_to_parse(self) -> None:
+        self.orch.heartbeat("claude_code")
+        _make_stale(self.orch, "claude_code")
+        entry = self.orch._read_json(self.orch.agents_path)["claude_code"]
+        self.assertGreater(self.orch._last_seen_age_seconds(entry), 3600)
+
+    def test_external_last_seen_parsed_once(self) -> None:
+        self.orch.heartbeat("claude_code")
+        _make_stale(self.orch, "claude_code")
+        entry = self.orch._read_json(self.orch.agents_path)["claude_code"]
+        first = self.orch._last_seen_age_seconds(entry)
+        with unittest.mock.patch("orchestrator.engine.datetime") as frozen:
+            frozen.now.return_value = datetime.now(timezone.utc)
+            frozen.fromisoformat.side_effect = AssertionError("parsed again")
+            self.assertGreaterEqual(self.orch._last_seen_age_seconds(entry), first)
+            self.orch.list_agents()
+
+    def test_naive_last_seen_has_no_age(self) -> None:
+        entry = {"agent": "claude_code", "last_seen": "2020-01-01T00:00:00"}
+        self.assertIsNone(self.orch._last_seen_age_seconds(entry))
+
+    def test_missing_last_seen_has_no_age(self) -> None:
+        self.assertIsNone(self.orch._last_seen_age_seconds({"agent": "claude_code"}))
+
+
+class PresenceLogTests(_OrchestratorTestCase):
+    """Presence refreshes append to agents.presence.jsonl instead of rewriting agents.json."""
+
+    def test_refresh_appends_without_rewriting_agents_json(self) -> None:
+        _register(self.orch, "claude_code")
+        before = self.orch.agents_path.read_bytes()
+        self.orch._refresh_agent_presence("claude_code")
+        self.orch._refresh_agent_presence("claude_code")
+        self.assertEqual(self.orch.agents_path.read_bytes(), before)
+        lines = self.orch.agent_presence_log_path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 2)
+        logged = json.loads(lines[-1])["last_seen"]
+        self.assertEqual(self.orch._read_agents()["claude_code"]["last_seen"], logged)
+
+    def test_full_agents_write_supersedes_log(self) -> None:
+        _register(self.orch, "claude_code")
+        self.orch._refresh_agent_presence("claude_code")
+        _make_stale(self.orch, "claude_code")
+        self.assertFalse(self.orch.agent_presence_log_path.exists())
+        self.assertEqual(self.orch._read_agents()["claude_code"]["last_seen"], "2020-01-01T00:00:00+00:00")
+
+    def test_old_snapshot_triggers_compaction(self) -> None:
+        _register(self.orch, "claude_code")
+        old = self.orch.agents_path.stat().st_mtime - 3600
+        os.utime(self.orch.agents_path, (old, old))
+        self.orch._refresh_agent_presence("claude_code")
+        self.assertFalse(self.orch.agent_presence_log_path.exists())
+        on_disk = json.loads(self.orch.agents_path.read_text(encoding="utf-8"))
+        self.assertEqual(on_disk["claude_code"], self.orch._read_agents()["claude_code"])
+
+    def test_log_reads_only_appended_tail(self) -> None:
+        log = self.orch.agent_presence_log_path
+        log.write_text(json.dumps({"agent": "a", "last_seen": "1"}) + "\n", encoding="utf-8")
+        self.assertEqual(self.orch._read_state_log(log, "last_seen"), {"a": "1"})
+        with log.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps({"agent": "b", "last_seen": "2"}) + "\n" + '{"agent": "a", "last')
+        with unittest.mock.patch("orchestrator.engine.json.loads", wraps=json.loads) as loads:
+            self.assertEqual(self.orch._read_state_log(log, "last_seen"), {"a": "1", "b": "2"})
+        self.assertEqual(loads.call_count, 1)
+        with log.open("a", encoding="utf-8") as fh:
+            fh.write('_seen": "3"}\n')
+        self.assertEqual(self.orch._read_state_log(log, "last_seen"), {"a": "3", "b": "2"})
+
+    def test_recreated_log_is_read_from_start(self) -> None:
+        log = self.orch.agent_presence_log_path
+        log.write_text(json.dumps({"agent": "a", "last_seen": "1"}) + "\n", encoding="utf-8")
+        self.orch._read_state_log(log, "last_seen")
+        log.write_text(
+            json.dumps({"agent": "b", "last_seen": "2"}) + "\n" + json.dumps({"agent": "c", "last_seen": "3"}) + "\n",
+            encoding="utf-8",
+        )
+        self.assertEqual(self.orch._read_state_log(log, "last_seen"), {"b": "2", "c": "3"})
+
+    def test_unknown_agent_refresh_writes_snapshot(self) -> None:
+        self.orch._refresh_agent_presence("gemini")
+        self.assertFalse(self.orch.agent_presence_log_path.exists())
+        self.assertIn("gemini", json.loads(self.orch.agents_path.read_text(encoding="utf-8")))
+
+
+class StaleNoticeCooldownTests(_OrchestratorTestCase):
+    """agent.stale_reconnect_required cooldown bookkeeping in stale_notices.json."""
+
+    def _stale_events(self) -> list:
+        return [e for e in self.orch.bus.iter_events() if e.get("type") == "agent.stale_reconnect_required"]
+
+    def test_notice_recorded_as_epoch_seconds_and_throttled(self) -> None:
+        _register(self.orch, "claude_code")
+        _make_stale(self.orch, "claude_code")
+        self.orch.list_agents(emit_stale_notices=True)
+        self.orch.list_agents(emit_stale_notices=True)
+        self.assertEqual(len(self._stale_events()), 1)
+        notices = self.orch._read_json(self.orch.stale_notices_path)
+        self.assertIsInstance(notices["claude_code"], int)
+
+    def test_legacy_iso_notice_still_throttles(self) -> None:
+        _register(self.orch, "claude_code")
+        _make_stale(self.orch, "claude_code")
+        self.orch._write_json(self.orch.stale_notices_path, {"claude_code": self.orch._now()})
+        self.orch.list_agents(emit_stale_notices=True)
+        self.assertEqual(self._stale_events(), [])
+
+    def test_expired_cooldown_emits_again(self) -> None:
+        _register(self.orch, "claude_code")
+        _make_stale(self.orch, "claude_code")
+        self.orch._write_json(self.orch.stale_notices_path, {"claude_code": 0})
+        self.orch.list_agents(emit_stale_notices=True)
+        self.assertEqual(len(self._stale_events()), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
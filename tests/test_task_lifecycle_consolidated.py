@@ -10,6 +10,7 @@ import json
 import os
 import tempfile
 import unittest
+import unittest.mock
 import uuid
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -560,6 +561,61 @@ class TestTaskCountGuard(unittest.TestCase, _OrchestratorMixin):
         self.assertEqual(1, len(self.orch.list_tasks()))
 
 
+# ── batched writes ─────────────────────────────────────────────────────
+
+class TestBatch(unittest.TestCase, _OrchestratorMixin):
+    def setUp(self) -> None:
+        self._init_orch()
+
+    def tearDown(self) -> None:
+        self._cleanup()
+
+    def _count_task_writes(self):
+        writes = []
+        original = Orchestrator._stage_json
+
+        def tracking(orch, path, value):
+            if path.name == "tasks.json":
+                writes.append(len(value))
+            return original(orch, path, value)
+
+        return writes, unittest.mock.patch.object(Orchestrator, "_stage_json", tracking)
+
+    def test_write_tasks_batch_rewrites_tasks_once(self) -> None:
+        writes, patcher = self._count_task_writes()
+        with patcher:
+            created = self.orch.write_tasks_batch([
+                {"title": f"bulk {i}", "workstream": "backend", "acceptance_criteria": ["a"]}
+                for i in range(5)
+            ])
+        self.assertEqual(writes, [5])
+        self.assertEqual([t["id"] for t in self.orch.list_tasks()], [t["id"] for t in created])
+
+    def test_batch_shares_one_timestamp(self) -> None:
+        created = self.orch.write_tasks_batch([
+            {"title": f"stamp {i}", "workstream": "backend", "acceptance_criteria": ["a"]}
+            for i in range(3)
+        ])
+        self.assertEqual(len({t["created_at"] for t in created}), 1)
+        self.assertIsNone(self.orch._batch_now)
+
+    def test_reads_inside_batch_see_pending_writes(self) -> None:
+        with self.orch.batch():
+            task = self.orch.create_task("pending", "backend", ["a"])
+            self.orch.set_task_status(task["id"], "in_progress", source="claude_code")
+            self.assertEqual(_get(self.orch, task["id"])["status"], "in_progress")
+            on_disk = json.loads(self.orch.tasks_path.read_text(encoding="utf-8"))
+            self.assertEqual(on_disk, [])
+        self.assertEqual(_get(self.orch, task["id"])["status"], "in_progress")
+
+    def test_pending_writes_flushed_when_block_raises(self) -> None:
+        with self.assertRaises(RuntimeError):
+            with self.orch.batch():
+                self.orch.create_task("kept", "backend", ["a"])
+                raise RuntimeError("boom")
+        self.assertEqual([t["title"] for t in self.orch.list_tasks()], ["kept"])
+
+
 # ── multi-project tags ─────────────────────────────────────────────────
 
 class TestMultiProjectTags(unittest.TestCase):